@@ -0,0 +1 @@
+# MacTools Benchmarks
@@ -0,0 +1,108 @@
+# MacTools Benchmark Runner
+#
+# Usage: python -m benchmarks [case prefixes] [--output results.json]
+#            [--baseline benchmarks/baselines.json] [--threshold 0.25]
+#            [--update-baseline]
+
+# Python Modules
+from argparse import ArgumentParser, Namespace
+from json import dump, load
+from os import path
+from platform import platform, python_implementation, python_version
+from sys import exit
+
+# Local Modules
+from benchmarks.suite import run_suite
+
+DEFAULT_BASELINE = path.join(path.dirname(__file__), "baselines.json")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Runs the benchmark suite offline against a synthetic registry",
+    )
+    parser.add_argument(
+        "cases", nargs="*", help="only run cases starting with these names"
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument(
+        "-b", "--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare"
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown over the baseline as a fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "-u",
+        "--update-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """
+    Prints each result against its baseline and returns the regressed cases
+    """
+    regressions = []
+    print(f"{'case':<32} {'ns/op':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        current = result["ns_per_op"]
+        previous = baseline.get(name, {}).get("ns_per_op")
+        if previous is None:
+            print(f"{name:<32} {current:>12,.1f} {'-':>12} {'new':>8}")
+            continue
+        change = current / previous - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(f"{name:<32} {current:>12,.1f} {previous:>12,.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+    report = {
+        "python": f"{python_implementation()} {python_version()}",
+        "platform": platform(),
+        "results": run_suite(args.cases or None, args.repeat),
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            dump(report, file, indent=2)
+
+    baseline: dict[str, dict[str, float]] = {}
+    if path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = load(file)["results"]
+    regressions = compare(report["results"], baseline, args.threshold)
+
+    if args.update_baseline:
+        # Cases that were not run keep their previous baseline
+        report["results"] = baseline | report["results"]
+        with open(args.baseline, "w") as file:
+            dump(report, file, indent=2)
+            file.write("\n")
+        return 0
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than the baseline by over "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,88 @@
+# Common Benchmark Library
+
+# Python Modules
+from csv import writer
+from os import path
+from random import Random
+from time import perf_counter
+
+# Local Modules
+from mactools.oui_cache.oui_common import OUI_KEY_LENGTHS, OUIType
+
+# Roughly the size of the live IEEE registries
+TIER_SIZES = {OUIType.OUI36: 6000, OUIType.OUI28: 6000, OUIType.OUI: 38000}
+
+
+def create_synthetic_oui_dict(
+    seed: int = 0,
+) -> dict[OUIType, dict[str, dict[str, str]]]:
+    """
+    Returns an OUI dictionary shaped like the IEEE registries without network access
+    """
+    rng = Random(seed)  # nosec B311
+    oui_dict = {}
+    for oui_type, size in TIER_SIZES.items():
+        key_len = OUI_KEY_LENGTHS[oui_type]
+        entries = {}
+        while len(entries) < size:
+            # Keep the U/L bit clear so the keys reach the registry tiers
+            oui = f"{rng.getrandbits(key_len * 4) & ~(0x2 << (key_len * 4 - 8)):0{key_len}X}"
+            entries[oui] = {
+                "vendor": f"Vendor {len(entries)} {oui_type.value}",
+                "oui": oui,
+                "address": f"{len(entries)} Synthetic Road",
+            }
+        oui_dict[oui_type] = entries
+    return oui_dict
+
+
+def write_synthetic_ieee_files(
+    directory: str, oui_dict: dict[OUIType, dict[str, dict[str, str]]]
+) -> list[str]:
+    """
+    Writes `oui_dict` as the three IEEE CSV files in `directory` and returns their
+    paths, in the order `create_oui_dict` reads them
+    """
+    file_paths = []
+    for oui_type, name in [
+        (OUIType.OUI36, "oui36"),
+        (OUIType.OUI28, "mam"),
+        (OUIType.OUI, "oui"),
+    ]:
+        file_path = path.join(directory, f"{name}.csv")
+        with open(file_path, "w", encoding="utf-8", newline="") as file:
+            csv_writer = writer(file)
+            csv_writer.writerow(
+                ["Registry", "Assignment", "Organization Name", "Organization Address"]
+            )
+            for oui, record in oui_dict[oui_type].items():
+                csv_writer.writerow(
+                    [oui_type.value, oui, record["vendor"], record["address"]]
+                )
+        file_paths.append(file_path)
+    return file_paths
+
+
+def sample_macs(
+    oui_dict: dict[OUIType, dict[str, dict[str, str]]], count: int, seed: int = 0
+) -> list[str]:
+    """
+    Returns clean MAC strings whose prefixes are registered in `oui_dict`
+    """
+    rng = Random(seed)  # nosec B311
+    prefixes = [oui for tier in oui_dict.values() for oui in tier]
+    macs = []
+    for _ in range(count):
+        prefix = rng.choice(prefixes)  # nosec B311
+        suffix_len = 12 - len(prefix)
+        macs.append(f"{prefix}{rng.getrandbits(suffix_len * 4):0{suffix_len}X}")
+    return macs
+
+
+def time_call(func, *args, **kwargs) -> float:
+    """
+    Returns the wall time in seconds of a single call
+    """
+    start = perf_counter()
+    func(*args, **kwargs)
+    return perf_counter() - start
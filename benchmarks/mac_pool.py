@@ -0,0 +1,44 @@
+# MacTools MAC Pool Benchmark
+#
+# Usage: python -m benchmarks.mac_pool [count]
+
+# Python Modules
+from os import path
+from sys import argv
+from tempfile import TemporaryDirectory
+
+# Local Modules
+from benchmarks.bench_common import time_call
+from mactools.mac_pool import MacPool
+
+
+def allocate_each(pool: MacPool, count: int) -> None:
+    allocate = pool.allocate
+    for _ in range(count):
+        allocate()
+
+
+def main(count: int = 1_000_000) -> None:
+    # A whole OUI, fragmented by every seventh address being reserved
+    pool = MacPool.from_prefix("24:6D:5E")
+    reserve = pool.reserve
+    elapsed = time_call(lambda: [reserve(pool.first + i) for i in range(0, count, 7)])
+    print(f"{'reserve':>16}: {elapsed:8.2f} s")
+
+    elapsed = time_call(allocate_each, pool, count)
+    print(f"{'allocate':>16}: {elapsed:8.2f} s")
+    elapsed = time_call(pool.allocate_many, count)
+    print(f"{'allocate_many':>16}: {elapsed:8.2f} s")
+    elapsed = time_call(pool.allocate_block, count)
+    print(f"{'allocate_block':>16}: {elapsed:8.2f} s")
+
+    with TemporaryDirectory() as temp_dir:
+        file_path = path.join(temp_dir, "pool.bin")
+        elapsed = time_call(pool.save, file_path)
+        print(f"{'save':>16}: {elapsed:8.2f} s")
+        elapsed = time_call(MacPool.load, file_path)
+        print(f"{'load':>16}: {elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 1_000_000)
@@ -0,0 +1,133 @@
+# MacTools Memory Benchmark
+#
+# Usage: python -m benchmarks.memory [--live] [--output report.json]
+#            [--baseline benchmarks/memory_baselines.json] [--threshold 0.1]
+#            [--update-baseline]
+
+# Python Modules
+from argparse import ArgumentParser, Namespace
+from json import dump, load
+from os import path
+from platform import python_implementation, python_version
+from sys import exit
+
+# Local Modules
+from benchmarks.bench_common import create_synthetic_oui_dict
+from mactools.memory import memory_report
+from mactools.oui_cache.oui_classes import OUICache
+
+DEFAULT_BASELINE = path.join(path.dirname(__file__), "memory_baselines.json")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Reports the memory of the OUI registry and of MAC objects",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="measure the installed IEEE registry instead of the synthetic one",
+    )
+    parser.add_argument("-o", "--output", help="write the report as JSON")
+    parser.add_argument(
+        "-b", "--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare"
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed growth over the baseline as a fraction (default: 0.1)",
+    )
+    parser.add_argument(
+        "-u",
+        "--update-baseline",
+        action="store_true",
+        help="store this report as the new baseline",
+    )
+    return parser.parse_args()
+
+
+def flatten(report: dict, prefix: str = "") -> dict[str, int]:
+    """
+    Returns the byte counts of a report keyed by their dotted path
+    """
+    values = {}
+    for key, value in report.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            values |= flatten(value, f"{name}.")
+        elif isinstance(value, int) and not key.endswith("entries"):
+            values[name] = value
+    return values
+
+
+def compare(
+    results: dict[str, int], baseline: dict[str, int], threshold: float
+) -> list[str]:
+    """
+    Prints each size against its baseline and returns the grown ones
+    """
+    regressions = []
+    print(f"{'measure':<40} {'bytes':>12} {'baseline':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"{name:<40} {current:>12,} {'-':>12} {'new':>8}")
+            continue
+        change = current / previous - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(f"{name:<40} {current:>12,} {previous:>12,} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+    if args.live:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+    else:
+        cache = OUICache(create_synthetic_oui_dict(), attempt_update=False)
+        # The cache is a singleton, an already loaded instance is replaced
+        cache.swap_oui_dict(create_synthetic_oui_dict())
+
+    report = {
+        "python": f"{python_implementation()} {python_version()}",
+        "results": flatten(memory_report(cache)),
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            dump(report, file, indent=2)
+
+    # Sizes of the installed registry change with each IEEE release
+    if args.live:
+        compare(report["results"], {}, args.threshold)
+        return 0
+
+    baseline: dict[str, int] = {}
+    if path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = load(file)["results"]
+    regressions = compare(report["results"], baseline, args.threshold)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            dump(report, file, indent=2)
+            file.write("\n")
+        return 0
+    if regressions:
+        print(
+            f"{len(regressions)} measure(s) larger than the baseline by over "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
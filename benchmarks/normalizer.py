@@ -0,0 +1,57 @@
+# MacTools Normalizer Throughput Benchmark
+#
+# Usage: python -m benchmarks.normalizer [size_mb]
+
+# Python Modules
+from io import BytesIO
+from os import path
+from sys import argv
+from tempfile import TemporaryDirectory
+
+# Local Modules
+from benchmarks.bench_common import time_call
+from benchmarks.scanner import create_log
+from mactools import MacAddress, MacNotation
+from mactools.mac_normalizer import normalize_stream, normalize_text
+from mactools.tools_common import MAC_REGEX
+
+
+def normalize_with_objects(text: str) -> str:
+    """
+    The per-match `MacAddress` approach the normalizer replaces
+    """
+    return MAC_REGEX.sub(
+        lambda found: MacAddress.format_mac_address(found.group(), MacNotation.PERIOD),
+        text,
+    )
+
+
+def main(size_mb: int = 16) -> None:
+    with TemporaryDirectory() as temp_dir:
+        file_path = path.join(temp_dir, "bench.log")
+        create_log(file_path, size_mb << 20)
+        with open(file_path, "rb") as file:
+            data = file.read()
+    text = data.decode()
+    size = len(data) / (1 << 20)
+    print(f"Corpus: {size:.1f} MB")
+
+    runs = [
+        ("MacAddress sub", normalize_with_objects, text),
+        ("normalize str", normalize_text, text, MacNotation.PERIOD),
+        ("normalize bytes", normalize_text, data, MacNotation.PERIOD),
+        (
+            "stream 1 MiB",
+            normalize_stream,
+            BytesIO(data),
+            BytesIO(),
+            MacNotation.PERIOD,
+        ),
+    ]
+    for label, func, *args in runs:
+        elapsed = time_call(func, *args)
+        print(f"{label:>16}: {size / elapsed:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 16)
@@ -0,0 +1,31 @@
+# MacTools Random MAC Generation Benchmark
+#
+# Usage: python -m benchmarks.random_macs [count]
+
+# Python Modules
+from sys import argv
+
+# Local Modules
+from benchmarks.bench_common import time_call
+from mactools import MacNotation, create_random_mac, create_random_macs
+
+
+def main(count: int = 1_000_000) -> None:
+    # The per-nibble generator is timed on a sample and scaled
+    sample = min(count, 100_000)
+    elapsed = time_call(lambda: [create_random_mac() for _ in range(sample)])
+    print(f"{'create_random_mac':>24}: {elapsed * count / sample:8.2f} s (scaled)")
+
+    runs = [
+        ("integers", {}),
+        ("strings", {"notation": MacNotation.COLON}),
+        ("unique", {"unique": True}),
+        ("unique in an OUI", {"unique": True, "prefix": "24:6D:5E"}),
+    ]
+    for label, kwargs in runs:
+        elapsed = time_call(create_random_macs, count, seed=0, **kwargs)
+        print(f"{label:>24}: {elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 1_000_000)
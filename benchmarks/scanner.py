@@ -0,0 +1,92 @@
+# MacTools Scanner Throughput Benchmark
+#
+# Usage: python -m benchmarks.scanner [size_mb]
+
+# Python Modules
+from os import path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from uuid import UUID
+
+# Local Modules
+from benchmarks.bench_common import time_call
+from mactools.mac_scanner import scan_file
+from mactools.tools_common import SCAN_BYTES_REGEX, STRICT_SCAN_BYTES_REGEX
+
+LOG_TEMPLATES = [
+    "{ts} dhcpd[812]: DHCPACK on 10.{a}.{b}.{c} to {colon} via eth0\n",
+    "{ts} switch: %SW_MATRIX-4-MACFLAP_NOTIF: Host {period} in vlan {a} is flapping\n",
+    "{ts} kernel: [UFW BLOCK] IN=eth0 OUT= MAC={colon}:{colon}:08:00 SRC=10.0.0.{c}\n",
+    "{ts} sshd[{b}{c}]: Accepted publickey for ops from 10.0.{a}.{b} port 22 ssh2\n",
+    "{ts} app: request id={hash} user={a} status=200 bytes={b}{c}\n",
+]
+
+# Hex-heavy lines that look like addresses to a loose pattern
+NOISY_TEMPLATES = [
+    "{ts} app: sha256={hash}{hash} commit {hash}\n",
+    "{ts} api: trace={uuid} span={uuid}\n",
+    "{ts} ndp: neighbor 2001:db8:{a:x}:{b:x}:{c:x}:{a:x}{b:x}::{c:x} at 12:{a}:{b}.{c}\n",
+    "{ts} fw: mixed {mixed} stamp {period}.{a:02x}\n",
+    "{ts} dhcpd[812]: DHCPACK on 10.{a}.{b}.{c} to {colon} via eth0\n",
+]
+
+
+def create_log(
+    file_path: str, size: int, seed: int = 0, templates: list[str] = LOG_TEMPLATES
+) -> None:
+    """
+    Writes a syslog-like file of roughly `size` bytes
+    """
+    rng = Random(seed)  # nosec B311
+    written = 0
+    with open(file_path, "w") as file:
+        while written < size:
+            mac = rng.getrandbits(48)
+            line = rng.choice(templates).format(  # nosec B311
+                ts=f"Jan  1 00:{rng.randrange(60):02}:{rng.randrange(60):02} host",  # nosec B311
+                a=rng.randrange(256),  # nosec B311
+                b=rng.randrange(256),  # nosec B311
+                c=rng.randrange(256),  # nosec B311
+                colon=mac.to_bytes(6, "big").hex(":"),
+                period=mac.to_bytes(6, "big").hex(".", 2),
+                hash=f"{rng.getrandbits(160):040x}",
+                uuid=str(UUID(int=rng.getrandbits(128))),
+                mixed=mac.to_bytes(6, "big").hex(":").replace(":", "-", 2),
+            )
+            written += file.write(line)
+
+
+def consume(file_path: str, chunk_size: int | None, regex=SCAN_BYTES_REGEX) -> int:
+    count = 0
+    for _ in scan_file(file_path, chunk_size, regex):
+        count += 1
+    return count
+
+
+def main(size_mb: int = 64) -> None:
+    with TemporaryDirectory() as temp_dir:
+        for corpus, templates in [
+            ("syslog", LOG_TEMPLATES),
+            ("noisy", NOISY_TEMPLATES),
+        ]:
+            file_path = path.join(temp_dir, f"{corpus}.log")
+            create_log(file_path, size_mb << 20, templates=templates)
+            size = path.getsize(file_path) / (1 << 20)
+            print(f"Corpus {corpus}: {size:.1f} MB")
+
+            for label, regex in [
+                ("loose", SCAN_BYTES_REGEX),
+                ("strict", STRICT_SCAN_BYTES_REGEX),
+            ]:
+                matches = consume(file_path, None, regex)
+                for mode, chunk_size in [("mmap", None), ("chunked 1 MiB", 1 << 20)]:
+                    elapsed = time_call(consume, file_path, chunk_size, regex)
+                    print(
+                        f"{label:>7} {mode:>14}: {size / elapsed:8.1f} MB/s"
+                        f"  {matches:,} MACs"
+                    )
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 64)
@@ -0,0 +1,139 @@
+# MacTools Benchmark Suite
+#
+# Cases are run by `python -m benchmarks`, see `benchmarks/__main__.py`
+
+# Python Modules
+from collections.abc import Callable, Iterator
+from importlib.util import find_spec
+from random import Random
+from tempfile import TemporaryDirectory
+from timeit import Timer
+
+# Local Modules
+from benchmarks.bench_common import (
+    create_synthetic_oui_dict,
+    sample_macs,
+    write_synthetic_ieee_files,
+)
+from mactools.basemac import BaseMac, MacNotation
+from mactools.mac_common import hex_range
+from mactools.macaddress import MacAddress
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_common import OUIType, create_oui_dict
+from mactools.tools_common import get_hex_value
+
+# Inputs per timed call, results are reported per input
+BATCH_SIZE = 1000
+
+# A case returns the function to time and the operations each call performs
+Case = Callable[[], tuple[Callable[[], object], int]]
+
+
+def create_cases(
+    oui_dict: dict[OUIType, dict[str, dict[str, str]]], temp_dir: str
+) -> Iterator[tuple[str, Case]]:
+    """
+    Yields each named case, all built on the synthetic registry
+    """
+    cache = OUICache(oui_dict, attempt_update=False)
+    rng = Random(0)  # nosec B311
+    macs = sample_macs(oui_dict, BATCH_SIZE)
+
+    # MACs under 24-bit OUIs, as construction only looks up the first 24 bits
+    oui_macs = sample_macs({OUIType.OUI: oui_dict[OUIType.OUI]}, BATCH_SIZE)
+    for notation in MacNotation:
+        formatted = [BaseMac.format_mac_address(i, notation) for i in oui_macs]
+
+        def construct(formatted: list[str] = formatted) -> tuple[Callable, int]:
+            return lambda: [MacAddress(i, cache=cache) for i in formatted], BATCH_SIZE
+
+        def reformat(formatted: list[str] = formatted) -> tuple[Callable, int]:
+            format_mac_address = BaseMac.format_mac_address
+            return lambda: [format_mac_address(i) for i in formatted], BATCH_SIZE
+
+        yield f"mac_address.{notation.name.lower()}", construct
+        yield f"format_mac_address.{notation.name.lower()}", reformat
+
+    def hex_value() -> tuple[Callable, int]:
+        return lambda: [get_hex_value(i) for i in macs], BATCH_SIZE
+
+    yield "get_hex_value", hex_value
+
+    # Hits on each tier, then misses that stay local
+    for oui_type, tier in oui_dict.items():
+        prefixes = rng.sample(sorted(tier), BATCH_SIZE)
+        tier_macs = [f"{i}{'0' * (12 - len(i))}" for i in prefixes]
+
+        def hit(tier_macs: list[str] = tier_macs) -> tuple[Callable, int]:
+            return lambda: [cache.get_record(i, False) for i in tier_macs], BATCH_SIZE
+
+        yield f"get_record.hit.{oui_type.name.lower()}", hit
+
+    registered = {i[:6] for tier in oui_dict.values() for i in tier}
+    missing = []
+    while len(missing) < BATCH_SIZE:
+        oui = f"{rng.getrandbits(24) & 0xFCFFFF:06X}"
+        if oui not in registered:
+            missing.append(f"{oui}{rng.getrandbits(24):06X}")
+
+    def miss() -> tuple[Callable, int]:
+        return lambda: [cache.get_record(i, False) for i in missing], BATCH_SIZE
+
+    yield "get_record.miss", miss
+
+    # The vectorized kernel needs the optional numpy
+    if find_spec("numpy") is not None:
+        import numpy as np
+
+        from mactools.oui_cache.oui_vector import get_vector_table
+
+        values = np.array([int(i, 16) for i in macs + missing], np.uint64)
+
+        def vector_lookup() -> tuple[Callable, int]:
+            table = get_vector_table(cache)
+            return lambda: table.vendor_ids(values), len(values)
+
+        yield "vector_lookup", vector_lookup
+
+    file_paths = write_synthetic_ieee_files(temp_dir, oui_dict)
+
+    def cold_start() -> tuple[Callable, int]:
+        return lambda: OUICache(create_oui_dict(file_paths=file_paths), False), 1
+
+    yield "create_oui_dict.cold", cold_start
+
+    def iterate_hex_range() -> tuple[Callable, int]:
+        return lambda: sum(1 for _ in hex_range(4, "246D5EBB")), 16**4
+
+    yield "hex_range", iterate_hex_range
+
+
+def run_case(case: Case, repeat: int = 5) -> dict[str, float]:
+    """
+    Returns the best time per operation in nanoseconds over `repeat` runs, each
+    calling the case enough times to last at least 0.2 seconds
+    """
+    func, operations = case()
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+    return {
+        "ns_per_op": best / operations * 1e9,
+        "ops_per_call": operations,
+        "calls": number,
+    }
+
+
+def run_suite(
+    selected: list[str] | None = None, repeat: int = 5
+) -> dict[str, dict[str, float]]:
+    """
+    Runs the cases whose names start with any of `selected` (default: all)
+    """
+    results = {}
+    with TemporaryDirectory() as temp_dir:
+        for name, case in create_cases(create_synthetic_oui_dict(), temp_dir):
+            if selected and not any(name.startswith(i) for i in selected):
+                continue
+            results[name] = run_case(case, repeat)
+    return results
@@ -0,0 +1,35 @@
+# MacTools Table Parser Benchmark
+#
+# Usage: python -m benchmarks.table_parser [count]
+
+# Python Modules
+from sys import argv
+
+# Local Modules
+from benchmarks.bench_common import time_call
+from mactools.table_parser import parse_table
+
+
+def create_mac_table(count: int) -> str:
+    """
+    Returns a Cisco IOS style MAC address table of `count` rows
+    """
+    return "".join(
+        f"  {i % 4094 + 1:<6}{(i * 7919).to_bytes(6, 'big').hex('.', 2)}"
+        f"    DYNAMIC     Gi1/0/{i % 48 + 1}\n"
+        for i in range(count)
+    )
+
+
+def main(count: int = 100_000) -> None:
+    text = create_mac_table(count)
+    data = text.encode()
+    print(f"Rows: {count:,}")
+
+    for label, table in [("parse str", text), ("parse bytes", data)]:
+        elapsed = time_call(parse_table, table)
+        print(f"{label:>16}: {count / elapsed:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 100_000)
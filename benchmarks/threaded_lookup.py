@@ -0,0 +1,61 @@
+# MacTools Threaded Look-up Benchmark
+#
+# Usage: python -m benchmarks.threaded_lookup [max_threads]
+
+# Python Modules
+from sys import argv
+from sysconfig import get_config_var
+from threading import Barrier, Thread
+
+# Local Modules
+from benchmarks.bench_common import create_synthetic_oui_dict, sample_macs, time_call
+from mactools.oui_cache.oui_classes import OUICache
+
+LOOKUPS_PER_THREAD = 50000
+
+
+def run_threads(cache: OUICache, macs: list[str], thread_count: int) -> float:
+    """
+    Returns the seconds taken for `thread_count` threads to each resolve `macs`
+    """
+    barrier = Barrier(thread_count + 1)
+
+    def worker():
+        get_record = cache.get_record
+        barrier.wait()
+        for mac in macs:
+            get_record(mac)
+
+    threads = [Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    def release_and_join():
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+
+    return time_call(release_and_join)
+
+
+def main(max_threads: int = 8) -> None:
+    oui_dict = create_synthetic_oui_dict()
+    cache = OUICache(oui_dict, attempt_update=False)
+    macs = sample_macs(oui_dict, LOOKUPS_PER_THREAD)
+
+    free_threaded = bool(get_config_var("Py_GIL_DISABLED"))
+    print(f"Free-threaded build: {free_threaded}")
+    print(f"{'threads':>8} {'lookups/s':>14} {'scaling':>8}")
+
+    single = 0.0
+    thread_count = 1
+    while thread_count <= max_threads:
+        elapsed = run_threads(cache, macs, thread_count)
+        throughput = thread_count * len(macs) / elapsed
+        single = single or throughput
+        print(f"{thread_count:>8} {throughput:>14,.0f} {throughput / single:>7.2f}x")
+        thread_count *= 2
+
+
+if __name__ == "__main__":
+    main(int(argv[1]) if len(argv) > 1 else 8)
@@ -4,11 +4,36 @@ from mactools.mac_common import (
     create_random_hex_bit as create_random_hex_bit,
     create_random_hex_string as create_random_hex_string,
     create_random_mac as create_random_mac,
+    create_random_macs as create_random_macs,
     fill_hex as fill_hex,
+    format_hex_mac as format_hex_mac,
+    format_mac_values as format_mac_values,
     hex_range as hex_range,
     prepare_oui as prepare_oui,
+    unpack_macs as unpack_macs,
+)
+from mactools.mac_normalizer import (
+    normalize_file as normalize_file,
+    normalize_stream as normalize_stream,
+    normalize_text as normalize_text,
+)
+from mactools.mac_pipeline import (
+    MacReport as MacReport,
+    aggregate_files as aggregate_files,
+)
+from mactools.mac_pool import MacPool as MacPool
+from mactools.mac_scanner import (
+    MacMatch as MacMatch,
+    scan_bytes as scan_bytes,
+    scan_file as scan_file,
+    scan_stream as scan_stream,
 )
 from mactools.macaddress import MacAddress as MacAddress, MacNotation as MacNotation
+from mactools.memory import (
+    cache_footprint as cache_footprint,
+    mac_footprint as mac_footprint,
+    memory_report as memory_report,
+)
 from mactools.oui_cache.oui_classes import OUICache as OUICache
 from mactools.oui_cache.oui_common import UPDATE_IEEE as UPDATE_IEEE
 from mactools.oui_cache.oui_core import (
@@ -16,6 +41,42 @@ from mactools.oui_cache.oui_core import (
     get_oui_record as get_oui_record,
     get_oui_vendor as get_oui_vendor,
 )
+from mactools.oui_cache.oui_history import OUIHistory as OUIHistory
+from mactools.oui_cache.oui_overlay import OUIOverlay as OUIOverlay
+from mactools.oui_cache.oui_shared import (
+    SharedOUIRegistry as SharedOUIRegistry,
+    attach_oui_cache as attach_oui_cache,
+    share_oui_cache as share_oui_cache,
+)
+from mactools.oui_cache.oui_vendors import (
+    load_vendor_aliases as load_vendor_aliases,
+    vendor_id as vendor_id,
+)
+from mactools.oui_server import OUIClient as OUIClient, OUIServer as OUIServer
+from mactools.pcap import (
+    EthernetFrames as EthernetFrames,
+    TrafficReport as TrafficReport,
+    count_traffic as count_traffic,
+    read_frames as read_frames,
+    summarize_capture as summarize_capture,
+)
+from mactools.slaac import (
+    address_records as address_records,
+    global_addresses as global_addresses,
+    interface_ids as interface_ids,
+    link_local_addresses as link_local_addresses,
+    macs_from_addresses as macs_from_addresses,
+)
+from mactools.table_parser import (
+    MacTable as MacTable,
+    detect_layout as detect_layout,
+    parse_table as parse_table,
+)
+from mactools.tracing import (
+    TraceEvent as TraceEvent,
+    add_trace_hook as add_trace_hook,
+    remove_trace_hook as remove_trace_hook,
+)
 from mactools.update_ieee import update_ieee_files as update_ieee_files
 from mactools.version import __version__ as __version__
 
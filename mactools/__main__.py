@@ -0,0 +1,6 @@
+# MacTools Module Entry Point
+
+# Local Modules
+from mactools.cli import main
+
+raise SystemExit(main())
@@ -3,13 +3,15 @@
 # Python Modules
 from __future__ import annotations
 
+from collections.abc import Buffer, Iterator
 from enum import Enum
 from functools import cached_property
-from ipaddress import AddressValueError
 from ipaddress import IPv6Address as IPv6
-from typing import TYPE_CHECKING, LiteralString, override
+from ipaddress import IPv6Network
+from typing import TYPE_CHECKING, LiteralString, Self, override
 
 # Local Modules
+from mactools.slaac import interface_id, mac_from_address, prefix_value
 from mactools.tools_common import get_hex_value
 
 if TYPE_CHECKING:
@@ -31,7 +33,7 @@ class BaseMac:
 
     def __init__(
         self,
-        mac: str | int,
+        mac: str | int | Buffer,
         format: MacNotation = MacNotation.COLON,
         oui_cache: "OUICache | None" = None,
     ) -> None:
@@ -42,10 +44,13 @@ class BaseMac:
 
         if isinstance(mac, int):
             mac = self.number_to_hex_mac(mac)
+        elif isinstance(mac, Buffer):
+            mac = memoryview(mac).hex().upper()
 
         self.__mac: str = mac
         self.__eui: int = eui
         self.__oui_record: dict[str, str] | None = None
+        self.__oui_cache: OUICache | None = oui_cache
         self.format: MacNotation = format
 
         if oui_cache:
@@ -76,26 +81,110 @@ class BaseMac:
             return False
         return self.clean == other.clean
 
-    def __add__(self, value: int) -> str:
+    def __bytes__(self) -> bytes:
+        return self.to_bytes()
+
+    def __add__(self, value: int) -> Self:
         """
         Returns the shifted MAC when adding a number
         """
-        return self.number_to_hex_mac(self.decimal + value, self.format, self.__eui)
+        if not isinstance(value, int):
+            return NotImplemented
+        return self._from_int(self.decimal + value)
+
+    __radd__ = __add__
 
-    def __sub__(self, value: int | BaseMac) -> int | str:
+    def __sub__(self, value: int | BaseMac) -> int | Self:
         """
         Returns a shifted MAC when `value` is a number or the integer difference
         between two MACs when `value` is another MAC address
         """
         if isinstance(value, BaseMac):
             return self.decimal - value.decimal
-        return self.number_to_hex_mac(self.decimal - value, self.format, self.__eui)
+        if not isinstance(value, int):
+            return NotImplemented
+        return self._from_int(self.decimal - value)
+
+    def _from_int(self, value: int) -> Self:
+        """
+        Returns a MAC of the same class, format and cache from an integer without
+        parsing it, its record is looked up on first use if the OUI differs
+        """
+        eui = self.__eui
+        if not 0 <= value < 1 << eui:
+            raise ValueError(f"{value} is out of range for an EUI-{eui}")
+        mac = object.__new__(type(self))
+        mac.__mac = f"{value:0{eui // 4}X}"
+        mac.__eui = eui
+        mac.__oui_cache = self.__oui_cache
+        same_oui = value >> (eui - 24) == self.decimal >> (eui - 24)
+        mac.__oui_record = self.__oui_record if same_oui else None
+        mac.format = self.format
+        mac.__dict__["decimal"] = value
+        return mac
+
+    def successor(self) -> Self:
+        """
+        Returns the next MAC address
+        """
+        return self._from_int(self.decimal + 1)
+
+    def predecessor(self) -> Self:
+        """
+        Returns the previous MAC address
+        """
+        return self._from_int(self.decimal - 1)
+
+    def range_to(self, stop: BaseMac | str | int, step: int = 1) -> range:
+        """
+        Returns the integer values from this MAC up to but excluding `stop`
+        """
+        if isinstance(stop, BaseMac):
+            stop = stop.decimal
+        elif isinstance(stop, str):
+            stop = self.hex_to_number(stop)
+        return range(self.decimal, stop, step)
+
+    def iter_range(self, stop: BaseMac | str | int, step: int = 1) -> Iterator[Self]:
+        """
+        Yields the MACs from this one up to but excluding `stop`, built lazily
+        from integers
+        """
+        return map(self._from_int, self.range_to(stop, step))
 
     @classmethod
-    def validate_mac(cls, mac_input: str | int) -> int:
+    def from_bytes(cls, data: Buffer, *args, **kwargs) -> Self:
+        """
+        Creates a MAC from 6 or 8 raw bytes in network order, any object with the
+        buffer protocol is accepted (`bytes`, `bytearray`, `memoryview`)
+        """
+        return cls(data, *args, **kwargs)
+
+    @classmethod
+    def from_ipv6_address(cls, address: IPv6 | str, *args, **kwargs) -> Self:
+        """
+        Creates the MAC an EUI-64 based SLAAC address was derived from
+        """
+        mac = mac_from_address(address)
+        if mac is None:
+            raise ValueError(f"{address} has no EUI-64 interface identifier")
+        # Raw bytes keep the leading zero octets a bare integer would lose
+        return cls(mac.to_bytes(6, "big"), *args, **kwargs)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the 6 or 8 raw bytes of the MAC in network order
+        """
+        return self.decimal.to_bytes(self.__eui // 8, "big")
+
+    @classmethod
+    def validate_mac(cls, mac_input: str | int | Buffer) -> int:
         """
         Validates a string and returns the EUI value for valid matches or 0 for invalid
         """
+        if isinstance(mac_input, Buffer):
+            byte_length = memoryview(mac_input).nbytes
+            return byte_length * 8 if byte_length in [6, 8] else 0
         if isinstance(mac_input, int):
             mac_input = BaseMac.number_to_hex_mac(mac_input)
 
@@ -109,6 +198,8 @@ class BaseMac:
         """
         Returns the vendor if the IEEE lookup was made
         """
+        if self.__oui_record is None and self.__oui_cache:
+            self.__oui_record = self.__oui_cache.get_record(self.clean_oui)
         if self.__oui_record:
             return self.__oui_record.get("vendor")
 
@@ -192,21 +283,19 @@ class BaseMac:
             mac_address=self.__mac, delimiter=MacNotation.SPACE
         )
 
+    @cached_property
+    def interface_id(self) -> int:
+        """
+        Returns the modified EUI-64 interface identifier as an integer
+        """
+        return interface_id(self.decimal, self.__eui)
+
     @cached_property
     def eui64_suffix(self) -> str:
         """
         Returns the EUI-64 suffix for an IPv6 address
         """
-        if self.__eui == 48:
-            eui: str = str(self.clean)  # pyright: ignore[reportRedeclaration]
-            swapped: str = hex(int(eui[1:2], 16) + 2)[2:]
-            eui: str = f"{eui[:1]}{swapped}{eui[2:6]}fffe{eui[6:]}"
-        else:
-            # EUI-64 will assume it doesn't need to be flipped
-            eui = self.clean
-        return self.format_mac_address(
-            mac_address=eui, delimiter=MacNotation.COLON, case="lower", interval=4
-        )
+        return self.interface_id.to_bytes(8, "big").hex(":", 2)
 
     @cached_property
     def link_local_address(self) -> str:
@@ -295,12 +384,9 @@ class BaseMac:
         """
         return int(bin(input_number)[2:].zfill(bit_length))
 
-    def get_global_address(self, global_prefix: str) -> IPv6:
+    def get_global_address(self, global_prefix: str | IPv6Network) -> IPv6:
         """
-        Returns the GUA for the MAC address with supplied prefix
+        Returns the GUA for the MAC address with supplied prefix, either a network
+        or its leading groups
         """
-        ip_address = f"{global_prefix}:{self.eui64_suffix}"
-        try:
-            return IPv6(address=ip_address)
-        except AddressValueError:
-            raise ValueError(f"Invalid IPv6 address: {ip_address}")
+        return IPv6(prefix_value(global_prefix) | self.interface_id)
@@ -0,0 +1,252 @@
+# MacTools Command Line Interface
+
+# Python Modules
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from csv import writer
+from io import StringIO
+from itertools import islice
+from json import dumps
+from multiprocessing import get_context
+from os import O_WRONLY, close, devnull, dup2
+from os import open as os_open
+from sys import stdin, stdout
+from typing import NamedTuple, TextIO
+
+# Local Modules
+from mactools.basemac import MacNotation
+from mactools.mac_common import format_hex_mac
+from mactools.oui_cache.oui_core import get_oui_cache
+from mactools.oui_cache.oui_shared import attach_oui_cache, share_oui_cache
+from mactools.oui_server import DEFAULT_HOST, DEFAULT_PORT, run_server
+from mactools.tools_common import DELIMITER_TABLE, MAC_REGEX
+from mactools.update_ieee import update_ieee_files
+from mactools.version import __version__
+
+LAZY_FIELDS = ["input", "mac", "eui", "vendor", "error"]
+FULL_FIELDS = ["input", "mac", "eui", "oui", "vendor", "address", "note", "error"]
+
+
+class LookupOptions(NamedTuple):
+    """
+    Per-row settings, sent to each worker along with its batch
+    """
+
+    notation: MacNotation = MacNotation.COLON
+    lower: bool = False
+    full: bool = False
+    lookup: bool = True
+    remote: bool = False
+    output_format: str = "jsonl"
+
+
+def process_batch(lines: list[str], options: LookupOptions) -> str:
+    """
+    Normalizes, formats and resolves a batch of input lines and returns the
+    serialized output rows
+    """
+    rows: list[dict[str, str | int | bool | None]] = []
+    cleans: list[str] = []
+    for line in lines:
+        text = line.strip()
+        if not MAC_REGEX.fullmatch(text):
+            rows.append({"input": text, "error": "Not a valid MAC address"})
+            continue
+        clean = text.translate(DELIMITER_TABLE).upper()
+        cleans.append(clean)
+        rows.append(
+            {
+                "input": text,
+                "mac": format_hex_mac(clean, options.notation, options.lower),
+                "eui": len(clean) * 4,
+            }
+        )
+
+    if options.lookup and cleans:
+        records = iter(get_oui_cache().get_records(cleans, options.remote))
+        for row in rows:
+            if "mac" not in row:
+                continue
+            record = next(records) or {}
+            row["vendor"] = record.get("vendor")
+            if options.full:
+                row["oui"] = record.get("oui")
+                row["address"] = record.get("address")
+                row["note"] = record.get("note")
+
+    if options.output_format == "csv":
+        output = StringIO()
+        csv_writer = writer(output, lineterminator="\n")
+        fields = FULL_FIELDS if options.full else LAZY_FIELDS
+        for row in rows:
+            csv_writer.writerow(["" if row.get(i) is None else row[i] for i in fields])
+        return output.getvalue()
+
+    return "".join(f"{dumps(row, separators=(',', ':'))}\n" for row in rows)
+
+
+def read_lines(file_paths: list[str]) -> Iterator[str]:
+    """
+    Yields non-empty lines from each file in turn, `-` reads standard input
+    """
+    for file_path in file_paths or ["-"]:
+        with (
+            nullcontext(stdin)
+            if file_path == "-"
+            else open(file_path, encoding="utf-8", errors="replace")
+        ) as source:
+            for line in source:
+                if not line.isspace():
+                    yield line
+
+
+def batched(lines: Iterable[str], batch_size: int) -> Iterator[list[str]]:
+    iterator = iter(lines)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def run(
+    lines: Iterable[str],
+    output: TextIO,
+    options: LookupOptions,
+    batch_size: int = 10000,
+    workers: int = 1,
+) -> None:
+    """
+    Streams `lines` through `process_batch`, keeping at most two batches per
+    worker in flight so memory stays bounded regardless of the input size
+    """
+    if options.output_format == "csv":
+        output.write(",".join(FULL_FIELDS if options.full else LAZY_FIELDS) + "\n")
+
+    if workers <= 1:
+        output.writelines(
+            process_batch(batch, options) for batch in batched(lines, batch_size)
+        )
+        return
+
+    shared = share_oui_cache(get_oui_cache()) if options.lookup else None
+    try:
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=get_context("spawn"),
+            initializer=attach_oui_cache if shared else None,
+            initargs=(shared.name,) if shared else (),
+        ) as executor:
+            pending: deque[Future[str]] = deque()
+            for batch in batched(lines, batch_size):
+                pending.append(executor.submit(process_batch, batch, options))
+                if len(pending) >= workers * 2:
+                    output.write(pending.popleft().result())
+            while pending:
+                output.write(pending.popleft().result())
+    finally:
+        if shared:
+            shared.unlink()
+
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="mactools",
+        description="Normalize, format and vendor-resolve MAC addresses, one per line",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="input files, standard input when omitted or `-`"
+    )
+    parser.add_argument(
+        "-n",
+        "--notation",
+        choices=[i.name.lower() for i in MacNotation],
+        default="colon",
+        help="output notation of the `mac` field (default: colon)",
+    )
+    parser.add_argument("--lower", action="store_true", help="lower-case output")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "-r",
+        "--record",
+        choices=["lazy", "full"],
+        default="lazy",
+        help="vendor only or the full registry record (default: lazy)",
+    )
+    parser.add_argument(
+        "--no-lookup", action="store_true", help="only normalize and format"
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="ask the remote API about OUIs missing from the local registry",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="lines resolved per batch (default: 10000)",
+    )
+    parser.add_argument(
+        "--update-ieee",
+        action="store_true",
+        help="download the IEEE registries and exit",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=f"{DEFAULT_HOST}:{DEFAULT_PORT}",
+        metavar="HOST:PORT",
+        help=f"serve look-ups over TCP until interrupted (default: {DEFAULT_HOST}:{DEFAULT_PORT})",
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: Namespace = create_parser().parse_args(argv)
+
+    if args.update_ieee:
+        return 0 if update_ieee_files() else 1
+
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        try:
+            run_server(get_oui_cache(), host or DEFAULT_HOST, int(port))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    options = LookupOptions(
+        notation=MacNotation[args.notation.upper()],
+        lower=args.lower,
+        full=args.record == "full",
+        lookup=not args.no_lookup,
+        remote=args.remote,
+        output_format=args.format,
+    )
+    try:
+        run(read_lines(args.files), stdout, options, args.batch_size, args.workers)
+    except BrokenPipeError:
+        # The reading end (e.g. `head`) closed early, which is not an error here.
+        # Standard output is pointed at the null device so the flush at exit
+        # does not fail on the closed pipe again
+        null_fd = os_open(devnull, O_WRONLY)
+        dup2(null_fd, stdout.fileno())
+        close(null_fd)
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,16 @@
 # MacTools Common Module
 
 # Python Modules
-from random import randint
-from collections.abc import Callable, Iterator
+from array import array
+from collections.abc import Buffer, Callable, Iterator
+from itertools import chain
+from random import Random, randint
+from struct import iter_unpack
+from sys import byteorder
 
 # Local Modules
 from mactools.basemac import BaseMac, MacNotation
+from mactools.tools_common import DELIMITER_TABLE
 
 
 def fill_hex(raw_input: str | int, required_length: int, backfill: bool = False) -> str:
@@ -42,6 +47,73 @@ def hex_range(
         yield f"{fixed_start}{fill_part}{fixed_end}"
 
 
+def format_hex_mac(
+    clean_hex: str, notation: MacNotation = MacNotation.COLON, lower: bool = False
+) -> str:
+    """
+    Returns a delimiter-free hex MAC in `notation` without creating a `BaseMac`
+    """
+    raw = bytes.fromhex(clean_hex)
+    if notation == MacNotation.CLEAN:
+        formatted = raw.hex()
+    else:
+        formatted = raw.hex(notation.value, 2 if notation == MacNotation.PERIOD else 1)
+    return formatted if lower else formatted.upper()
+
+
+def unpack_macs(
+    buffer: Buffer,
+    stride: int = 6,
+    offset: int = 0,
+    count: int | None = None,
+    eui: int = 48,
+) -> array:
+    """
+    Decodes the addresses found every `stride` bytes of a buffer from `offset`,
+    such as the destination field of a run of frame headers, into an array of
+    integers. The buffer is read in place.
+    """
+    size = eui // 8
+    if size not in [6, 8]:
+        raise ValueError(f"EUI must be 48 or 64, not {eui}")
+    if stride < size:
+        raise ValueError(f"Stride {stride} is shorter than a {size}-byte address")
+
+    view = memoryview(buffer).cast("B")
+    available = max((len(view) - offset - size) // stride + 1, 0)
+    if count is None:
+        count = available
+    elif count > available:
+        raise ValueError(f"Buffer holds {available} addresses, not {count}")
+
+    # Whole strides are unpacked in one pass, a last record cut short after its
+    # address is read on its own
+    whole = min(count, (len(view) - offset) // stride)
+    records = view[offset : offset + whole * stride]
+    if size == 8:
+        values = array(
+            "Q", chain.from_iterable(iter_unpack(f">Q{stride - 8}x", records))
+        )
+    elif stride >= 8:
+        # Reading the two bytes after the address is cheaper than joining halves
+        values = array(
+            "Q", (i >> 16 for (i,) in iter_unpack(f">Q{stride - 8}x", records))
+        )
+    else:
+        values = array(
+            "Q",
+            (
+                high << 32 | low
+                for high, low in iter_unpack(f">HI{stride - 6}x", records)
+            ),
+        )
+
+    if whole < count:
+        start = offset + whole * stride
+        values.append(int.from_bytes(view[start : start + size], "big"))
+    return values
+
+
 def prepare_oui(input_mac: BaseMac | str | int, full: bool = True) -> str:
     """
     Takes a MAC or OUI and strips and prepares a unified clean OUI
@@ -87,3 +159,151 @@ def create_random_mac(eui: int = 48, delimiter: MacNotation = MacNotation.COLON)
 
     mac_portions = [create_random_hex_string(hex_length) for _ in range(int(segments))]
     return delimiter.value.join(mac_portions)
+
+
+def create_constraints(
+    eui: int = 48,
+    prefix: str | None = None,
+    local: bool | None = None,
+    multicast: bool | None = None,
+) -> tuple[int, int]:
+    """
+    Returns the mask of fixed bits and their values within a 64-bit word for the
+    given prefix and U/L and I/G bits, `None` leaves a bit random
+    """
+    if eui not in [48, 64]:
+        raise ValueError("EUI must be either `48` or `64`")
+
+    # Bits above an EUI-48 are always zero
+    mask = ((1 << 64) - 1) ^ ((1 << eui) - 1)
+    value = 0
+    if prefix:
+        clean = prefix.translate(DELIMITER_TABLE)
+        prefix_bits = len(clean) * 4
+        if prefix_bits > eui:
+            raise ValueError(f"Prefix {prefix} is longer than an EUI-{eui}")
+        shift = eui - prefix_bits
+        mask |= ((1 << prefix_bits) - 1) << shift
+        value |= int(clean, 16) << shift
+
+    for flag, bit in [(multicast, 0x01), (local, 0x02)]:
+        if flag is None:
+            continue
+        flag_bit = bit << (eui - 8)
+        flag_value = flag_bit if flag else 0
+        if mask & flag_bit and value & flag_bit != flag_value:
+            raise ValueError(f"Prefix {prefix} conflicts with the requested flags")
+        mask |= flag_bit
+        value |= flag_value
+    return mask, value
+
+
+def _draw_values(rng: Random, count: int, mask: int, value: int) -> array:
+    """
+    Draws random 64-bit words and applies the fixed bits one byte column at a
+    time with slice assignments, without a Python-level loop per value
+    """
+    raw = bytearray(rng.randbytes(count * 8))
+    for column in range(8):
+        shift = 56 - column * 8
+        column_mask = (mask >> shift) & 0xFF
+        column_value = (value >> shift) & 0xFF
+        if column_mask == 0xFF:
+            raw[column::8] = bytes([column_value]) * count
+        elif column_mask:
+            table = bytes((i & ~column_mask) | column_value for i in range(256))
+            raw[column::8] = raw[column::8].translate(table)
+
+    values = array("Q", raw)
+    if byteorder == "little":
+        values.byteswap()
+    return values
+
+
+def _deposit_values(indices: list[int], mask: int, value: int, eui: int) -> array:
+    """
+    Spreads dense indices over the free bits of `mask`
+    """
+    # Fixed bits below the top free bit, a zero is inserted at each of them
+    free_top = max((i for i in range(eui) if not mask >> i & 1), default=-1)
+    holes = [i for i in range(free_top) if mask >> i & 1]
+    values = array("Q")
+    for index in indices:
+        for hole in holes:
+            index = (index >> hole) << (hole + 1) | (index & ((1 << hole) - 1))
+        values.append(index | value)
+    return values
+
+
+def format_mac_values(
+    values: array,
+    eui: int = 48,
+    notation: MacNotation = MacNotation.COLON,
+    lower: bool = False,
+) -> list[str]:
+    """
+    Returns integer MACs as strings in `notation`, formatting the whole array in
+    a single `bytes.hex` call
+    """
+    size = eui // 8
+    words = array("Q", values)
+    if byteorder == "little":
+        words.byteswap()
+    raw = words.tobytes()
+    if size < 8:
+        records = bytearray(len(values) * size)
+        for column in range(size):
+            records[column::size] = raw[column + 8 - size :: 8]
+        raw = bytes(records)
+
+    separator = notation.value
+    group = 2 if notation == MacNotation.PERIOD else 1
+    text = raw.hex(separator, group) if separator else raw.hex()
+    text = text if lower else text.upper()
+
+    # Records are joined by the same separator as their groups
+    length = size * 2 + (size // group - 1) * len(separator)
+    step = length + len(separator)
+    return [text[i : i + length] for i in range(0, len(text), step)]
+
+
+def create_random_macs(
+    count: int,
+    eui: int = 48,
+    prefix: str | None = None,
+    local: bool | None = None,
+    multicast: bool | None = None,
+    unique: bool = False,
+    seed: int | None = None,
+    notation: MacNotation | None = None,
+    lower: bool = False,
+) -> array | list[str]:
+    """
+    Returns `count` random MACs as an integer array, or strings when a
+    `notation` is given. `prefix` fixes the leading hex (an OUI or a block),
+    `local` and `multicast` fix the U/L and I/G bits (`None` for either) and
+    `unique` draws without replacement. A `seed` gives a reproducible stream.
+    """
+    mask, value = create_constraints(eui, prefix, local, multicast)
+    free_bits = 64 - mask.bit_count()
+    space = 1 << free_bits
+    if unique and count > space:
+        raise ValueError(f"Only {space} distinct MACs fit the constraints")
+
+    rng = Random(seed)  # nosec B311
+    if unique and count > space - (space >> 4):
+        # Nearly exhausting the space, retrying the last few would take too long
+        values = _deposit_values(rng.sample(range(space), count), mask, value, eui)
+    else:
+        values = _draw_values(rng, count, mask, value)
+        if unique:
+            distinct = dict.fromkeys(values)
+            while len(distinct) < count:
+                distinct.update(
+                    dict.fromkeys(_draw_values(rng, count - len(distinct), mask, value))
+                )
+            values = array("Q", distinct)
+
+    if notation is None:
+        return values
+    return format_mac_values(values, eui, notation, lower)
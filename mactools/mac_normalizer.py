@@ -0,0 +1,177 @@
+# MacTools MAC Normalizer
+
+# Python Modules
+from binascii import hexlify, unhexlify
+from collections.abc import Callable
+from re import Match, Pattern
+from typing import BinaryIO
+
+# Local Modules
+from mactools.basemac import MacNotation
+from mactools.mac_scanner import (
+    CONTEXT_LENGTH,
+    DEFAULT_CHUNK_SIZE,
+    DELIMITER_BYTES,
+    MAX_MATCH_LENGTH,
+)
+from mactools.tools_common import (
+    DELIMITER_TABLE,
+    STRICT_SCAN_BYTES_REGEX,
+    STRICT_SCAN_REGEX,
+)
+
+
+def _notation_format(notation: MacNotation) -> tuple[str, int]:
+    return notation.value, 2 if notation == MacNotation.PERIOD else 1
+
+
+def create_bytes_replacer(
+    notation: MacNotation = MacNotation.COLON, lower: bool = False
+) -> Callable[[Match[bytes]], bytes]:
+    """
+    Returns a `re.sub` callback rewriting a bytes match into `notation`,
+    working on the raw bytes only
+    """
+    separator, group = _notation_format(notation)
+    if not separator:
+
+        def replace(found: Match[bytes]) -> bytes:
+            clean = found.group().translate(None, DELIMITER_BYTES)
+            return clean.lower() if lower else clean.upper()
+
+    else:
+
+        def replace(found: Match[bytes]) -> bytes:
+            clean = found.group().translate(None, DELIMITER_BYTES)
+            formatted = hexlify(unhexlify(clean), separator, group)
+            return formatted if lower else formatted.upper()
+
+    return replace
+
+
+def create_text_replacer(
+    notation: MacNotation = MacNotation.COLON, lower: bool = False
+) -> Callable[[Match[str]], str]:
+    """
+    Returns a `re.sub` callback rewriting a string match into `notation`
+    """
+    separator, group = _notation_format(notation)
+    if not separator:
+
+        def replace(found: Match[str]) -> str:
+            clean = found.group().translate(DELIMITER_TABLE)
+            return clean.lower() if lower else clean.upper()
+
+    else:
+
+        def replace(found: Match[str]) -> str:
+            clean = found.group().translate(DELIMITER_TABLE)
+            formatted = bytes.fromhex(clean).hex(separator, group)
+            return formatted if lower else formatted.upper()
+
+    return replace
+
+
+def normalize_text(
+    text: str | bytes,
+    notation: MacNotation = MacNotation.COLON,
+    lower: bool = False,
+    regex: Pattern | None = None,
+) -> str | bytes:
+    """
+    Returns `text` with every MAC address rewritten in `notation`, the rest of
+    the text is left untouched. The strict scan pattern is used by default so
+    UUIDs, hashes and long numbers are not rewritten, `regex` (e.g. the looser
+    `SCAN_REGEX`) must match the type of `text`.
+    """
+    if isinstance(text, str):
+        regex = regex or STRICT_SCAN_REGEX
+        return regex.sub(create_text_replacer(notation, lower), text)
+    regex = regex or STRICT_SCAN_BYTES_REGEX
+    return regex.sub(create_bytes_replacer(notation, lower), text)
+
+
+def _rewrite_matches(
+    buffer: bytes,
+    start: int,
+    limit: int,
+    replace: Callable[[Match[bytes]], bytes],
+    output: list[bytes],
+    regex: Pattern[bytes],
+) -> tuple[int, int]:
+    """
+    Appends `buffer` from `start` to `output` with the matches starting before
+    `limit` replaced, returns the end of the rewritten part and the match count
+    """
+    written = start
+    count = 0
+    for found in regex.finditer(buffer, start):
+        if found.start() >= limit:
+            break
+        output.append(buffer[written : found.start()])
+        output.append(replace(found))
+        written = found.end()
+        count += 1
+    return written, count
+
+
+def normalize_stream(
+    source: BinaryIO,
+    destination: BinaryIO,
+    notation: MacNotation = MacNotation.COLON,
+    lower: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    regex: Pattern[bytes] = STRICT_SCAN_BYTES_REGEX,
+) -> int:
+    """
+    Copies a binary stream to `destination` in chunks with every MAC address
+    rewritten in `notation`, returns the number of addresses rewritten
+    """
+    replace = create_bytes_replacer(notation, lower)
+    total = 0
+
+    # Same carry-over as `scan_stream`, `context` is the byte before `carry`
+    context = b""
+    carry = b""
+    while chunk := source.read(chunk_size):
+        buffer = context + carry + chunk
+        output: list[bytes] = []
+
+        # Matches starting before `limit` can no longer change with more input
+        limit = len(buffer) - MAX_MATCH_LENGTH - CONTEXT_LENGTH
+        written, count = _rewrite_matches(
+            buffer, len(context), limit, replace, output, regex
+        )
+        total += count
+
+        cut = max(limit, written)
+        output.append(buffer[written:cut])
+        destination.write(b"".join(output))
+
+        context = buffer[max(cut - CONTEXT_LENGTH, 0) : cut]
+        carry = buffer[cut:]
+
+    buffer = context + carry
+    output = []
+    written, count = _rewrite_matches(
+        buffer, len(context), len(buffer) + 1, replace, output, regex
+    )
+    output.append(buffer[written:])
+    destination.write(b"".join(output))
+    return total + count
+
+
+def normalize_file(
+    file_path: str,
+    output_path: str,
+    notation: MacNotation = MacNotation.COLON,
+    lower: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    regex: Pattern[bytes] = STRICT_SCAN_BYTES_REGEX,
+) -> int:
+    """
+    Writes a copy of a file with every MAC address rewritten in `notation`,
+    returns the number of addresses rewritten
+    """
+    with open(file_path, "rb") as source, open(output_path, "wb") as destination:
+        return normalize_stream(source, destination, notation, lower, chunk_size, regex)
@@ -0,0 +1,175 @@
+# MacTools MAC Aggregation Pipeline
+
+# Python Modules
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from mmap import ACCESS_READ, mmap
+from multiprocessing import get_context
+from os import cpu_count, path
+from typing import NamedTuple
+
+# Local Modules
+from mactools.mac_scanner import DELIMITER_BYTES
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_core import get_oui_cache
+from mactools.oui_cache.oui_shared import attach_oui_cache, share_oui_cache
+from mactools.tools_common import SCAN_BYTES_REGEX
+
+# Files larger than this are split into several tasks
+DEFAULT_SPLIT_SIZE = 64 << 20
+
+UNKNOWN_VENDOR = "Unknown"
+
+
+class ScanRange(NamedTuple):
+    """
+    A byte range of a file handled by a single worker, `stop` of `None` is the end
+    """
+
+    file_path: str
+    start: int = 0
+    stop: int | None = None
+
+
+@dataclass
+class MacReport:
+    """
+    Per-MAC and per-vendor occurrence counts, MACs are keyed by integer value
+    """
+
+    mac_counts: Counter[int] = field(default_factory=Counter)
+    vendor_counts: Counter[str] = field(default_factory=Counter)
+    vendors: dict[int, str] = field(default_factory=dict)
+
+    def merge(self, other: MacReport) -> MacReport:
+        """
+        Adds the counts of `other` into this report and returns it
+        """
+        self.mac_counts.update(other.mac_counts)
+        self.vendor_counts.update(other.vendor_counts)
+        self.vendors.update(other.vendors)
+        return self
+
+    @property
+    def total(self) -> int:
+        return self.mac_counts.total()
+
+
+def split_file(file_path: str, split_size: int = DEFAULT_SPLIT_SIZE) -> list[ScanRange]:
+    """
+    Splits a file into ranges of about `split_size` bytes, each ending after a
+    newline so that no address is cut between two ranges
+    """
+    size = path.getsize(file_path)
+    if size <= split_size:
+        return [ScanRange(file_path)]
+
+    ranges = []
+    with open(file_path, "rb") as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + split_size, size))
+            file.readline()
+            stop = min(file.tell(), size)
+            ranges.append(ScanRange(file_path, start, stop))
+            start = stop
+    return ranges
+
+
+def _count_matches(data: mmap, start: int, stop: int) -> Counter[bytes]:
+    # Kept separate so the match iterator is released before the map is closed
+    counts: Counter[bytes] = Counter()
+    for found in SCAN_BYTES_REGEX.finditer(data, start):
+        if found.start() >= stop:
+            break
+        counts[found.group()] += 1
+    return counts
+
+
+def count_range(scan_range: ScanRange) -> Counter[str]:
+    """
+    Returns the clean, upper-case hex of each MAC in the range with its count
+    """
+    file_path, start, stop = scan_range
+    if path.getsize(file_path) == 0:
+        return Counter()
+
+    with (
+        open(file_path, "rb") as file,
+        mmap(file.fileno(), 0, access=ACCESS_READ) as data,
+    ):
+        counts = _count_matches(data, start, len(data) if stop is None else stop)
+
+    clean_counts: Counter[str] = Counter()
+    for raw, count in counts.items():
+        clean_counts[raw.translate(None, DELIMITER_BYTES).decode().upper()] += count
+    return clean_counts
+
+
+def resolve_counts(counts: Counter[str], cache: OUICache) -> MacReport:
+    """
+    Resolves the vendor of each distinct MAC once and reduces to a `MacReport`
+    """
+    report = MacReport()
+    for clean, count in counts.items():
+        record = cache.get_record(clean, remote=False) or {}
+        vendor = record.get("vendor") or UNKNOWN_VENDOR
+        value = int(clean, 16)
+        report.mac_counts[value] += count
+        report.vendors[value] = vendor
+        report.vendor_counts[vendor] += count
+    return report
+
+
+def aggregate_range(scan_range: ScanRange) -> MacReport:
+    """
+    Worker task, scans one range and resolves it against the process' cache
+    """
+    return resolve_counts(count_range(scan_range), get_oui_cache())
+
+
+def create_ranges(
+    file_paths: Iterable[str], split_size: int = DEFAULT_SPLIT_SIZE
+) -> list[ScanRange]:
+    return [i for file_path in file_paths for i in split_file(file_path, split_size)]
+
+
+def aggregate_files(
+    file_paths: Iterable[str],
+    workers: int | None = None,
+    split_size: int = DEFAULT_SPLIT_SIZE,
+    cache: OUICache | None = None,
+) -> MacReport:
+    """
+    Counts MACs and vendors across files with a process pool. Large files are
+    split into line-aligned ranges and the registry is shared with the workers
+    instead of being rebuilt by each one. `workers=1` runs in this process.
+    """
+    ranges = create_ranges(file_paths, split_size)
+    cache = get_oui_cache() if cache is None else cache
+    workers = min(workers or cpu_count() or 1, len(ranges))
+
+    report = MacReport()
+    if workers <= 1:
+        for scan_range in ranges:
+            report.merge(resolve_counts(count_range(scan_range), cache))
+        return report
+
+    shared = share_oui_cache(cache)
+    try:
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=get_context("spawn"),
+            initializer=attach_oui_cache,
+            initargs=(shared.name,),
+        ) as executor:
+            futures = [executor.submit(aggregate_range, i) for i in ranges]
+            for future in as_completed(futures):
+                report.merge(future.result())
+    finally:
+        shared.unlink()
+    return report
@@ -0,0 +1,287 @@
+# MacTools MAC Address Pool
+
+# Python Modules
+from __future__ import annotations
+
+from array import array
+from os import O_RDONLY, close, fsync, path, replace
+from os import open as os_open
+from re import compile as re_compile
+from struct import Struct
+from zlib import crc32
+
+# Local Modules
+from mactools.basemac import BaseMac
+from mactools.mac_common import create_constraints
+
+# Magic, first address, size, cursor, EUI and the CRC-32 of the bitmap
+POOL_MAGIC = b"MTPOOL01"
+POOL_HEADER = Struct("<8sQQQII")
+
+# A byte with at least one free address, or a run of bytes with every one free
+NOT_FULL_REGEX = re_compile(b"[^\xff]")
+FREE_RUN_REGEX = re_compile(b"\x00+|[^\xff]")
+
+# Bitmap bytes read at once by `allocate_block`
+BLOCK_WINDOW = 4096
+
+
+def to_mac_value(mac: BaseMac | str | int) -> int:
+    """
+    Returns the integer value of a MAC given as an object, string or integer
+    """
+    if isinstance(mac, BaseMac):
+        return mac.decimal
+    if isinstance(mac, str):
+        return BaseMac.hex_to_number(mac)
+    return mac
+
+
+def find_free_run(free: int, length: int) -> int:
+    """
+    Returns the lowest bit starting `length` consecutive set bits of `free`, or -1
+    """
+    # After each step a bit stays set only if the `covered` bits from it are set
+    covered = 1
+    while covered < length:
+        step = min(covered, length - covered)
+        free &= free >> step
+        covered += step
+    return (free & -free).bit_length() - 1
+
+
+class MacPool:
+    """
+    Hands out addresses from the inclusive range `first` to `last`, tracked by a
+    bitmap holding one bit per address. Allocation is next-fit from a cursor, so
+    freed addresses are only reused once the rest of the pool has been used.
+    """
+
+    def __init__(
+        self, first: BaseMac | str | int, last: BaseMac | str | int, eui: int = 48
+    ) -> None:
+        self.first = to_mac_value(first)
+        self.size = to_mac_value(last) - self.first + 1
+        self.eui = eui
+        if eui not in [48, 64]:
+            raise ValueError("EUI must be either `48` or `64`")
+        if self.size <= 0 or self.first < 0 or self.first + self.size > 1 << eui:
+            raise ValueError(f"Invalid EUI-{eui} pool range {first} to {last}")
+
+        # Address `i` is bit `i % 8` of byte `i // 8`, padding bits count as used
+        self._bitmap = bytearray(-(-self.size // 8))
+        if self.size % 8:
+            self._bitmap[-1] = 0xFF ^ ((1 << self.size % 8) - 1)
+        self._cursor = 0
+        self._allocated = 0
+        # Every byte below this one is full, only `free` moves it down
+        self._free_hint = 0
+
+    @classmethod
+    def from_prefix(cls, prefix: str, eui: int = 48) -> MacPool:
+        """
+        Creates a pool of every address within an OUI or any other hex prefix
+        """
+        mask, value = create_constraints(eui, prefix)
+        return cls(value, value | (((1 << eui) - 1) & ~mask), eui)
+
+    def __repr__(self) -> str:
+        last = self.first + self.size - 1
+        return (
+            f"MacPool({self.first:#x}, {last:#x}, eui={self.eui}, "
+            f"allocated={self._allocated})"
+        )
+
+    def __len__(self) -> int:
+        return self._allocated
+
+    def __contains__(self, mac: BaseMac | str | int) -> bool:
+        index = to_mac_value(mac) - self.first
+        return 0 <= index < self.size and self._is_used(index)
+
+    @property
+    def available(self) -> int:
+        """
+        Number of addresses not yet allocated
+        """
+        return self.size - self._allocated
+
+    def _index(self, mac: BaseMac | str | int) -> int:
+        index = to_mac_value(mac) - self.first
+        if not 0 <= index < self.size:
+            raise ValueError(f"{mac} is outside of the pool")
+        return index
+
+    def _is_used(self, index: int) -> bool:
+        return bool((self._bitmap[index >> 3] >> (index & 7)) & 1)
+
+    def _mark_range(self, start: int, stop: int) -> None:
+        """
+        Marks the free addresses from index `start` up to `stop` as used
+        """
+        first_byte, last_byte = start >> 3, ((stop - 1) >> 3) + 1
+        window = int.from_bytes(self._bitmap[first_byte:last_byte], "little")
+        window |= ((1 << (stop - start)) - 1) << (start & 7)
+        self._bitmap[first_byte:last_byte] = window.to_bytes(
+            last_byte - first_byte, "little"
+        )
+        self._allocated += stop - start
+        self._cursor = stop % self.size
+
+    def allocate(self) -> int:
+        """
+        Allocates the next free address and returns it
+        """
+        if not self.available:
+            raise ValueError("The MAC pool is exhausted")
+        bitmap = self._bitmap
+        # Addresses below the cursor in its own byte are passed over
+        byte_index = self._cursor >> 3
+        byte = bitmap[byte_index] | ((1 << (self._cursor & 7)) - 1)
+        if byte == 0xFF:
+            found = NOT_FULL_REGEX.search(bitmap, byte_index + 1)
+            found = found or NOT_FULL_REGEX.search(bitmap)
+            byte_index = found.start()  # type: ignore[union-attr]
+            byte = bitmap[byte_index]
+
+        # Lowest clear bit of the byte
+        bit = (~byte & (byte + 1)).bit_length() - 1
+        bitmap[byte_index] |= 1 << bit
+        index = byte_index << 3 | bit
+        self._allocated += 1
+        self._cursor = (index + 1) % self.size
+        return self.first + index
+
+    def allocate_many(self, count: int) -> array:
+        """
+        Allocates `count` free addresses, not necessarily contiguous, and returns
+        them as an integer array
+        """
+        if count < 0:
+            raise ValueError("The address count must not be negative")
+        if count > self.available:
+            raise ValueError(f"Only {self.available} addresses are available")
+
+        output = array("Q")
+        bitmap = self._bitmap
+        start_byte = self._cursor >> 3
+        # Wholly free runs of bytes are taken at once, partial bytes bit by bit
+        for search_start, search_end in [(start_byte, len(bitmap)), (0, start_byte)]:
+            for found in FREE_RUN_REGEX.finditer(bitmap, search_start, search_end):
+                needed = count - len(output)
+                if not needed:
+                    break
+                run_start = found.start() << 3
+                if found.end() - found.start() > 1 or not bitmap[found.start()]:
+                    run_stop = min(found.end() << 3, run_start + needed)
+                    self._mark_range(run_start, run_stop)
+                    output.extend(range(self.first + run_start, self.first + run_stop))
+                    continue
+                byte = bitmap[found.start()]
+                for bit in range(8):
+                    if not (byte >> bit) & 1 and len(output) < count:
+                        self._mark_range(run_start + bit, run_start + bit + 1)
+                        output.append(self.first + run_start + bit)
+        return output
+
+    def allocate_block(self, count: int) -> range:
+        """
+        Allocates the lowest run of `count` contiguous free addresses and returns
+        their range
+        """
+        if count <= 0 or count > self.available:
+            raise ValueError(f"Only {self.available} addresses are available")
+        bitmap = self._bitmap
+        # Windows overlap by the most bytes a run can span, so a run starting in
+        # one window is wholly inside it, and full bytes are skipped between them
+        span = ((count + 7) >> 3) + 1
+        window = max(BLOCK_WINDOW, 2 * span)
+        found = NOT_FULL_REGEX.search(bitmap, self._free_hint)
+        if found:
+            self._free_hint = found.start()
+        while found:
+            byte_index = found.start()
+            end = min(byte_index + window, len(bitmap))
+            used = int.from_bytes(bitmap[byte_index:end], "little")
+            start = find_free_run(~used & ((1 << 8 * (end - byte_index)) - 1), count)
+            if start >= 0:
+                start += byte_index << 3
+                self._mark_range(start, start + count)
+                return range(self.first + start, self.first + start + count)
+            if end == len(bitmap):
+                break
+            found = NOT_FULL_REGEX.search(bitmap, end - span)
+        raise ValueError(f"No run of {count} contiguous addresses is free")
+
+    def reserve(self, mac: BaseMac | str | int) -> None:
+        """
+        Marks a specific address as allocated
+        """
+        index = self._index(mac)
+        if self._is_used(index):
+            raise ValueError(f"{mac} is already allocated")
+        self._bitmap[index >> 3] |= 1 << (index & 7)
+        self._allocated += 1
+
+    def free(self, mac: BaseMac | str | int) -> None:
+        """
+        Returns an allocated address to the pool
+        """
+        index = self._index(mac)
+        if not self._is_used(index):
+            raise ValueError(f"{mac} is not allocated")
+        self._bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self._allocated -= 1
+        self._free_hint = min(self._free_hint, index >> 3)
+
+    def save(self, file_path: str) -> None:
+        """
+        Writes the pool to `file_path`, replacing any previous file atomically
+        """
+        header = POOL_HEADER.pack(
+            POOL_MAGIC,
+            self.first,
+            self.size,
+            self._cursor,
+            self.eui,
+            crc32(self._bitmap),
+        )
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(header)
+            file.write(self._bitmap)
+            file.flush()
+            fsync(file.fileno())
+        replace(temp_path, file_path)
+        # The rename is only durable once the directory entry is written
+        try:
+            directory = os_open(path.dirname(path.abspath(file_path)), O_RDONLY)
+        except OSError:  # Windows cannot open directories
+            return
+        try:
+            fsync(directory)
+        finally:
+            close(directory)
+
+    @classmethod
+    def load(cls, file_path: str) -> MacPool:
+        """
+        Reads a pool written by `save`, checking it has not been damaged
+        """
+        with open(file_path, "rb") as file:
+            data = file.read()
+        if len(data) < POOL_HEADER.size:
+            raise ValueError(f"{file_path} is not a MAC pool file")
+        magic, first, size, cursor, eui, checksum = POOL_HEADER.unpack_from(data)
+        if magic != POOL_MAGIC:
+            raise ValueError(f"{file_path} is not a MAC pool file")
+
+        pool = cls(first, first + size - 1, eui)
+        bitmap = data[POOL_HEADER.size :]
+        if len(bitmap) != len(pool._bitmap) or crc32(bitmap) != checksum:
+            raise ValueError(f"{file_path} is truncated or corrupted")
+        pool._bitmap[:] = bitmap
+        pool._cursor = cursor % size
+        padding = len(bitmap) * 8 - size
+        pool._allocated = int.from_bytes(bitmap, "little").bit_count() - padding
+        return pool
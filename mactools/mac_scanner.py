@@ -0,0 +1,117 @@
+# MacTools MAC Scanner
+
+# Python Modules
+from collections.abc import Iterator
+from mmap import ACCESS_READ, mmap
+from os import path
+from re import Pattern
+from typing import BinaryIO, NamedTuple
+
+# Local Modules
+from mactools.basemac import MacNotation
+from mactools.tools_common import SCAN_BYTES_REGEX
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Longest possible match, an EUI-64 with a delimiter after every pair
+MAX_MATCH_LENGTH = 23
+
+# Bytes on either side of a match read by the look-arounds of the patterns
+CONTEXT_LENGTH = 2
+
+HEX_BYTES = b"0123456789abcdefABCDEF"
+DELIMITER_BYTES = b":-. "
+DELIMITER_NOTATION: dict[int, MacNotation] = {
+    ord(notation.value): notation for notation in MacNotation if notation.value
+}
+
+
+class MacMatch(NamedTuple):
+    """
+    A MAC address found in scanned input
+    """
+
+    value: int
+    offset: int
+    notation: MacNotation
+    eui: int
+
+
+def match_to_mac(raw: bytes, offset: int) -> MacMatch:
+    """
+    Converts the raw bytes of a match into a `MacMatch` without decoding them
+    """
+    delimiters = raw.translate(None, HEX_BYTES)
+    notation = DELIMITER_NOTATION[delimiters[0]] if delimiters else MacNotation.CLEAN
+    clean = raw.translate(None, DELIMITER_BYTES)
+    return MacMatch(int(clean, 16), offset, notation, len(clean) * 4)
+
+
+def scan_bytes(
+    data: bytes | bytearray | memoryview | mmap,
+    base_offset: int = 0,
+    regex: Pattern[bytes] = SCAN_BYTES_REGEX,
+) -> Iterator[MacMatch]:
+    """
+    Yields every MAC address within `data`, offsets are shifted by `base_offset`
+    """
+    for found in regex.finditer(data):
+        yield match_to_mac(found.group(), base_offset + found.start())
+
+
+def scan_stream(
+    stream: BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    regex: Pattern[bytes] = SCAN_BYTES_REGEX,
+) -> Iterator[MacMatch]:
+    """
+    Yields every MAC address read from a binary stream in chunks, matches that
+    straddle two chunks are carried over and reported once
+    """
+    # `context` is the bytes before `carry` needed by the look-behinds
+    context = b""
+    carry = b""
+    base_offset = 0
+
+    while chunk := stream.read(chunk_size):
+        buffer = context + carry + chunk
+        start = len(context)
+        buffer_offset = base_offset - start
+
+        # Matches starting before `limit` can no longer change with more input
+        limit = len(buffer) - MAX_MATCH_LENGTH - CONTEXT_LENGTH
+        resume = max(limit, start)
+        for found in regex.finditer(buffer, start):
+            if found.start() >= limit:
+                break
+            yield match_to_mac(found.group(), buffer_offset + found.start())
+            resume = max(resume, found.end())
+
+        context = buffer[max(resume - CONTEXT_LENGTH, 0) : resume]
+        carry = buffer[resume:]
+        base_offset = buffer_offset + resume
+
+    buffer = context + carry
+    for found in regex.finditer(buffer, len(context)):
+        yield match_to_mac(found.group(), base_offset - len(context) + found.start())
+
+
+def scan_file(
+    file_path: str,
+    chunk_size: int | None = None,
+    regex: Pattern[bytes] = SCAN_BYTES_REGEX,
+) -> Iterator[MacMatch]:
+    """
+    Yields every MAC address in a file, memory-mapping it unless a `chunk_size`
+    is given for streaming reads
+    """
+    with open(file_path, "rb") as file:
+        if chunk_size is not None:
+            yield from scan_stream(file, chunk_size, regex)
+            return
+
+        # Empty files cannot be mapped and contain nothing to find
+        if path.getsize(file_path) == 0:
+            return
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped_file:
+            yield from scan_bytes(mapped_file, regex=regex)
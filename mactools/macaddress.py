@@ -1,6 +1,8 @@
 # MacTools MAC Address Class
 
 # Python Modules
+from collections.abc import Buffer
+
 # Local Modules
 from mactools.basemac import BaseMac, MacNotation
 
@@ -13,7 +15,7 @@ class MacAddress(BaseMac):
 
     def __init__(
         self,
-        mac: str | int,
+        mac: str | int | Buffer,
         format: MacNotation = MacNotation.COLON,
         *args,
         **kwargs,
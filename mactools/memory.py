@@ -0,0 +1,190 @@
+# MacTools Memory Diagnostics
+
+# Python Modules
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from gc import get_referents
+from sys import getsizeof
+from tracemalloc import get_traced_memory, is_tracing, start, stop
+from types import MappingProxyType
+
+# Local Modules
+from mactools.basemac import BaseMac
+from mactools.macaddress import MacAddress
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_common import OUIType
+from mactools.oui_cache.oui_shared import SharedOUITier
+
+# Objects created per instance when timing allocations with `traced_size`
+TRACED_COUNT = 1000
+
+
+def _unwrap(mapping: Mapping) -> Mapping:
+    """
+    Returns the dictionary behind a read-only mapping proxy
+    """
+    if isinstance(mapping, MappingProxyType):
+        return get_referents(mapping)[0]
+    return mapping
+
+
+def tier_footprint(tier: Mapping[str, dict[str, str]]) -> dict[str, int]:
+    """
+    Returns the bytes held by one registry tier, split into the hash table,
+    keys, record dictionaries, vendor strings, address strings and any other
+    values. Objects shared between records are counted once.
+    """
+    if isinstance(tier, SharedOUITier):
+        # Keys and records live in the shared buffer rather than as objects
+        keys = tier._keys.nbytes
+        records = tier._offsets.nbytes + tier._offsets[-1]
+        return {
+            "entries": len(tier),
+            "container": getsizeof(tier),
+            "keys": keys,
+            "records": records,
+            "total": getsizeof(tier) + keys + records,
+        }
+
+    seen: set[int] = set()
+
+    def size(obj: object) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        return getsizeof(obj)
+
+    table = _unwrap(tier)
+    footprint = {
+        "entries": len(table),
+        "container": size(table),
+        "keys": sum(size(i) for i in table),
+        "records": 0,
+        "vendors": 0,
+        "addresses": 0,
+        "other": 0,
+    }
+    for record in table.values():
+        footprint["records"] += size(record)
+        for field, value in record.items():
+            if field == "vendor":
+                footprint["vendors"] += size(value)
+            elif field == "address":
+                footprint["addresses"] += size(value)
+            else:
+                footprint["other"] += size(field) + size(value)
+    footprint["total"] = sum(v for k, v in footprint.items() if k != "entries")
+    return footprint
+
+
+def cache_footprint(cache: OUICache) -> dict[str, int | dict[str, dict[str, int]]]:
+    """
+    Returns the memory of the loaded registry by `OUIType` tier
+    """
+    snapshot = cache.oui_dict
+    tiers = {
+        oui_type.value: tier_footprint(tier) for oui_type, tier in snapshot.items()
+    }
+    container = getsizeof(snapshot) + getsizeof(_unwrap(snapshot))
+    container += sum(
+        getsizeof(tier)
+        for tier in snapshot.values()
+        if isinstance(tier, MappingProxyType)
+    )
+    return {
+        "tiers": tiers,
+        "container": container,
+        "total": container + sum(i["total"] for i in tiers.values()),
+    }
+
+
+def cached_names(cls: type) -> list[str]:
+    """
+    Returns the names of every `cached_property` of a class
+    """
+    return [
+        name
+        for klass in reversed(cls.__mro__)
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    ]
+
+
+def instance_size(mac: BaseMac) -> int:
+    """
+    Returns the bytes owned by a MAC object: the instance, its attribute
+    dictionary and the strings and integers stored there. The OUI record,
+    cache and notation are shared with other objects and not counted.
+    """
+    values = {id(i): i for i in vars(mac).values() if isinstance(i, (str, int, bytes))}
+    return getsizeof(mac) + getsizeof(vars(mac)) + sum(map(getsizeof, values.values()))
+
+
+def mac_footprint(mac: BaseMac) -> dict[str, int | list[str]]:
+    """
+    Returns the size of a MAC object as created and once every cached property
+    has been populated, `mac` is left populated
+    """
+    names = cached_names(type(mac))
+    initial = instance_size(mac)
+    cached = [i for i in names if i in vars(mac)]
+    for name in names:
+        getattr(mac, name)
+    return {"initial": initial, "populated": instance_size(mac), "cached": cached}
+
+
+def traced_size(factory: Callable[[], object], count: int = TRACED_COUNT) -> int:
+    """
+    Returns the average bytes allocated per object by calling `factory` `count`
+    times with `tracemalloc` and keeping every result alive
+    """
+    tracing = is_tracing()
+    if not tracing:
+        start()
+    try:
+        before, _ = get_traced_memory()
+        kept = [factory() for _ in range(count)]
+        after, _ = get_traced_memory()
+        # Less the list holding the results
+        return (after - before - getsizeof(kept)) // count
+    finally:
+        if not tracing:
+            stop()
+
+
+def memory_report(cache: OUICache, traced: bool = True) -> dict[str, dict]:
+    """
+    Returns the registry footprint of `cache` and the per-instance size of
+    `BaseMac` and `MacAddress`, the MACs are built from the first MA-L entry so
+    construction stays local and `MacAddress` is left out if there is none.
+    `traced` adds `tracemalloc` averages over `TRACED_COUNT` fresh and fully
+    populated instances.
+    """
+    oui = next(iter(cache.oui_dict.get(OUIType.OUI, ())), None)
+    mac = f"{oui or '246D5E'}BB99CC"
+    classes: list[tuple[type[BaseMac], dict]] = [(BaseMac, {})]
+    if oui:
+        classes.append((MacAddress, {"cache": cache}))
+
+    def factory(
+        cls: type[BaseMac], kwargs: dict, populate: bool
+    ) -> Callable[[], BaseMac]:
+        def create() -> BaseMac:
+            instance = cls(mac, **kwargs)
+            if populate:
+                for name in cached_names(cls):
+                    getattr(instance, name)
+            return instance
+
+        return create
+
+    report: dict[str, dict] = {"oui_cache": cache_footprint(cache)}
+    for cls, kwargs in classes:
+        footprint = mac_footprint(cls(mac, **kwargs))
+        if traced:
+            footprint["traced_initial"] = traced_size(factory(cls, kwargs, False))
+            footprint["traced_populated"] = traced_size(factory(cls, kwargs, True))
+        report[cls.__name__] = footprint
+    return report
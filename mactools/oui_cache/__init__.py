@@ -3,3 +3,14 @@
 from mactools.oui_cache.oui_classes import OUICache as OUICache, OUIType as OUIType
 from mactools.oui_cache.oui_common import UPDATE_IEEE as UPDATE_IEEE
 from mactools.oui_cache.oui_core import get_oui_cache as get_oui_cache
+from mactools.oui_cache.oui_history import OUIHistory as OUIHistory
+from mactools.oui_cache.oui_overlay import OUIOverlay as OUIOverlay
+from mactools.oui_cache.oui_shared import (
+    SharedOUIRegistry as SharedOUIRegistry,
+    attach_oui_cache as attach_oui_cache,
+    share_oui_cache as share_oui_cache,
+)
+from mactools.oui_cache.oui_vendors import (
+    load_vendor_aliases as load_vendor_aliases,
+    vendor_id as vendor_id,
+)
@@ -1,15 +1,19 @@
 # OUI Cache Classes
 
 # Python Modules
+from collections.abc import Iterable, Mapping
 from datetime import datetime
-from json import load
+from json import loads
 from re import search
-from time import sleep
+from threading import Lock
+from time import perf_counter_ns, sleep
+from types import MappingProxyType
 from urllib.request import urlopen
 
 # Local Modules
 from mactools.mac_common import prepare_oui
 from mactools.oui_cache.oui_common import (
+    OUI_KEY_LENGTHS,
     UPDATE_IEEE,
     OUIType,
     create_oui_dict,
@@ -17,21 +21,60 @@ from mactools.oui_cache.oui_common import (
     mac_ranges,
     specific_macs,
 )
+from mactools.oui_cache.oui_stats import OUICacheStats
+from mactools.oui_cache.oui_vendors import normalize_aliases, record_vendor_id
 from mactools.tools_common import get_hex_value
+from mactools.tracing import trace
 from mactools.version import __version__
 
+# Read-only view of the registry tiers, see `freeze_oui_dict`
+OUISnapshot = Mapping[OUIType, Mapping[str, dict[str, str]]]
+
+
+def freeze_oui_dict(
+    oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]],
+) -> OUISnapshot:
+    """
+    Returns an immutable snapshot of an OUI dictionary, `dict` tiers are copied
+    so later changes to them are not visible through the snapshot while other
+    mappings (existing snapshots, shared-memory tables) are already read-only
+    """
+    return MappingProxyType(
+        {
+            oui_type: MappingProxyType(dict(tier)) if isinstance(tier, dict) else tier
+            for oui_type, tier in oui_dict.items()
+        }
+    )
+
 
 class OUICache:
     """
     Singleton for holding the OUI Cache
+
+    Look-ups read the current immutable snapshot without locking, writers build
+    a modified copy under `_write_lock` and swap it in with a single assignment
     """
 
     _instance = None
+    _instance_lock = Lock()
+
+    # Look-up statistics, `None` until `enable_stats` is called
+    _stats: OUICacheStats | None = None
+
+    # Snapshot and the `OUIVectorTable` built from it, see `oui_vector`
+    _vector_table: tuple | None = None
+
+    # Vendor keys of spelling variants to canonical keys, see `set_vendor_aliases`
+    vendor_aliases: Mapping[str, str] = MappingProxyType({})
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    instance._write_lock = Lock()
+                    cls._instance = instance
         return cls._instance
 
     @classmethod
@@ -45,30 +88,126 @@ class OUICache:
         self.attempt_update = attempt_update
         self.version: str = __version__
         self.timestamp: datetime = datetime.now()
-        self.oui_dict: dict[OUIType, dict[str, str]] = oui_dict
+        self._snapshot: OUISnapshot = freeze_oui_dict(oui_dict)
         self._initialized = True
 
-    def get_record(self, input_mac: str) -> dict[str, str]:
+    @property
+    def oui_dict(self) -> OUISnapshot:
+        """
+        Returns the current read-only snapshot of the registry tiers
+        """
+        return self._snapshot
+
+    @oui_dict.setter
+    def oui_dict(
+        self, oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]]
+    ) -> None:
+        self.swap_oui_dict(oui_dict)
+
+    def swap_oui_dict(
+        self, oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]]
+    ) -> None:
+        """
+        Replaces the whole registry with a new snapshot, readers holding the
+        previous snapshot finish their look-ups against it
+        """
+        with trace("cache_swap") as span:
+            snapshot = freeze_oui_dict(oui_dict)
+            with self._write_lock:
+                self._snapshot = snapshot
+                self.timestamp = datetime.now()
+            span.attributes["records"] = sum(map(len, snapshot.values()))
+
+    def add_record(self, oui_type: OUIType, oui: str, record: dict[str, str]) -> None:
+        """
+        Adds a single record using copy-on-write of the affected tier
+        """
+        with self._write_lock:
+            current = self._snapshot
+            tier = dict(current.get(oui_type, {}))
+            tier[oui] = record
+            updated = dict(current)
+            updated[oui_type] = MappingProxyType(tier)
+            self._snapshot = MappingProxyType(updated)
+            self.timestamp = datetime.now()
+
+    def set_vendor_aliases(self, aliases: Mapping[str, str]) -> None:
+        """
+        Sets the table of vendor name variants to canonical names merged by
+        `get_vendor_id`, see `oui_vendors.load_vendor_aliases`
+        """
+        self.vendor_aliases = MappingProxyType(normalize_aliases(aliases))
+
+    def enable_stats(self) -> None:
+        """
+        Starts counting look-ups by resolution path, with their latencies
+        """
+        if self._stats is None:
+            self._stats = OUICacheStats()
+
+    def disable_stats(self) -> None:
+        """
+        Stops counting look-ups and discards the statistics
+        """
+        self._stats = None
+
+    def stats(self) -> dict:
         """
-        Returns the assigned OUI and organization associated with a MAC or OUI
+        Returns the look-up counts and latency histograms of each resolution
+        path, remote API calls and registry rebuilds, or `{}` when disabled
+        """
+        return {} if self._stats is None else self._stats.to_dict()
+
+    def reset_stats(self) -> None:
+        """
+        Clears the statistics while leaving them enabled
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def get_record(self, input_mac: str, remote: bool = True) -> dict[str, str]:
+        """
+        Returns the assigned OUI and organization associated with a MAC or OUI,
+        `remote` allows asking the remote API about OUIs missing from the cache
+        """
+        stats = self._stats
+        if stats is None:
+            return self._resolve_record(input_mac, remote)[1]
+
+        start = perf_counter_ns()
+        try:
+            path, record = self._resolve_record(input_mac, remote)
+        except Exception:
+            # The remote API call or the registry rebuild it triggers failed,
+            # count the failure before passing it on
+            stats.add_lookup("remote_error", perf_counter_ns() - start)
+            raise
+        stats.add_lookup(path, perf_counter_ns() - start)
+        return record
+
+    def _resolve_record(
+        self, input_mac: str, remote: bool
+    ) -> tuple[str, dict[str, str] | None]:
+        """
+        Returns the record for `get_record` with the path that resolved it
         """
         oui = prepare_oui(input_mac)
 
         hex_value = get_hex_value(oui)
         if hex_value == -1:
-            return {
+            return "invalid_hex", {
                 "input": input_mac,
                 "error": True,
                 "note": "This is not a valid hex string",
             }
         if hex_value < 24:
-            return {
+            return "too_short", {
                 "input": input_mac,
                 "error": True,
                 "note": "OUI/MAC is shorter than 6 hex characters (24 bits) and too short to be any OUI",
             }
         if hex_value > 64:
-            return {
+            return "too_long", {
                 "input": input_mac,
                 "error": True,
                 "note": "OUI/MAC is longer than 16 hex characters (64 bits) and longer than MAC addresses can be",
@@ -92,76 +231,135 @@ class OUICache:
                     base_dict["vendor"] = info
                     return base_dict
 
-        func_dict = {
-            specific_macs.get: oui,
-            fixed_ouis.get: oui[:6],
-            check_range: oui,
-            check_locally_administered: oui,
-        }
+        func_list = [
+            ("specific_mac", specific_macs.get, oui),
+            ("fixed_oui", fixed_ouis.get, oui[:6]),
+            ("range", check_range, oui),
+            ("locally_administered", check_locally_administered, oui),
+        ]
 
-        for func, input_mac in func_dict.items():
+        for path, func, input_mac in func_list:
             result = func(input_mac)
             if isinstance(result, dict):
-                return result
+                return path, result
             elif isinstance(result, str):
                 base_dict["vendor"] = result
-                return base_dict
+                return path, base_dict
 
-        key_length_map = {OUIType.OUI36: 9, OUIType.OUI28: 7, OUIType.OUI: 6}
-
-        for oui_type, key_len in key_length_map.items():
-            inner_dict: dict[str, str] = self.oui_dict.get(oui_type)
+        # Bind the snapshot once so every tier is read from the same version
+        snapshot = self._snapshot
+        for oui_type, key_len in OUI_KEY_LENGTHS.items():
+            inner_dict = snapshot.get(oui_type, {})
             result = inner_dict.get(oui[:key_len])
             if result:
-                result["error"] = False
-                return result
+                # Records are shared between threads, hand out a copy
+                return oui_type.value, {**result, "error": False}
 
-        # Check to see if the record exists but isn't in the cache, in which trigger an update
-        with urlopen(f"https://api.maclookup.app/v2/macs/{input_mac}") as response:  # nosec B310
-            # Fall-through case for valid OUI without any registration
-            no_entry_note = "This OUI is valid but has no associated registration in the IEEE global registry (MA-L, MA-M, or MA-S)"
-            no_entry_dict = {
-                "oui": oui,
-                "vendor": "Unregistered",
-                "note": no_entry_note,
-            }
+        # Fall-through case for valid OUI without any registration
+        no_entry_note = "This OUI is valid but has no associated registration in the IEEE global registry (MA-L, MA-M, or MA-S)"
+        no_entry_dict = {
+            "oui": oui,
+            "vendor": "Unregistered",
+            "note": no_entry_note,
+        }
+        if not remote:
+            return "unregistered", no_entry_dict
 
+        # Check to see if the record exists but isn't in the cache, in which trigger an update
+        start = perf_counter_ns()
+        url = f"https://api.maclookup.app/v2/macs/{input_mac}"
+        with trace("remote_lookup", url=url) as span, urlopen(url) as response:  # nosec B310
             # Stateless delay to prevent 429 from the endpoint
             sleep(0.5)
-
+            span.attributes["status"] = response.code
+            result = None
             if response.code == 200:
-                result = load(response)
+                body = response.read()
+                span.bytes = len(body)
+                result = loads(body)
+        if self._stats is not None:
+            self._stats.add_remote_call(perf_counter_ns() - start)
+
+        if result is None:
+            return "remote_error", None
+        if not result["success"]:
+            return "remote_unregistered", no_entry_dict
 
-                if not result["success"]:
-                    return no_entry_dict
+        # Update the entire cache due to invalidation
+        if UPDATE_IEEE is True:
+            start = perf_counter_ns()
+            self.swap_oui_dict(create_oui_dict(update=True))
+            if self._stats is not None:
+                self._stats.add_rebuild(perf_counter_ns() - start)
 
-                # Update the entire cache due to invalidation
-                if UPDATE_IEEE is True:
-                    self.oui_dict = create_oui_dict(update=True)
+        if not result["found"]:
+            return "remote_unregistered", no_entry_dict
 
-                if not result["found"]:
-                    return no_entry_dict
+        api_oui = result["macPrefix"]
+        vendor = result["company"]
 
-                api_oui = result["macPrefix"]
-                vendor = result["company"]
+        # Add it to the run-time cache of which assumes MA-L entries currently
+        # This is chosen when not completely updating the whole cache
+        if UPDATE_IEEE is False:
+            self.add_record(
+                OUIType("MA-L"),
+                api_oui,
+                {
+                    "vendor": vendor,
+                    "oui": api_oui,
+                    "address": result["address"],
+                },
+            )
 
-                # Add it to the run-time cache of which assumes MA-L entries currently
-                # This is chosen when not completely updating the whole cache
-                if UPDATE_IEEE is False:
-                    self.oui_dict[OUIType("MA-L")][api_oui] = {
-                        "vendor": vendor,
-                        "oui": api_oui,
-                        "address": result["address"],
-                    }
+        return "remote", {"oui": api_oui, "vendor": vendor}
 
-                return {"oui": api_oui, "vendor": vendor}
+    def get_records(
+        self, input_macs: Iterable[str], remote: bool = True
+    ) -> list[dict[str, str]]:
+        """
+        Returns the records for many MACs or OUIs in order, resolving each
+        distinct input once so repeated inputs share the same record
+        """
+        resolved: dict[str, dict[str, str]] = {}
+        records = []
+        for input_mac in input_macs:
+            if input_mac not in resolved:
+                resolved[input_mac] = self.get_record(input_mac, remote)
+            records.append(resolved[input_mac])
+        return records
 
-    def get_vendor(self, input_mac: str) -> str:
+    def get_vendor(self, input_mac: str, remote: bool = True) -> str:
         """
         Returns the organization associated with an assignment
         """
-        record_dict = self.get_record(input_mac)
+        record_dict = self.get_record(input_mac, remote)
         if record_dict:
             if record_dict.get("error"):
                 raise ValueError(record_dict["error"])
             return record_dict.get("vendor")
+
+    def get_vendor_id(self, input_mac: str, remote: bool = True) -> int:
+        """
+        Returns the stable integer ID of the organization associated with an
+        assignment, see `oui_vendors.vendor_id`
+        """
+        record_dict = self.get_record(input_mac, remote)
+        if record_dict:
+            if record_dict.get("error"):
+                raise ValueError(record_dict["error"])
+            return record_vendor_id(record_dict, self.vendor_aliases)
+
+    def get_vendor_ids(
+        self, input_macs: Iterable[str], remote: bool = True
+    ) -> list[int | None]:
+        """
+        Returns the vendor IDs for many MACs or OUIs in order, `None` for
+        invalid input
+        """
+        aliases = self.vendor_aliases
+        return [
+            None
+            if not record or record.get("error")
+            else record_vendor_id(record, aliases)
+            for record in self.get_records(input_macs, remote)
+        ]
@@ -8,6 +8,7 @@ from os import path, remove
 from tempfile import gettempdir
 
 # Local Modules
+from mactools.tracing import trace
 from mactools.update_ieee import update_ieee_files
 
 BASE_IEEE_PATH = files("mactools").joinpath("resources/ieee")
@@ -29,6 +30,14 @@ class OUIType(Enum):
     OUI = "MA-L"
 
 
+# Length of the assignment keys in each registry in hex characters, most specific first
+OUI_KEY_LENGTHS: dict[OUIType, int] = {
+    OUIType.OUI36: 9,
+    OUIType.OUI28: 7,
+    OUIType.OUI: 6,
+}
+
+
 fixed_ouis: dict[str, str] = {
     "FFFFFF": "Broadcast",
     "0180C2": "STP/LLDP/CFM",
@@ -126,29 +135,40 @@ def process_ieee_csv(file_path: str) -> dict[OUIType, dict[str, str]]:
         update_ieee_files()
         return process_ieee_csv(file_path)
 
-    entries = {}
-    for record in records:
-        assignment_type, oui, vendor, address = record
-        entries[oui] = {"vendor": vendor, "oui": oui, "address": address}
+    with trace("csv_parse", file=file_path) as span:
+        span.bytes = len(contents.getvalue())
+        entries = {}
+        for record in records:
+            assignment_type, oui, vendor, address = record
+            entries[oui] = {"vendor": vendor, "oui": oui, "address": address}
+        span.attributes["records"] = len(entries)
 
     return {OUIType(assignment_type): entries}
 
 
-def create_oui_dict(update: bool = False) -> dict[OUIType, dict[str, str]]:
+def create_oui_dict(
+    update: bool = False, file_paths: list[str] | None = None
+) -> dict[OUIType, dict[str, str]]:
     """
-    Creates the dictionary used in the cache object from the IEEE CSV files
+    Creates the dictionary used in the cache object from the IEEE CSV files,
+    `file_paths` reads other copies of them without checking for updates
     """
-    if update is True:
-        update_ieee_files()
+    if file_paths is not None:
+        for file_path in file_paths:
+            if not path.exists(file_path):
+                raise FileNotFoundError(file_path)
+    else:
+        if update is True:
+            update_ieee_files()
 
-    file_paths = handle_paths()
+        file_paths = handle_paths()
 
-    for file_path in file_paths:
-        if not path.exists(file_path):
-            update_ieee_files(overwrite=False)
+        for file_path in file_paths:
+            if not path.exists(file_path):
+                update_ieee_files(overwrite=False)
 
-    for file_path in file_paths:
-        process_ieee_csv(file_path)
+        for file_path in file_paths:
+            process_ieee_csv(file_path)
 
     with Executor(max_workers=3) as executor:
         oui_dicts = executor.map(process_ieee_csv, file_paths)
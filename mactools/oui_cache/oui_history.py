@@ -0,0 +1,259 @@
+# OUI Cache Registry History
+
+# Python Modules
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+from gzip import open as gzip_open
+from json import dump, load
+from os import makedirs, path, replace
+from threading import Lock
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUICache, OUISnapshot
+from mactools.oui_cache.oui_common import OUIType, create_oui_dict
+
+INDEX_FILE = "index.json"
+HISTORY_FORMAT = 1
+
+# Versions between full copies of the registry, bounding the files read per look-up
+KEYFRAME_INTERVAL = 16
+
+
+def _pack_record(record: Mapping[str, str]) -> list[str]:
+    return [record.get("vendor", ""), record.get("address", "")]
+
+
+def _unpack_record(oui: str, packed: list[str]) -> dict[str, str]:
+    return {"vendor": packed[0], "oui": oui, "address": packed[1]}
+
+
+def _local_time(moment: datetime) -> datetime:
+    """
+    Returns `moment` as a naive local time like `datetime.now()`, the form
+    versions are stored in, converting aware datetimes
+    """
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone().replace(tzinfo=None)
+
+
+def _as_datetime(as_of: date | datetime) -> datetime:
+    """
+    Returns `as_of` as a naive local datetime, a plain date covers the whole day
+    """
+    if isinstance(as_of, datetime):
+        return _local_time(as_of)
+    return datetime.combine(as_of, time.max)
+
+
+class ArchivedOUICache(OUICache):
+    """
+    Read-only `OUICache` over one archived registry version, kept outside the
+    singleton and never asking the remote API, which only knows the present
+    """
+
+    def __new__(cls, *args, **kwargs):
+        instance = object.__new__(cls)
+        instance._write_lock = Lock()
+        return instance
+
+    def __init__(self, oui_dict: OUISnapshot, fetched: datetime) -> None:
+        super().__init__(oui_dict, attempt_update=False)
+        self.timestamp = fetched
+
+    def get_record(self, input_mac: str, remote: bool = False) -> dict[str, str]:
+        """
+        Returns the archived record, `remote` is ignored
+        """
+        return super().get_record(input_mac, False)
+
+
+class OUIHistory:
+    """
+    Successive IEEE registry versions stored in a directory, indexed by fetch
+    date. Every `keyframe_interval`-th version is a full copy and the others
+    are gzipped deltas against the previous version, so answering as of a date
+    reads one keyframe and at most `keyframe_interval - 1` deltas.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        cached_versions: int = 2,
+    ) -> None:
+        self.directory = directory
+        self.keyframe_interval = keyframe_interval
+        self.cached_versions = cached_versions
+        self._lock = Lock()
+        self._caches: OrderedDict[int, ArchivedOUICache] = OrderedDict()
+
+        index_path = path.join(directory, INDEX_FILE)
+        self._entries: list[dict[str, str | int | bool]] = []
+        if path.exists(index_path):
+            with open(index_path, encoding="utf-8") as file:
+                index = load(file)
+            if index.get("format") != HISTORY_FORMAT:
+                raise ValueError(f"{directory} is not a MacTools registry history")
+            self._entries = index["versions"]
+        self._fetched = [
+            _local_time(datetime.fromisoformat(i["fetched"])) for i in self._entries
+        ]
+
+    @property
+    def versions(self) -> list[datetime]:
+        """
+        Returns the fetch dates of the stored versions, oldest first
+        """
+        return list(self._fetched)
+
+    def _version_path(self, version: int) -> str:
+        return path.join(self.directory, self._entries[version]["file"])
+
+    def _read_version(self, version: int) -> dict:
+        with gzip_open(self._version_path(version), "rt", encoding="utf-8") as file:
+            return load(file)
+
+    def _write_json(self, file_path: str, data: dict, compress: bool) -> None:
+        temp_path = f"{file_path}.tmp"
+        opener = gzip_open if compress else open
+        with opener(temp_path, "wt", encoding="utf-8") as file:
+            dump(data, file, separators=(",", ":"))
+        replace(temp_path, file_path)
+
+    def _materialize(self, version: int) -> dict[OUIType, dict[str, dict]]:
+        """
+        Rebuilds one version from its keyframe and the deltas after it
+        """
+        keyframe = version
+        while not self._entries[keyframe]["keyframe"]:
+            keyframe -= 1
+
+        oui_dict: dict[OUIType, dict[str, dict]] = {}
+        for i in range(keyframe, version + 1):
+            stored = self._read_version(i)
+            for oui_type, tier_data in stored["tiers"].items():
+                tier = oui_dict.setdefault(OUIType(oui_type), {})
+                for oui in tier_data.get("removed", ()):
+                    tier.pop(oui, None)
+                for oui, packed in tier_data["set"].items():
+                    tier[oui] = _unpack_record(oui, packed)
+        return oui_dict
+
+    def _version_as_of(self, as_of: date | datetime) -> int:
+        version = bisect_right(self._fetched, _as_datetime(as_of)) - 1
+        if version < 0:
+            raise ValueError(f"No registry version was fetched as of {as_of}")
+        return version
+
+    def get_cache(self, as_of: date | datetime) -> ArchivedOUICache:
+        """
+        Returns a read-only cache of the newest version fetched on or before
+        `as_of`, recently used versions are kept in memory
+        """
+        with self._lock:
+            version = self._version_as_of(as_of)
+            cache = self._caches.get(version)
+            if cache is None:
+                cache = ArchivedOUICache(
+                    self._materialize(version), self._fetched[version]
+                )
+                self._caches[version] = cache
+                while len(self._caches) > self.cached_versions:
+                    self._caches.popitem(last=False)
+            else:
+                self._caches.move_to_end(version)
+            return cache
+
+    def get_record(self, input_mac: str, as_of: date | datetime) -> dict[str, str]:
+        """
+        Returns the record of a MAC or OUI as the registry stood at `as_of`
+        """
+        return self.get_cache(as_of).get_record(input_mac)
+
+    def get_vendor(self, input_mac: str, as_of: date | datetime) -> str:
+        """
+        Returns the organization an assignment belonged to at `as_of`
+        """
+        return self.get_cache(as_of).get_vendor(input_mac)
+
+    def add_snapshot(
+        self,
+        oui_dict: Mapping[OUIType, Mapping[str, Mapping[str, str]]],
+        fetched: datetime | None = None,
+    ) -> bool:
+        """
+        Stores a registry version fetched at `fetched` (default: now), returning
+        `False` without storing anything when nothing changed since the last one.
+        Aware datetimes are converted to naive local time.
+        """
+        with self._lock:
+            last = self._fetched[-1] if self._fetched else None
+            if fetched is None:
+                # Two fetches within the clock's resolution still get distinct times
+                fetched = datetime.now()
+                if last is not None and fetched <= last:
+                    fetched = last + timedelta(microseconds=1)
+            else:
+                fetched = _local_time(fetched)
+
+            version = len(self._entries)
+            keyframe = version % self.keyframe_interval == 0
+            previous = {} if version == 0 else self._materialize(version - 1)
+
+            tiers = {}
+            changes = version == 0
+            for oui_type in OUIType:
+                tier = oui_dict.get(oui_type, {})
+                old_tier = previous.get(oui_type, {})
+                packed = {oui: _pack_record(record) for oui, record in tier.items()}
+                changed = {
+                    oui: record
+                    for oui, record in packed.items()
+                    if old_tier.get(oui) is None
+                    or _pack_record(old_tier[oui]) != record
+                }
+                removed = [oui for oui in old_tier if oui not in tier]
+                changes = changes or bool(changed or removed)
+                if keyframe:
+                    tiers[oui_type.value] = {"set": packed}
+                elif changed or removed:
+                    tiers[oui_type.value] = {"set": changed, "removed": removed}
+
+            if not changes:
+                return False
+            if last is not None and fetched <= last:
+                raise ValueError("Registry versions must be added in fetch order")
+
+            makedirs(self.directory, exist_ok=True)
+            file_name = f"{version:06d}.json.gz"
+            self._write_json(
+                path.join(self.directory, file_name), {"tiers": tiers}, compress=True
+            )
+            self._entries.append(
+                {
+                    "fetched": fetched.isoformat(),
+                    "file": file_name,
+                    "keyframe": keyframe,
+                    "records": sum(map(len, oui_dict.values())),
+                }
+            )
+            self._fetched.append(fetched)
+            self._write_json(
+                path.join(self.directory, INDEX_FILE),
+                {"format": HISTORY_FORMAT, "versions": self._entries},
+                compress=False,
+            )
+            return True
+
+    def add_files(
+        self, file_paths: list[str] | None = None, fetched: datetime | None = None
+    ) -> bool:
+        """
+        Stores the registry in the IEEE CSV files (default: the installed ones)
+        """
+        return self.add_snapshot(create_oui_dict(file_paths=file_paths), fetched)
@@ -0,0 +1,188 @@
+# OUI Cache Overlays
+
+# Python Modules
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from types import MappingProxyType
+
+# Local Modules
+from mactools.mac_common import prepare_oui
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_vendors import record_vendor_id
+from mactools.tools_common import DELIMITER_TABLE, get_hex_value
+
+# Overlay prefixes run from a single octet to a whole EUI-64
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 16
+
+
+def clean_prefix(prefix: str) -> str:
+    """
+    Returns a prefix without delimiters in upper case, raising `ValueError`
+    unless it is 2 to 16 hex characters
+    """
+    clean = prefix.strip().translate(DELIMITER_TABLE).upper()
+    if get_hex_value(clean) == -1 or not (
+        MIN_PREFIX_LENGTH <= len(clean) <= MAX_PREFIX_LENGTH
+    ):
+        raise ValueError(f"{prefix} is not a valid overlay prefix")
+    return clean
+
+
+class OUIOverlay:
+    """
+    Site-specific records stacked on a shared `OUICache`, or on another overlay,
+    without copying it. Prefixes of any length from one octet to a whole MAC are
+    checked before the base, longest first.
+
+    Each layer indexes its prefix lengths by first octet, so a MAC outside the
+    overlay costs one probe per layer and only the lengths present under its
+    octet are tried otherwise. The input is parsed once for the whole stack.
+    """
+
+    # Records and the arrays built from them, see `oui_vector`
+    _vector_table: tuple | None = None
+
+    def __init__(
+        self,
+        base: OUICache | OUIOverlay,
+        records: Mapping[str, str | dict[str, str]] | None = None,
+    ) -> None:
+        self.base = base
+        self._write_lock = Lock()
+        # Records and the prefix lengths under each first octet, longest
+        # first, swapped together
+        self._layer: tuple[
+            Mapping[str, dict[str, str]], Mapping[str, tuple[int, ...]]
+        ] = (MappingProxyType({}), MappingProxyType({}))
+        if records:
+            self.update(records)
+
+    @property
+    def records(self) -> Mapping[str, dict[str, str]]:
+        """
+        Returns the read-only records of this layer by clean prefix
+        """
+        return self._layer[0]
+
+    def _swap(self, records: dict[str, dict[str, str]]) -> None:
+        octets: dict[str, set[int]] = {}
+        for prefix in records:
+            octets.setdefault(prefix[:MIN_PREFIX_LENGTH], set()).add(len(prefix))
+        index = {i: tuple(sorted(j, reverse=True)) for i, j in octets.items()}
+        self._layer = (MappingProxyType(records), MappingProxyType(index))
+
+    def update(self, records: Mapping[str, str | dict[str, str]]) -> None:
+        """
+        Adds or replaces records by prefix, a record may be given as its vendor
+        """
+        prepared = {}
+        for prefix, record in records.items():
+            clean = clean_prefix(prefix)
+            if isinstance(record, str):
+                record = {"vendor": record}
+            prepared[clean] = {**record, "oui": clean}
+        with self._write_lock:
+            self._swap({**self._layer[0], **prepared})
+
+    def add_record(self, prefix: str, record: str | dict[str, str]) -> None:
+        """
+        Adds or replaces a single record
+        """
+        self.update({prefix: record})
+
+    def remove_record(self, prefix: str) -> None:
+        """
+        Removes a record of this layer so the prefix resolves from the base
+        """
+        clean = clean_prefix(prefix)
+        with self._write_lock:
+            records = dict(self._layer[0])
+            if records.pop(clean, None) is not None:
+                self._swap(records)
+
+    def layers(self) -> tuple[list[OUIOverlay], OUICache]:
+        """
+        Returns the overlays from the top down and the cache beneath them
+        """
+        overlays: list[OUIOverlay] = []
+        layer: OUICache | OUIOverlay = self
+        while isinstance(layer, OUIOverlay):
+            overlays.append(layer)
+            layer = layer.base
+        return overlays, layer
+
+    def get_record(self, input_mac: str, remote: bool = True) -> dict[str, str]:
+        """
+        Returns the record of the top layer with a matching prefix, the longest
+        within it, or the base cache's record
+        """
+        overlays, base = self.layers()
+        mac = None
+        for overlay in overlays:
+            records, index = overlay._layer
+            if not index:
+                continue
+            if mac is None:
+                mac = prepare_oui(input_mac)
+                # Invalid input falls through to the base for its error record
+                if not 24 <= get_hex_value(mac) <= 64:
+                    break
+            for length in index.get(mac[:MIN_PREFIX_LENGTH], ()):
+                record = records.get(mac[:length]) if len(mac) >= length else None
+                if record is not None:
+                    return {**record, "error": False}
+        return base.get_record(input_mac, remote)
+
+    def get_records(
+        self, input_macs: Iterable[str], remote: bool = True
+    ) -> list[dict[str, str]]:
+        """
+        Returns the records for many MACs or OUIs in order, resolving each
+        distinct input once
+        """
+        resolved: dict[str, dict[str, str]] = {}
+        records = []
+        for input_mac in input_macs:
+            if input_mac not in resolved:
+                resolved[input_mac] = self.get_record(input_mac, remote)
+            records.append(resolved[input_mac])
+        return records
+
+    def get_vendor(self, input_mac: str, remote: bool = True) -> str:
+        """
+        Returns the organization associated with an assignment
+        """
+        record_dict = self.get_record(input_mac, remote)
+        if record_dict:
+            if record_dict.get("error"):
+                raise ValueError(record_dict["error"])
+            return record_dict.get("vendor")
+
+    def get_vendor_id(self, input_mac: str, remote: bool = True) -> int:
+        """
+        Returns the stable integer ID of the organization associated with an
+        assignment, merging variants with the base cache's aliases
+        """
+        record_dict = self.get_record(input_mac, remote)
+        if record_dict:
+            if record_dict.get("error"):
+                raise ValueError(record_dict["error"])
+            return record_vendor_id(record_dict, self.layers()[1].vendor_aliases)
+
+    def get_vendor_ids(
+        self, input_macs: Iterable[str], remote: bool = True
+    ) -> list[int | None]:
+        """
+        Returns the vendor IDs for many MACs or OUIs in order, `None` for
+        invalid input
+        """
+        aliases = self.layers()[1].vendor_aliases
+        return [
+            None
+            if not record or record.get("error")
+            else record_vendor_id(record, aliases)
+            for record in self.get_records(input_macs, remote)
+        ]
@@ -0,0 +1,293 @@
+# OUI Cache Shared Memory Tables
+
+# Python Modules
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from mmap import ACCESS_READ, mmap
+from multiprocessing.shared_memory import SharedMemory
+from os import fsync, path, replace
+from struct import Struct
+from sys import version_info
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_common import OUI_KEY_LENGTHS, OUIType
+
+# Layout: file header, one header per tier, then for each tier the sorted keys
+# (uint64), the record offsets (uint32, count + 1) and the UTF-8 record blob
+MAGIC = b"MTOUI001"
+FILE_HEADER = Struct("<8sI4x")
+TIER_HEADER = Struct("<4sII4xQQQ")
+RECORD_SEPARATOR = "\x00"
+
+
+def _align(offset: int, size: int = 8) -> int:
+    return (offset + size - 1) // size * size
+
+
+def _map_read_only(shared_memory: SharedMemory) -> mmap:
+    """
+    Returns a read-only mapping of a shared memory block and closes the block's
+    own writable mapping, which cannot be closed while the tables are in use
+    """
+    fd: int = getattr(shared_memory, "_fd", -1)
+    if fd >= 0:
+        mapped_file = mmap(fd, shared_memory.size, access=ACCESS_READ)
+    else:
+        # Windows named mappings are identified by their tag name
+        mapped_file = mmap(
+            -1,
+            shared_memory.size,
+            tagname=shared_memory.name,
+            access=ACCESS_READ,  # pyright: ignore[reportCallIssue]
+        )
+    shared_memory.close()
+    return mapped_file
+
+
+def pack_oui_dict(oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]]) -> bytes:
+    """
+    Serializes an OUI dictionary into the flat layout read by `SharedOUITier`
+    """
+    packed_tiers = []
+    for oui_type, tier in oui_dict.items():
+        key_len = OUI_KEY_LENGTHS[oui_type]
+        keys: list[int] = []
+        offsets: list[int] = [0]
+        blob = bytearray()
+        for oui in sorted(tier, key=lambda x: int(x, 16)):
+            if len(oui) != key_len:
+                raise ValueError(f"{oui} is not a valid {oui_type.value} assignment")
+            record = tier[oui]
+            keys.append(int(oui, 16))
+            blob += f"{record.get('vendor', '')}{RECORD_SEPARATOR}{record.get('address', '')}".encode()
+            offsets.append(len(blob))
+        packed_tiers.append((oui_type, key_len, keys, offsets, bytes(blob)))
+
+    offset = _align(FILE_HEADER.size + TIER_HEADER.size * len(packed_tiers))
+    headers = []
+    sections = []
+    for oui_type, key_len, keys, offsets, blob in packed_tiers:
+        keys_offset = offset
+        offsets_offset = _align(keys_offset + 8 * len(keys))
+        blob_offset = offsets_offset + 4 * len(offsets)
+        headers.append(
+            TIER_HEADER.pack(
+                oui_type.value.encode(),
+                key_len,
+                len(keys),
+                keys_offset,
+                offsets_offset,
+                blob_offset,
+            )
+        )
+        sections.append((keys_offset, Struct(f"<{len(keys)}Q").pack(*keys)))
+        sections.append((offsets_offset, Struct(f"<{len(offsets)}I").pack(*offsets)))
+        sections.append((blob_offset, blob))
+        offset = _align(blob_offset + len(blob))
+
+    packed = bytearray(offset)
+    FILE_HEADER.pack_into(packed, 0, MAGIC, len(headers))
+    for i, header in enumerate(headers):
+        start = FILE_HEADER.size + i * TIER_HEADER.size
+        packed[start : start + TIER_HEADER.size] = header
+    for start, section in sections:
+        packed[start : start + len(section)] = section
+    return bytes(packed)
+
+
+class SharedOUITier(Mapping[str, dict[str, str]]):
+    """
+    Read-only registry tier resolved by binary search over a shared buffer
+    """
+
+    def __init__(
+        self,
+        owner: SharedOUIRegistry,
+        buffer: memoryview,
+        oui_type: OUIType,
+        key_len: int,
+        count: int,
+        keys_offset: int,
+        offsets_offset: int,
+        blob_offset: int,
+    ) -> None:
+        # The owner keeps the underlying shared memory or mmap open
+        self._owner = owner
+        self.oui_type = oui_type
+        self.key_len = key_len
+        self._keys = buffer[keys_offset : keys_offset + 8 * count].cast("Q")
+        self._offsets = buffer[offsets_offset : offsets_offset + 4 * (count + 1)].cast(
+            "I"
+        )
+        self._blob = buffer[blob_offset:]
+
+    def _record(self, index: int) -> dict[str, str]:
+        start, end = self._offsets[index], self._offsets[index + 1]
+        vendor, address = str(self._blob[start:end], "utf-8").split(RECORD_SEPARATOR, 1)
+        oui = f"{self._keys[index]:0{self.key_len}X}"
+        return {"vendor": vendor, "oui": oui, "address": address}
+
+    def _index(self, oui: str) -> int:
+        if len(oui) != self.key_len:
+            return -1
+        try:
+            key = int(oui, 16)
+        except ValueError:
+            return -1
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return -1
+
+    def get(self, oui: str, default=None):  # pyright: ignore[reportIncompatibleMethodOverride]
+        index = self._index(oui)
+        return default if index == -1 else self._record(index)
+
+    def __getitem__(self, oui: str) -> dict[str, str]:
+        index = self._index(oui)
+        if index == -1:
+            raise KeyError(oui)
+        return self._record(index)
+
+    def __contains__(self, oui: object) -> bool:
+        return isinstance(oui, str) and self._index(oui) != -1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._keys:
+            yield f"{key:0{self.key_len}X}"
+
+
+class SharedOUIRegistry:
+    """
+    OUI registry tables held in shared memory or a memory-mapped file so that
+    every process attaching to them reads the same physical pages
+    """
+
+    def __init__(
+        self, mapped_file: mmap, shared_memory: SharedMemory | None = None
+    ) -> None:
+        # `shared_memory` is only kept for its name and `unlink`, the tables are
+        # read through this object's own read-only mapping
+        self._shared_memory = shared_memory
+        self._mapped_file = mapped_file
+        self._buffer = memoryview(mapped_file)
+        self.tiers: dict[OUIType, SharedOUITier] = self._read_tiers()
+
+    @property
+    def name(self) -> str | None:
+        """
+        Returns the shared memory block name to hand to worker processes
+        """
+        return self._shared_memory.name if self._shared_memory else None
+
+    @property
+    def size(self) -> int:
+        return len(self._buffer)
+
+    def _read_tiers(self) -> dict[OUIType, SharedOUITier]:
+        magic, tier_count = FILE_HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Buffer does not contain a MacTools OUI table")
+
+        tiers = {}
+        for i in range(tier_count):
+            raw_type, key_len, count, *offsets = TIER_HEADER.unpack_from(
+                self._buffer, FILE_HEADER.size + i * TIER_HEADER.size
+            )
+            oui_type = OUIType(raw_type.decode())
+            tiers[oui_type] = SharedOUITier(
+                self, self._buffer, oui_type, key_len, count, *offsets
+            )
+        return tiers
+
+    @classmethod
+    def create(
+        cls,
+        oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]],
+        name: str | None = None,
+    ) -> SharedOUIRegistry:
+        """
+        Packs `oui_dict` into a new shared memory block, the creating process
+        owns the block and should `unlink` it once the workers are finished
+        """
+        packed = pack_oui_dict(oui_dict)
+        shared_memory = SharedMemory(name=name, create=True, size=len(packed))
+        shared_memory.buf[: len(packed)] = packed
+        return cls(_map_read_only(shared_memory), shared_memory=shared_memory)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedOUIRegistry:
+        """
+        Attaches read-only to a block made by `create` in another process
+        """
+        if version_info >= (3, 13):
+            shared_memory = SharedMemory(name=name, track=False)  # pyright: ignore[reportCallIssue]
+        else:
+            # Before 3.13 attaching registers the block with the resource tracker,
+            # which is harmless for pool workers sharing the creator's tracker
+            shared_memory = SharedMemory(name=name)
+        return cls(_map_read_only(shared_memory))
+
+    @classmethod
+    def write_file(
+        cls, oui_dict: Mapping[OUIType, Mapping[str, dict[str, str]]], file_path: str
+    ) -> None:
+        """
+        Writes the packed tables to `file_path`, replacing any previous file atomically
+        """
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(pack_oui_dict(oui_dict))
+            file.flush()
+            fsync(file.fileno())
+        replace(temp_path, file_path)
+
+    @classmethod
+    def open_file(cls, file_path: str) -> SharedOUIRegistry:
+        """
+        Maps a file made by `write_file` read-only, the page cache is shared by
+        every process mapping the same file
+        """
+        if not path.exists(file_path):
+            raise FileNotFoundError(file_path)
+        with open(file_path, "rb") as file:
+            return cls(mmap(file.fileno(), 0, access=ACCESS_READ))
+
+    def unlink(self) -> None:
+        """
+        Removes the shared memory block, attached processes keep their mapping
+        """
+        if self._shared_memory:
+            self._shared_memory.unlink()
+
+
+def share_oui_cache(
+    cache: OUICache | None = None, name: str | None = None
+) -> SharedOUIRegistry:
+    """
+    Copies the registry of `cache` (default: the global cache) into shared memory
+    """
+    if cache is None:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+    return SharedOUIRegistry.create(cache.oui_dict, name)
+
+
+def attach_oui_cache(source: str) -> OUICache:
+    """
+    Points this process' `OUICache` at a shared registry, `source` is either a
+    shared memory block name or the path of a file from `write_file`.
+    Usable directly as a `multiprocessing.Pool` initializer.
+    """
+    if path.exists(source):
+        registry = SharedOUIRegistry.open_file(source)
+    else:
+        registry = SharedOUIRegistry.attach(source)
+    return OUICache(registry.tiers, attempt_update=False)
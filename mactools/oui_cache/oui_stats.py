@@ -0,0 +1,166 @@
+# OUI Cache Look-up Statistics
+
+# Python Modules
+from __future__ import annotations
+
+from collections import Counter
+from threading import Lock, local
+
+# Resolution paths of `OUICache.get_record` in the order they are tried, the
+# registry tiers are named by their `OUIType` value
+LOOKUP_PATHS = [
+    "invalid_hex",
+    "too_short",
+    "too_long",
+    "specific_mac",
+    "fixed_oui",
+    "range",
+    "locally_administered",
+    "MA-S",
+    "MA-M",
+    "MA-L",
+    "unregistered",
+    "remote",
+    "remote_unregistered",
+    "remote_error",
+]
+ERROR_PATHS = frozenset(["invalid_hex", "too_short", "too_long", "remote_error"])
+
+# Bucket `i` counts durations below 2**i nanoseconds, the last one has no bound
+HISTOGRAM_BUCKETS = 40
+
+
+class LatencyHistogram:
+    """
+    Power-of-two histogram of durations in nanoseconds
+    """
+
+    __slots__ = ("buckets", "count", "max_ns", "total_ns")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns: int) -> None:
+        self.buckets[min(duration_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for i, bucket in enumerate(other.buckets):
+            self.buckets[i] += bucket
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Returns the upper bound in nanoseconds of the bucket holding `fraction`
+        of the durations, 0 when empty
+        """
+        target = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket and seen >= target:
+                return min(1 << i, self.max_ns)
+        return 0
+
+    def to_dict(self) -> dict[str, int | dict[int, int]]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.percentile(0.5),
+            "p99_ns": self.percentile(0.99),
+            # Upper bound of each non-empty bucket to its count
+            "buckets": {1 << i: n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+class _LookupShard:
+    """
+    Look-up counters written by a single thread
+    """
+
+    __slots__ = ("latencies", "lookups")
+
+    def __init__(self) -> None:
+        self.lookups: Counter[str] = Counter()
+        self.latencies: dict[str, LatencyHistogram] = {}
+
+
+class OUICacheStats:
+    """
+    Counters and latency histograms for each resolution path of an `OUICache`,
+    plus remote API calls and registry rebuilds
+
+    Look-ups are counted in per-thread shards so the hot path takes no lock,
+    the shards are merged when the statistics are read. A thread's shard is
+    kept after it exits, one per thread that ever looked up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # Threads holding a shard of the previous generation drop it
+            self._local = local()
+            self._shards: list[_LookupShard] = []
+            self.remote_calls = LatencyHistogram()
+            self.rebuilds = LatencyHistogram()
+
+    def _new_shard(self) -> _LookupShard:
+        thread_local = self._local
+        shard = thread_local.shard = _LookupShard()
+        with self._lock:
+            if self._local is thread_local:
+                self._shards.append(shard)
+        return shard
+
+    def add_lookup(self, path: str, duration_ns: int) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard.lookups[path] += 1
+        histogram = shard.latencies.get(path)
+        if histogram is None:
+            histogram = shard.latencies[path] = LatencyHistogram()
+        histogram.add(duration_ns)
+
+    def add_remote_call(self, duration_ns: int) -> None:
+        with self._lock:
+            self.remote_calls.add(duration_ns)
+
+    def add_rebuild(self, duration_ns: int) -> None:
+        with self._lock:
+            self.rebuilds.add(duration_ns)
+
+    def to_dict(self) -> dict:
+        """
+        Returns a JSON-serializable copy of every counter and histogram
+        """
+        with self._lock:
+            lookups: Counter[str] = Counter()
+            latencies: dict[str, LatencyHistogram] = {}
+            for shard in self._shards:
+                # Shards are written by their threads meanwhile, copy before merging
+                lookups.update(dict(shard.lookups))
+                for path, histogram in list(shard.latencies.items()):
+                    latencies.setdefault(path, LatencyHistogram()).merge(histogram)
+            return {
+                "lookups": sum(lookups.values()),
+                "errors": sum(lookups[i] for i in ERROR_PATHS),
+                "paths": {i: lookups[i] for i in LOOKUP_PATHS if lookups[i]},
+                "latency": {
+                    path: histogram.to_dict() for path, histogram in latencies.items()
+                },
+                "remote_calls": self.remote_calls.to_dict(),
+                "rebuilds": self.rebuilds.to_dict(),
+            }
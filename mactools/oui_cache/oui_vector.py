@@ -0,0 +1,304 @@
+# OUI Cache Vectorized Look-ups
+#
+# Optional, needs `numpy`
+
+# Python Modules
+from __future__ import annotations
+
+from collections.abc import Mapping
+from re import compile as re_compile
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# Local Modules
+from mactools.oui_cache.oui_common import (
+    OUI_KEY_LENGTHS,
+    fixed_ouis,
+    mac_ranges,
+    specific_macs,
+)
+from mactools.oui_cache.oui_overlay import OUIOverlay
+from mactools.oui_cache.oui_vendors import vendor_id
+
+if TYPE_CHECKING:
+    from mactools.oui_cache.oui_classes import OUICache, OUISnapshot
+
+# Vendor ID 0 is the fall-through for valid MACs without a registration
+UNREGISTERED = "Unregistered"
+LOCALLY_ADMINISTERED = "Locally administered"
+
+# MACs resolved per pass, bounding the temporaries for very large inputs
+CHUNK_SIZE = 1 << 20
+
+# `mac_ranges` patterns are literal hex followed by a run of any hex digits
+RANGE_PATTERN = re_compile(r"([0-9A-Fa-f]+)\[0-9A-Fa-f\](?:\{(\d+)\})?")
+
+
+def _sorted_table(keys: list[int], ids: list[int]) -> tuple[np.ndarray, np.ndarray]:
+    key_array = np.array(keys, np.uint64)
+    order = np.argsort(key_array, kind="stable")
+    return key_array[order], np.array(ids, np.int32)[order]
+
+
+def _probe(keys: np.ndarray, ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the ID of each value found in the sorted `keys`, -1 for the rest
+    """
+    if not len(keys):
+        return np.full(len(values), -1, np.int32)
+    index = np.searchsorted(keys, values)
+    index[index == len(keys)] = 0
+    return np.where(keys[index] == values, ids[index], -1)
+
+
+class OUIVectorTable:
+    """
+    Registry snapshot held as sorted integer prefix arrays, resolving whole
+    arrays of integer MACs with `searchsorted`. Rules are applied as masks in
+    the order `OUICache.get_record` tries them: specific MACs, fixed OUIs,
+    ranges, locally administered, then MA-S, MA-M and MA-L.
+    """
+
+    def __init__(self, oui_dict: OUISnapshot | Mapping) -> None:
+        self._vendor_ids: dict[str, int] = {UNREGISTERED: 0}
+        # Alias table and the stable `oui_vendors` ID of each table ID's vendor
+        self._stable_ids: tuple[Mapping[str, str] | None, np.ndarray] | None = None
+
+        self.specific = _sorted_table(
+            [int(i, 16) for i in specific_macs],
+            [self._vendor_id(i) for i in specific_macs.values()],
+        )
+        self.fixed = _sorted_table(
+            [int(i, 16) for i in fixed_ouis],
+            [self._vendor_id(i) for i in fixed_ouis.values()],
+        )
+        self.ranges: list[tuple[int, int, int, int]] = []
+        for pattern, vendor in mac_ranges.items():
+            literal, wildcards = RANGE_PATTERN.fullmatch(pattern).groups()
+            self.ranges.append(
+                (
+                    int(literal, 16),
+                    len(literal),
+                    int(wildcards or 1),
+                    self._vendor_id(vendor),
+                )
+            )
+        self.local_id = self._vendor_id(LOCALLY_ADMINISTERED)
+
+        # Longest prefixes first, as in `OUI_KEY_LENGTHS`
+        self.tiers: list[tuple[int, np.ndarray, np.ndarray]] = []
+        for oui_type, key_len in OUI_KEY_LENGTHS.items():
+            tier = oui_dict.get(oui_type, {})
+            keys, ids = [], []
+            for oui, record in tier.items():
+                keys.append(int(oui, 16))
+                ids.append(self._vendor_id(record.get("vendor", UNREGISTERED)))
+            self.tiers.append((key_len * 4, *_sorted_table(keys, ids)))
+
+        self.vendors = np.array(list(self._vendor_ids), dtype=object)
+
+    def _vendor_id(self, vendor: str) -> int:
+        return self._vendor_ids.setdefault(vendor, len(self._vendor_ids))
+
+    def vendor_ids(self, macs: np.ndarray, eui: int = 48) -> np.ndarray:
+        """
+        Returns the `int32` vendor ID of every MAC in a `uint64` array, indexing
+        `vendors`, with 0 for unregistered MACs
+        """
+        macs = np.asarray(macs, np.uint64).ravel()
+        ids = np.empty(len(macs), np.int32)
+        for start in range(0, len(macs), CHUNK_SIZE):
+            chunk = macs[start : start + CHUNK_SIZE]
+            ids[start : start + len(chunk)] = self._resolve(chunk, eui)
+        return ids
+
+    def vendor_names(self, macs: np.ndarray, eui: int = 48) -> np.ndarray:
+        """
+        Returns the vendor of every MAC in a `uint64` array as an object array
+        """
+        return self.vendors[self.vendor_ids(macs, eui)]
+
+    def stable_vendor_ids(
+        self,
+        macs: np.ndarray,
+        eui: int = 48,
+        aliases: Mapping[str, str] | None = None,
+    ) -> np.ndarray:
+        """
+        Returns the stable `int64` vendor ID of every MAC in a `uint64` array,
+        see `oui_vendors.vendor_id`. The IDs of the table's vendors are hashed
+        on first use and again only when `aliases` changes.
+        """
+        stable = self._stable_ids
+        if stable is None or stable[0] is not aliases:
+            ids = [vendor_id(i, aliases) for i in self.vendors.tolist()]
+            stable = (aliases, np.array(ids, np.int64))
+            self._stable_ids = stable
+        return stable[1][self.vendor_ids(macs, eui)]
+
+    def _resolve(self, macs: np.ndarray, eui: int) -> np.ndarray:
+        nibbles = eui // 4
+        ids = np.full(len(macs), -1, np.int32)
+
+        def apply(found: np.ndarray) -> None:
+            pending = ids == -1
+            ids[pending] = found[pending]
+
+        # Specific MACs only match addresses of their own length
+        if nibbles == 12:
+            apply(_probe(*self.specific, macs))
+        apply(_probe(*self.fixed, macs >> np.uint64(eui - 24)))
+
+        # Ranges are searched for anywhere in the hex string, like `re.search`,
+        # reusing one window buffer across every offset
+        window = np.empty_like(macs)
+        hit = np.empty(len(macs), bool)
+        for literal, length, wildcards, range_id in self.ranges:
+            matched = np.zeros(len(macs), bool)
+            for offset in range(nibbles - length - wildcards + 1):
+                np.right_shift(macs, np.uint64(4 * (nibbles - offset - length)), window)
+                np.bitwise_and(window, np.uint64((1 << 4 * length) - 1), window)
+                np.equal(window, literal, hit)
+                matched |= hit
+            ids[matched & (ids == -1)] = range_id
+
+        np.right_shift(macs, np.uint64(eui - 8), window)
+        local = (window & np.uint64(0x02)).astype(bool)
+        ids[local & (ids == -1)] = self.local_id
+
+        for bits, keys, tier_ids in self.tiers:
+            pending = np.flatnonzero(ids == -1)
+            if not len(pending):
+                break
+            ids[pending] = _probe(
+                keys, tier_ids, macs[pending] >> np.uint64(eui - bits)
+            )
+
+        ids[ids == -1] = 0
+        return ids
+
+
+def get_vector_table(cache: OUICache | None = None) -> OUIVectorTable:
+    """
+    Returns the vector table of the cache's current snapshot (default: the
+    global cache), built once per snapshot
+    """
+    if cache is None:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+    if isinstance(cache, OUIOverlay):
+        raise TypeError("Overlays have no vector table, use `lookup_vendors`")
+
+    snapshot = cache.oui_dict
+    built = cache._vector_table
+    if built is None or built[0] is not snapshot:
+        built = (snapshot, OUIVectorTable(snapshot))
+        cache._vector_table = built
+    return built[1]
+
+
+def get_overlay_table(
+    overlay: OUIOverlay,
+) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Returns the records of one overlay layer as sorted prefix arrays with their
+    vendors, longest prefixes first, built once per version of the layer
+    """
+    records = overlay.records
+    built = overlay._vector_table
+    if built is None or built[0] is not records:
+        by_length: dict[int, list[tuple[int, str]]] = {}
+        for prefix, record in records.items():
+            by_length.setdefault(len(prefix), []).append(
+                (int(prefix, 16), record.get("vendor"))
+            )
+        tables = []
+        for length in sorted(by_length, reverse=True):
+            keys, vendors = zip(*sorted(by_length[length]))
+            tables.append(
+                (length, np.array(keys, np.uint64), np.array(vendors, dtype=object))
+            )
+        built = (records, tables)
+        overlay._vector_table = built
+    return built[1]
+
+
+def lookup_vendor_ids(
+    macs: np.ndarray, cache: OUICache | None = None, eui: int = 48
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the vendor ID of every MAC in a `uint64` array and the vendor names
+    the IDs index
+    """
+    table = get_vector_table(cache)
+    return table.vendor_ids(macs, eui), table.vendors
+
+
+def _apply_overlays(
+    macs: np.ndarray, overlay: OUIOverlay, names: np.ndarray, eui: int
+) -> np.ndarray:
+    """
+    Overwrites the base cache's vendor `names` with the overlay layers', top
+    layer first, returning the mask of MACs an overlay resolved
+    """
+    resolved = np.zeros(len(macs), bool)
+    for layer in overlay.layers()[0]:
+        for length, keys, vendors in get_overlay_table(layer):
+            if length * 4 > eui:
+                continue
+            prefixes = macs >> np.uint64(eui - length * 4)
+            index = np.searchsorted(keys, prefixes)
+            index[index == len(keys)] = 0
+            hit = (keys[index] == prefixes) & ~resolved
+            names[hit] = vendors[index[hit]]
+            resolved |= hit
+    return resolved
+
+
+def lookup_vendors(
+    macs: np.ndarray, cache: OUICache | OUIOverlay | None = None, eui: int = 48
+) -> np.ndarray:
+    """
+    Returns the vendor of every MAC in a `uint64` array as an object array,
+    overlays are applied from the top down over their base cache's table
+    """
+    if not isinstance(cache, OUIOverlay):
+        return get_vector_table(cache).vendor_names(macs, eui)
+
+    macs = np.asarray(macs, np.uint64).ravel()
+    names = get_vector_table(cache.layers()[1]).vendor_names(macs, eui)
+    _apply_overlays(macs, cache, names, eui)
+    return names
+
+
+def lookup_stable_vendor_ids(
+    macs: np.ndarray, cache: OUICache | OUIOverlay | None = None, eui: int = 48
+) -> np.ndarray:
+    """
+    Returns the stable `int64` vendor ID of every MAC in a `uint64` array, for
+    grouping and joining on `oui_vendors.vendor_id`, with spelling variants
+    merged by the base cache's `vendor_aliases`
+    """
+    if cache is None:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+    if not isinstance(cache, OUIOverlay):
+        return get_vector_table(cache).stable_vendor_ids(
+            macs, eui, cache.vendor_aliases
+        )
+
+    base = cache.layers()[1]
+    macs = np.asarray(macs, np.uint64).ravel()
+    ids = get_vector_table(base).stable_vendor_ids(macs, eui, base.vendor_aliases)
+    names = np.empty(len(macs), dtype=object)
+    resolved = _apply_overlays(macs, cache, names, eui)
+    if resolved.any():
+        overlay_names = names[resolved].tolist()
+        overlay_ids = {
+            i: vendor_id(i or "", base.vendor_aliases) for i in set(overlay_names)
+        }
+        ids[resolved] = [overlay_ids[i] for i in overlay_names]
+    return ids
@@ -0,0 +1,113 @@
+# OUI Cache Vendor IDs
+
+# Python Modules
+from collections.abc import Mapping
+from csv import reader
+from functools import lru_cache
+from hashlib import blake2b
+from re import compile as re_compile
+
+# Trailing words dropped when comparing vendor names, "Cisco Systems, Inc" and
+# "CISCO SYSTEMS INC." share a key
+LEGAL_SUFFIXES = frozenset(
+    {
+        "ab",
+        "ag",
+        "bhd",
+        "bv",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "kg",
+        "kk",
+        "limited",
+        "llc",
+        "lp",
+        "ltd",
+        "oy",
+        "plc",
+        "pte",
+        "pty",
+        "sa",
+        "sdn",
+        "spa",
+        "srl",
+    }
+)
+NON_WORD = re_compile(r"[\W_]+")
+
+
+# The registries hold about 40,000 distinct vendor spellings
+@lru_cache(maxsize=65536)
+def vendor_key(vendor: str) -> str:
+    """
+    Returns the comparison key of a vendor name: case-folded words without
+    punctuation or trailing legal suffixes
+    """
+    words = NON_WORD.sub(" ", vendor.casefold()).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_aliases(aliases: Mapping[str, str]) -> dict[str, str]:
+    """
+    Returns an alias table of spelling variants to canonical names as the
+    vendor keys used by `vendor_id`
+    """
+    return {vendor_key(i): vendor_key(j) for i, j in aliases.items()}
+
+
+def load_vendor_aliases(file_path: str) -> dict[str, str]:
+    """
+    Reads an alias table from a two column CSV of variant and canonical name
+    """
+    with open(file_path, encoding="utf-8", newline="") as file:
+        return {row[0]: row[1] for row in reader(file) if len(row) >= 2}
+
+
+def vendor_id(vendor: str, aliases: Mapping[str, str] | None = None) -> int:
+    """
+    Returns the stable ID of a vendor name, a non-negative 63-bit integer that
+    is the same in every process and registry version. `aliases` comes from
+    `normalize_aliases` and maps spelling variants onto one ID.
+
+    IDs are hashed rather than numbered so they need no shared table and do
+    not shift as the registry changes. 63 bits keep them within `int64` (numpy,
+    pandas `Int64`, SQL `BIGINT`) and make a collision among the registry's
+    vendors about a one in ten billion event.
+    """
+    key = vendor_key(vendor)
+    if aliases:
+        key = aliases.get(key, key)
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big") >> 1
+
+
+def record_vendor_id(
+    record: Mapping[str, str], aliases: Mapping[str, str] | None = None
+) -> int:
+    """
+    Returns the vendor ID of a record, derived from its vendor name
+    """
+    return vendor_id(record.get("vendor", ""), aliases)
+
+
+def vendor_names(
+    oui_dict: Mapping[object, Mapping[str, Mapping[str, str]]],
+    aliases: Mapping[str, str] | None = None,
+) -> dict[int, str]:
+    """
+    Returns the most common spelling of each vendor ID in a registry, for
+    labelling results grouped by ID
+    """
+    counts: dict[int, dict[str, int]] = {}
+    for tier in oui_dict.values():
+        for record in tier.values():
+            spellings = counts.setdefault(record_vendor_id(record, aliases), {})
+            vendor = record.get("vendor", "")
+            spellings[vendor] = spellings.get(vendor, 0) + 1
+    return {i: max(spellings, key=spellings.get) for i, spellings in counts.items()}
@@ -0,0 +1,420 @@
+# MacTools OUI Look-up Server
+#
+# One warm process holds the registry and answers look-ups for a whole host
+# over a TCP line protocol, every request is one line and so is its response:
+#
+#   V <mac>,<mac>,...   ->  JSON array of vendors, `null` for invalid input
+#   R <mac>,<mac>,...   ->  JSON array of records as returned by `get_record`
+#
+# Connections are kept open and requests may be pipelined, responses are sent
+# in request order. Look-ups never ask the remote API.
+
+# Python Modules
+from __future__ import annotations
+
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Queue,
+    Server,
+    StreamReader,
+    StreamWriter,
+    Task,
+    gather,
+    get_running_loop,
+    open_connection,
+    run,
+    start_server,
+    wait_for,
+)
+from collections import deque
+from importlib.util import find_spec
+from json import dumps, loads
+from re import compile as re_compile
+from typing import TYPE_CHECKING, Self
+
+# Local Modules
+from mactools.tools_common import DELIMITER_TABLE
+
+if TYPE_CHECKING:
+    from mactools.oui_cache.oui_classes import OUICache
+    from mactools.oui_cache.oui_overlay import OUIOverlay
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8470
+
+# Longest request line, the stream default of 64 KiB holds only ~3500 MACs
+MAX_LINE = 16 * 1024 * 1024
+
+# Requests answered per response pipelined on one connection before reading
+# stops, bounding the memory a fast client can tie up
+MAX_PIPELINE = 1024
+
+HEX_48 = re_compile(r"[0-9A-Fa-f]{12}")
+
+
+def _lookup_vendors(
+    cache: OUICache | OUIOverlay, macs: list[str]
+) -> dict[str, str | None]:
+    """
+    Returns the vendor of each distinct MAC, whole 48-bit MACs are resolved
+    together on the vector table when `numpy` is installed
+    """
+    vendors: dict[str, str | None] = {}
+    vector_macs: list[str] = []
+    vector_values: list[int] = []
+    for mac in dict.fromkeys(macs):
+        clean = mac.translate(DELIMITER_TABLE)
+        if HAS_NUMPY and HEX_48.fullmatch(clean):
+            vector_macs.append(mac)
+            vector_values.append(int(clean, 16))
+            continue
+        record = cache.get_record(mac, False)
+        vendors[mac] = None if not record or record.get("error") else record["vendor"]
+
+    if vector_macs:
+        import numpy as np
+
+        from mactools.oui_cache.oui_vector import lookup_vendors
+
+        names = lookup_vendors(np.array(vector_values, np.uint64), cache)
+        vendors.update(zip(vector_macs, names.tolist()))
+    return vendors
+
+
+class LookupBatcher:
+    """
+    Coalesces the look-ups of every request received in the same pass of the
+    event loop (or within `delay` seconds) into one batch
+    """
+
+    def __init__(
+        self, cache: OUICache | OUIOverlay, delay: float = 0.0, max_batch: int = 65536
+    ) -> None:
+        self.cache = cache
+        self.delay = delay
+        self.max_batch = max_batch
+        self._pending: list[tuple[str, list[str], Future]] = []
+        self._size = 0
+        self._scheduled = False
+        self.batches = 0
+
+    def submit(self, kind: str, macs: list[str]) -> Future:
+        """
+        Queues a look-up and returns the future of its response line
+        """
+        loop = get_running_loop()
+        future = loop.create_future()
+        self._pending.append((kind, macs, future))
+        self._size += len(macs)
+        if self._size >= self.max_batch:
+            self.flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            self._schedule(loop)
+        return future
+
+    def _schedule(self, loop: AbstractEventLoop) -> None:
+        if self.delay:
+            loop.call_later(self.delay, self.flush)
+        else:
+            loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """
+        Resolves every queued look-up as one batch
+        """
+        pending, self._pending = self._pending, []
+        self._size = 0
+        self._scheduled = False
+        if not pending:
+            return
+        self.batches += 1
+
+        vendor_macs = [mac for kind, macs, _ in pending if kind == "V" for mac in macs]
+        record_macs = [mac for kind, macs, _ in pending if kind == "R" for mac in macs]
+        try:
+            vendors = _lookup_vendors(self.cache, vendor_macs) if vendor_macs else {}
+            records = dict(zip(record_macs, self.cache.get_records(record_macs, False)))
+        except Exception as error:  # noqa: BLE001
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for kind, macs, future in pending:
+            if future.done():
+                continue
+            resolved = vendors if kind == "V" else records
+            future.set_result(
+                dumps([resolved[i] for i in macs], separators=(",", ":")) + "\n"
+            )
+
+
+def _parse_request(line: bytes) -> tuple[str, list[str]]:
+    """
+    Returns the kind and MACs of a request line, raising `ValueError`
+    """
+    text = line.decode("utf-8", "replace").strip()
+    kind, _, body = text.partition(" ")
+    if kind not in ("V", "R"):
+        raise ValueError(f"Unknown request {kind!r}, expected V or R")
+    return kind, [i.strip() for i in body.split(",") if i.strip()]
+
+
+def _error_line(message: str) -> str:
+    return dumps({"error": message}) + "\n"
+
+
+class OUIServer:
+    """
+    asyncio TCP server answering look-ups from one shared cache
+    """
+
+    def __init__(
+        self,
+        cache: OUICache | OUIOverlay | None = None,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        batch_delay: float = 0.0,
+        max_batch: int = 65536,
+        idle_timeout: float | None = 300.0,
+    ) -> None:
+        if cache is None:
+            from mactools.oui_cache.oui_core import get_oui_cache
+
+            cache = get_oui_cache()
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.batcher = LookupBatcher(cache, batch_delay, max_batch)
+        self._server: Server | None = None
+        self._writers: set[StreamWriter] = set()
+
+    async def start(self) -> None:
+        """
+        Starts listening, with `port=0` the bound port is stored on `port`
+        """
+        self._server = await start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Serves until cancelled, starting the server if needed
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops listening and closes the kept-alive connections
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        # Requests are read ahead of their responses, which a second task
+        # writes back in order as the batches resolve
+        responses: Queue[Future | str | None] = Queue(MAX_PIPELINE)
+        sender = get_running_loop().create_task(self._send(responses, writer))
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    line = await wait_for(reader.readline(), self.idle_timeout)
+                except (TimeoutError, ConnectionError):
+                    break
+                except ValueError:
+                    await responses.put(_error_line("Request line is too long"))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    kind, macs = _parse_request(line)
+                except ValueError as error:
+                    await responses.put(_error_line(str(error)))
+                    continue
+                await responses.put(self.batcher.submit(kind, macs))
+        finally:
+            await responses.put(None)
+            await sender
+            self._writers.discard(writer)
+
+    async def _send(
+        self, responses: Queue[Future | str | None], writer: StreamWriter
+    ) -> None:
+        # After the client goes away the queue is still drained, so the reading
+        # side never blocks on a full queue
+        connected = True
+        while (response := await responses.get()) is not None:
+            if isinstance(response, Future):
+                try:
+                    response = await response
+                except Exception as error:  # noqa: BLE001
+                    response = _error_line(str(error))
+            if not connected:
+                continue
+            try:
+                writer.write(response.encode())
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+        writer.close()
+
+
+class _ClientConnection:
+    """
+    One pipelined connection, responses resolve the oldest waiting request
+    """
+
+    def __init__(self, reader: StreamReader, writer: StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.waiting: deque[Future] = deque()
+        self.receiver = get_running_loop().create_task(self._receive())
+
+    async def _receive(self) -> None:
+        error: Exception = ConnectionError("Connection closed by the server")
+        try:
+            # A cancelled request still has its response line consumed, keeping
+            # the later responses matched to their requests
+            while line := await self.reader.readline():
+                future = self.waiting.popleft()
+                if not future.done():
+                    future.set_result(line)
+        except Exception as exc:  # noqa: BLE001
+            error = exc
+        while self.waiting:
+            future = self.waiting.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    @property
+    def closed(self) -> bool:
+        return self.receiver.done()
+
+    async def request(self, line: bytes) -> bytes:
+        future = get_running_loop().create_future()
+        self.waiting.append(future)
+        self.writer.write(line)
+        await self.writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self.receiver
+
+
+class OUIClient:
+    """
+    asyncio client for `OUIServer`, requests are spread over a pool of
+    kept-alive connections and pipelined on each
+    """
+
+    def __init__(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, pool_size: int = 4
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        # Each slot holds the task opening its connection, so requests made
+        # while it connects all wait on the same task
+        self._connections: list[Task[_ClientConnection] | None] = [None] * pool_size
+        self._next = 0
+
+    async def _open(self) -> _ClientConnection:
+        reader, writer = await open_connection(self.host, self.port, limit=MAX_LINE)
+        return _ClientConnection(reader, writer)
+
+    async def _connection(self) -> _ClientConnection:
+        index = self._next
+        self._next = (index + 1) % self.pool_size
+        task = self._connections[index]
+        if task is None or (
+            task.done()
+            and (task.cancelled() or task.exception() or task.result().closed)
+        ):
+            task = get_running_loop().create_task(self._open())
+            self._connections[index] = task
+        return await task
+
+    async def _request(self, kind: str, macs: list[str]) -> list:
+        if any("," in i or "\n" in i for i in macs):
+            raise ValueError("MACs may not contain commas or line breaks")
+        connection = await self._connection()
+        response = loads(
+            await connection.request(f"{kind} {','.join(macs)}\n".encode())
+        )
+        if not isinstance(response, dict):
+            return response
+        raise ValueError(response["error"])
+
+    async def get_vendors(self, macs: list[str]) -> list[str | None]:
+        """
+        Returns the vendor of each MAC in order, `None` for invalid input
+        """
+        return await self._request("V", macs)
+
+    async def get_records(self, macs: list[str]) -> list[dict]:
+        """
+        Returns the registry record of each MAC in order
+        """
+        return await self._request("R", macs)
+
+    async def get_vendor(self, mac: str) -> str | None:
+        return (await self.get_vendors([mac]))[0]
+
+    async def get_record(self, mac: str) -> dict:
+        return (await self.get_records([mac]))[0]
+
+    async def close(self) -> None:
+        """
+        Closes every pooled connection
+        """
+        tasks = [i for i in self._connections if i is not None]
+        self._connections = [None] * self.pool_size
+        connections = await gather(*tasks, return_exceptions=True)
+        await gather(
+            *(i.close() for i in connections if isinstance(i, _ClientConnection))
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def run_server(
+    cache: OUICache | OUIOverlay | None = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    **kwargs,
+) -> None:
+    """
+    Serves look-ups until interrupted
+    """
+    run(OUIServer(cache, host, port, **kwargs).serve_forever())
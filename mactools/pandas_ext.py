@@ -0,0 +1,477 @@
+# MacTools Pandas and Arrow Integration
+#
+# Optional, needs `pandas` (and `pyarrow` for the Arrow type). Importing this
+# module registers the `mac` and `mac64` dtypes and the `Series.mac` accessor.
+
+# Python Modules
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from re import compile as re_compile
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# Local Modules
+from mactools.basemac import BaseMac, MacNotation
+from mactools.oui_cache.oui_common import mac_ranges, specific_macs
+from mactools.oui_cache.oui_vector import lookup_stable_vendor_ids
+from mactools.oui_cache.oui_vector import lookup_vendors as lookup_vector_vendors
+from mactools.tools_common import DELIMITER_TABLE
+
+if TYPE_CHECKING:
+    from mactools.oui_cache.oui_classes import OUICache
+    from mactools.oui_cache.oui_overlay import OUIOverlay
+
+# Leading 16 bits of the specific MACs and ranges, addresses under them are
+# resolved individually rather than by their 36-bit block
+SPECIAL_PREFIXES = np.array(
+    sorted({int(i[:4], 16) for i in [*specific_macs, *mac_ranges]}), np.uint64
+)
+
+
+def parse_macs(values: Iterable[Any], eui: int = 48) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the `uint64` values and missing mask of MAC strings, integers or
+    `BaseMac` objects. Strings are joined, cleaned and decoded in a single
+    `bytes.fromhex` call rather than one object per row.
+    """
+    size = eui // 4
+    if isinstance(values, MacArray):
+        return values._data.copy(), values._mask.copy()
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        data = values.astype(np.uint64)
+        if len(data) and (values.min() < 0 or data.max() >> eui):
+            raise ValueError(f"Integers out of range for EUI-{eui}")
+        return data, np.zeros(len(data), bool)
+
+    objects = np.asarray(values, dtype=object).ravel()
+    mask = np.asarray(pd.isna(objects), bool)
+    data = np.zeros(len(objects), np.uint64)
+    text_rows = np.flatnonzero(~mask)
+    texts = objects[text_rows]
+    try:
+        joined = "\n".join(texts)
+    except TypeError:
+        # Integers and `BaseMac` objects are converted row by row
+        is_text = np.fromiter((isinstance(i, str) for i in texts), bool, len(texts))
+        for row in text_rows[~is_text]:
+            value = objects[row]
+            if isinstance(value, BaseMac):
+                value = value.decimal
+            if not isinstance(value, (int, np.integer)) or not 0 <= value < 1 << eui:
+                raise ValueError(f"{value!r} is not a valid EUI-{eui} MAC address")
+            data[row] = value
+        text_rows, texts = text_rows[is_text], texts[is_text]
+        joined = "\n".join(texts)
+
+    if len(texts):
+        for char in [":", ".", "-", " "]:
+            joined = joined.replace(char, "")
+        try:
+            # Line breaks fall between whole bytes and are skipped by `fromhex`
+            raw = bytes.fromhex(joined)
+        except ValueError:
+            raw = b""
+        # Every address has `size` digits when the breaks sit exactly between them
+        valid = (
+            len(joined) == len(texts) * (size + 1) - 1
+            and len(raw) * 2 == size * len(texts)
+            and joined[size :: size + 1] == "\n" * (len(texts) - 1)
+        )
+        if not valid:
+            pattern = re_compile(f"[0-9A-Fa-f]{{{size}}}")
+            bad = next(
+                i for i in texts if not pattern.fullmatch(i.translate(DELIMITER_TABLE))
+            )
+            raise ValueError(f"{bad!r} is not a valid EUI-{eui} MAC address")
+        octets = np.zeros((len(texts), 8), np.uint8)
+        octets[:, 8 - eui // 8 :] = np.frombuffer(raw, np.uint8).reshape(-1, eui // 8)
+        data[text_rows] = octets.view(">u8").ravel()
+    return data, mask
+
+
+def format_values(
+    values: np.ndarray,
+    size: int,
+    notation: MacNotation = MacNotation.CLEAN,
+    lower: bool = False,
+) -> list[str]:
+    """
+    Returns the low `size` bytes of each value as hex in `notation`, formatting
+    the whole array in a single `bytes.hex` call
+    """
+    if not len(values):
+        return []
+    octets = values.astype(">u8").view(np.uint8).reshape(-1, 8)[:, 8 - size :]
+    raw = octets.tobytes()
+    separator = notation.value
+    group = 2 if notation == MacNotation.PERIOD else 1
+    text = raw.hex(separator, group) if separator else raw.hex()
+    text = text if lower else text.upper()
+
+    # Records are joined by the same separator as their groups
+    length = size * 2 + (size // group - 1) * len(separator)
+    step = length + len(separator)
+    return [text[i : i + length] for i in range(0, len(text), step)]
+
+
+def lookup_vendors(
+    values: np.ndarray,
+    eui: int = 48,
+    cache: OUICache | OUIOverlay | None = None,
+    remote: bool = False,
+) -> np.ndarray:
+    """
+    Returns the vendor of each MAC value as an object array. Local look-ups run
+    on the cache's `OUIVectorTable` (and overlay tables), while `remote` look-ups resolve every
+    distinct 36-bit block (the longest registry prefix) once through the cache.
+    """
+    if not remote:
+        return lookup_vector_vendors(values, cache, eui)
+    if cache is None:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+
+    shift = np.uint64(eui - 36)
+    blocks = values >> shift << shift
+    special = np.isin(values >> np.uint64(eui - 16), SPECIAL_PREFIXES)
+    keys = np.where(special, values, blocks)
+    uniques, inverse = np.unique(keys, return_inverse=True)
+
+    records = cache.get_records(format_values(uniques, eui // 8), remote)
+    vendors = [
+        None if not record or record.get("error") else record.get("vendor")
+        for record in records
+    ]
+    return np.array(vendors, object)[inverse.ravel()]
+
+
+@register_extension_dtype
+class MacDtype(ExtensionDtype):
+    """
+    MAC addresses stored as `uint64`, `mac` for EUI-48 and `mac64` for EUI-64
+    """
+
+    type = int
+    na_value = pd.NA
+    _metadata = ("eui",)
+
+    def __init__(self, eui: int = 48) -> None:
+        if eui not in [48, 64]:
+            raise ValueError(f"EUI must be 48 or 64, not {eui}")
+        self.eui = eui
+
+    @property
+    def name(self) -> str:
+        return "mac" if self.eui == 48 else "mac64"
+
+    def __repr__(self) -> str:
+        return f"MacDtype(eui={self.eui})"
+
+    @classmethod
+    def construct_array_type(cls) -> type[MacArray]:
+        return MacArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> MacDtype:
+        if not isinstance(string, str):
+            raise TypeError(f"Expects a string, got {type(string).__name__}")
+        eui = {"mac": 48, "mac48": 48, "mac64": 64}.get(string)
+        if eui is None:
+            raise TypeError(f"Cannot construct a 'MacDtype' from '{string}'")
+        return cls(eui)
+
+    def __from_arrow__(self, array: Any) -> MacArray:
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        data, mask = [], []
+        for chunk in chunks:
+            if isinstance(chunk, pa.ExtensionArray):
+                chunk = chunk.storage
+            data.append(chunk.fill_null(0).to_numpy().astype(np.uint64))
+            mask.append(chunk.is_null().to_numpy(zero_copy_only=False))
+        if not chunks:
+            return MacArray(np.zeros(0, np.uint64), np.zeros(0, bool), self)
+        return MacArray(np.concatenate(data), np.concatenate(mask), self)
+
+
+class MacArray(ExtensionArray):
+    """
+    Column of MAC addresses as a `uint64` array and a missing-value mask,
+    elements are read back as integers
+    """
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray, dtype: MacDtype) -> None:
+        self._data = np.asarray(values, np.uint64)
+        self._mask = np.asarray(mask, bool)
+        self._dtype = dtype
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Iterable[Any], *, dtype: Any = None, copy: bool = False
+    ) -> MacArray:
+        if isinstance(dtype, str):
+            dtype = MacDtype.construct_from_string(dtype)
+        if not isinstance(dtype, MacDtype):
+            dtype = scalars.dtype if isinstance(scalars, MacArray) else MacDtype()
+        return cls(*parse_macs(scalars, dtype.eui), dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings: Sequence[str], *, dtype: Any = None, copy: bool = False
+    ) -> MacArray:
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values: np.ndarray, original: MacArray) -> MacArray:
+        return cls._from_sequence(values, dtype=original.dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[MacArray]) -> MacArray:
+        return cls(
+            np.concatenate([i._data for i in to_concat]),
+            np.concatenate([i._mask for i in to_concat]),
+            to_concat[0].dtype,
+        )
+
+    @property
+    def dtype(self) -> MacDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes + self._mask.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, (int, np.integer)):
+            return pd.NA if self._mask[item] else int(self._data[item])
+        item = check_array_indexer(self, item)
+        return type(self)(self._data[item], self._mask[item], self._dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if pd.api.types.is_scalar(value):
+            value = [value]
+        data, mask = parse_macs(value, self._dtype.eui)
+        self._data[key] = data if len(data) > 1 else data[0]
+        self._mask[key] = mask if len(mask) > 1 else mask[0]
+
+    def __eq__(self, other: object) -> pd.arrays.BooleanArray:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if pd.api.types.is_scalar(other):
+            if pd.isna(other):
+                return pd.arrays.BooleanArray(
+                    np.zeros(len(self), bool), np.ones(len(self), bool)
+                )
+            data, mask = parse_macs([other], self._dtype.eui)
+        else:
+            data, mask = parse_macs(other, self._dtype.eui)
+        return pd.arrays.BooleanArray(self._data == data, self._mask | mask)
+
+    def __ne__(self, other: object) -> pd.arrays.BooleanArray:  # pyright: ignore[reportIncompatibleMethodOverride]
+        result = self.__eq__(other)
+        return result if result is NotImplemented else ~result
+
+    def isna(self) -> np.ndarray:
+        return self._mask.copy()
+
+    def copy(self) -> MacArray:
+        return type(self)(self._data.copy(), self._mask.copy(), self._dtype)
+
+    def take(
+        self, indices: Any, *, allow_fill: bool = False, fill_value: Any = None
+    ) -> MacArray:
+        fill = 0
+        fill_mask = True
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            data, _ = parse_macs([fill_value], self._dtype.eui)
+            fill, fill_mask = data[0], False
+        data = take(self._data, indices, allow_fill=allow_fill, fill_value=fill)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=fill_mask)
+        return type(self)(data, mask, self._dtype)
+
+    def factorize(self, use_na_sentinel: bool = True) -> tuple[np.ndarray, MacArray]:
+        codes = np.full(len(self), -1, np.intp)
+        valid = ~self._mask
+        valid_codes, uniques = pd.factorize(self._data[valid])
+        codes[valid] = valid_codes
+        unique_mask = np.zeros(len(uniques), bool)
+        if not use_na_sentinel and self._mask.any():
+            codes[self._mask] = len(uniques)
+            uniques = np.append(uniques, np.uint64(0))
+            unique_mask = np.append(unique_mask, True)
+        return codes, type(self)(uniques, unique_mask, self._dtype)
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, Any]:
+        values = self._data.astype(object)
+        values[self._mask] = None
+        return values, None
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def _formatter(self, boxed: bool = False):
+        size = self._dtype.eui // 8
+        return lambda value: (
+            str(value)
+            if pd.isna(value)
+            else format_values(np.uint64([value]), size, MacNotation.COLON)[0]
+        )
+
+    def to_strings(
+        self, notation: MacNotation = MacNotation.COLON, lower: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the addresses as strings in `notation`, missing values as `None`
+        """
+        strings = np.full(len(self), None, object)
+        strings[~self._mask] = format_values(
+            self._data[~self._mask], self._dtype.eui // 8, notation, lower
+        )
+        return strings
+
+    def astype(self, dtype: Any, copy: bool = True) -> Any:
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, MacDtype):
+            if dtype == self._dtype:
+                return self.copy() if copy else self
+            return type(self)(self._data, self._mask, dtype)
+        if isinstance(dtype, pd.StringDtype):
+            return pd.array(self.to_strings(), dtype=dtype)
+        if dtype == object:
+            values = self._data.astype(object)
+            values[self._mask] = pd.NA
+            return values
+        return super().astype(dtype, copy)
+
+    def __arrow_array__(self, type: Any = None) -> Any:
+        storage = pa.array(self._data, pa.uint64(), mask=self._mask)
+        return pa.ExtensionArray.from_storage(MacArrowType(self._dtype.eui), storage)
+
+
+if pa is not None:
+
+    class MacArrowType(pa.ExtensionType):
+        """
+        Arrow extension type for MAC addresses on `uint64` storage, converted to
+        `MacDtype` columns by `to_pandas`
+        """
+
+        def __init__(self, eui: int = 48) -> None:
+            self.eui = eui
+            super().__init__(pa.uint64(), "mactools.mac")
+
+        def __arrow_ext_serialize__(self) -> bytes:
+            return str(self.eui).encode()
+
+        @classmethod
+        def __arrow_ext_deserialize__(
+            cls, storage_type: Any, serialized: bytes
+        ) -> MacArrowType:
+            return cls(int(serialized))
+
+        def to_pandas_dtype(self) -> MacDtype:
+            return MacDtype(self.eui)
+
+    try:
+        pa.register_extension_type(MacArrowType())
+    except pa.ArrowKeyError:
+        # Already registered by an earlier import of this module
+        pass
+
+
+@register_series_accessor("mac")
+class MacAccessor:
+    """
+    `Series.mac`, for `mac` columns or strings that are parsed on access
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        if not isinstance(series.dtype, MacDtype):
+            series = series.astype(MacDtype())
+        self._series = series
+        self._array: MacArray = series.array
+
+    def _wrap(self, values: Any, dtype: Any = None) -> pd.Series:
+        return pd.Series(
+            values, index=self._series.index, name=self._series.name, dtype=dtype
+        )
+
+    def format(
+        self, notation: MacNotation = MacNotation.COLON, lower: bool = False
+    ) -> pd.Series:
+        """
+        Returns the addresses as strings in `notation`
+        """
+        return self._wrap(self._array.to_strings(notation, lower), "string")
+
+    @property
+    def oui(self) -> pd.Series:
+        """
+        Returns the clean 24-bit OUI of each address
+        """
+        array = self._array
+        valid = ~array._mask
+        strings = np.full(len(array), None, object)
+        strings[valid] = format_values(
+            array._data[valid] >> np.uint64(array.dtype.eui - 24), 3
+        )
+        return self._wrap(strings, "string")
+
+    @property
+    def is_local(self) -> pd.Series:
+        """
+        Returns whether each address is locally administered
+        """
+        array = self._array
+        first_octet = array._data >> np.uint64(array.dtype.eui - 8)
+        local = (first_octet & np.uint64(0x02)).astype(bool)
+        return self._wrap(pd.arrays.BooleanArray(local, array._mask.copy()))
+
+    def vendor(
+        self, cache: OUICache | OUIOverlay | None = None, remote: bool = False
+    ) -> pd.Series:
+        """
+        Returns the vendor of each address from `cache` (default: the global
+        cache), resolving each distinct registry block once. `remote` allows
+        asking the remote API about blocks missing from the cache.
+        """
+        array = self._array
+        vendors = np.full(len(array), None, object)
+        valid = ~array._mask
+        vendors[valid] = lookup_vendors(
+            array._data[valid], array.dtype.eui, cache, remote
+        )
+        return self._wrap(vendors, "string")
+
+    def vendor_id(self, cache: OUICache | OUIOverlay | None = None) -> pd.Series:
+        """
+        Returns the stable integer vendor ID of each address as `Int64`, for
+        grouping and joining on small integers instead of vendor names
+        """
+        array = self._array
+        valid = ~array._mask
+        ids = np.zeros(len(array), np.int64)
+        ids[valid] = lookup_stable_vendor_ids(
+            array._data[valid], cache, array.dtype.eui
+        )
+        return self._wrap(pd.arrays.IntegerArray(ids, array._mask.copy()))
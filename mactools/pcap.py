@@ -0,0 +1,278 @@
+# MacTools Packet Capture Reader
+
+# Python Modules
+from __future__ import annotations
+
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from itertools import compress
+from mmap import ACCESS_READ, mmap
+from operator import ne
+from os import path
+from struct import Struct
+
+# Local Modules
+from mactools.mac_pipeline import UNKNOWN_VENDOR
+from mactools.oui_cache.oui_classes import OUICache
+from mactools.oui_cache.oui_core import get_oui_cache
+
+LINKTYPE_ETHERNET = 1
+
+# Classic pcap magic numbers as read little-endian, with microsecond or
+# nanosecond timestamps
+PCAP_MAGIC = {
+    0xA1B2C3D4: "<",
+    0xA1B23C4D: "<",
+    0xD4C3B2A1: ">",
+    0x4D3CB2A1: ">",
+}
+PCAP_HEADER_LENGTH = 24
+
+# pcapng block types, the section header type reads the same in either order
+PCAPNG_SECTION_HEADER = b"\x0a\x0d\x0d\x0a"
+PCAPNG_INTERFACE = 0x00000001
+PCAPNG_SIMPLE_PACKET = 0x00000003
+PCAPNG_ENHANCED_PACKET = 0x00000006
+PCAPNG_BYTE_ORDER = {b"\x4d\x3c\x2b\x1a": "<", b"\x1a\x2b\x3c\x4d": ">"}
+
+# Block header, interface link type, enhanced and simple packet headers
+PCAPNG_STRUCTS = {
+    endian: (
+        Struct(f"{endian}II"),
+        Struct(f"{endian}H"),
+        Struct(f"{endian}IIIII"),
+        Struct(f"{endian}I"),
+    )
+    for endian in PCAPNG_BYTE_ORDER.values()
+}
+
+# 802.1Q, 802.1ad and the legacy QinQ tag protocol identifiers
+VLAN_TPIDS = frozenset([0x8100, 0x88A8, 0x9100])
+NO_VLAN = 0xFFFF
+
+ETHERNET_HEADER = Struct(">HIHIH")
+VLAN_TAG = Struct(">HH")
+ETHERNET_HEADER_LENGTH = 14
+
+FIELDS = ["source", "destination", "both"]
+
+
+@dataclass
+class EthernetFrames:
+    """
+    Columns of the Ethernet header of each frame, addresses as integers.
+    `vlans` holds the outer VLAN ID or `NO_VLAN` and `ethertypes` the type after
+    any VLAN tags. `lengths` are the original frame lengths on the wire.
+    """
+
+    destinations: array = field(default_factory=lambda: array("Q"))
+    sources: array = field(default_factory=lambda: array("Q"))
+    ethertypes: array = field(default_factory=lambda: array("H"))
+    vlans: array = field(default_factory=lambda: array("H"))
+    lengths: array = field(default_factory=lambda: array("I"))
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def create_reader(self, data: mmap | bytes) -> Callable[[int, int, int], None]:
+        """
+        Returns a function appending the Ethernet header at a given offset of
+        `data`, frames captured too short for one are skipped
+        """
+        unpack_header = ETHERNET_HEADER.unpack_from
+        unpack_tag = VLAN_TAG.unpack_from
+        append_destination = self.destinations.append
+        append_source = self.sources.append
+        append_ethertype = self.ethertypes.append
+        append_vlan = self.vlans.append
+        append_length = self.lengths.append
+
+        def add_frame(start: int, captured: int, length: int) -> None:
+            if captured < ETHERNET_HEADER_LENGTH:
+                return
+            dst_high, dst_low, src_high, src_low, ethertype = unpack_header(data, start)
+            vlan = NO_VLAN
+            if ethertype in VLAN_TPIDS:
+                tag_offset = start + ETHERNET_HEADER_LENGTH
+                tag_end = start + captured
+                while ethertype in VLAN_TPIDS and tag_offset + 4 <= tag_end:
+                    tag_control, ethertype = unpack_tag(data, tag_offset)
+                    if vlan == NO_VLAN:
+                        vlan = tag_control & 0xFFF
+                    tag_offset += 4
+
+            append_destination(dst_high << 32 | dst_low)
+            append_source(src_high << 32 | src_low)
+            append_ethertype(ethertype)
+            append_vlan(vlan)
+            append_length(length)
+
+        return add_frame
+
+
+@dataclass
+class TrafficReport:
+    """
+    Frame and byte counts per MAC, keyed by integer value, and per vendor
+    """
+
+    frame_counts: Counter[int] = field(default_factory=Counter)
+    byte_counts: Counter[int] = field(default_factory=Counter)
+    vendor_frames: Counter[str] = field(default_factory=Counter)
+    vendor_bytes: Counter[str] = field(default_factory=Counter)
+    vendors: dict[int, str] = field(default_factory=dict)
+
+    def merge(self, other: TrafficReport) -> TrafficReport:
+        """
+        Adds the counts of `other` into this report and returns it
+        """
+        self.frame_counts.update(other.frame_counts)
+        self.byte_counts.update(other.byte_counts)
+        self.vendor_frames.update(other.vendor_frames)
+        self.vendor_bytes.update(other.vendor_bytes)
+        self.vendors.update(other.vendors)
+        return self
+
+
+def read_pcap_records(data: mmap | bytes, frames: EthernetFrames) -> None:
+    """
+    Reads the frames of a classic pcap file
+    """
+    (magic,) = Struct("<I").unpack_from(data, 0)
+    endian = PCAP_MAGIC[magic]
+    (linktype,) = Struct(f"{endian}I").unpack_from(data, 20)
+    if linktype & 0xFFFF != LINKTYPE_ETHERNET:
+        return
+
+    add_frame = frames.create_reader(data)
+    record_header = Struct(f"{endian}IIII")
+    offset = PCAP_HEADER_LENGTH
+    size = len(data)
+    while offset + record_header.size <= size:
+        _, _, captured, length = record_header.unpack_from(data, offset)
+        offset += record_header.size
+        # A capture cut short ends on its last complete record
+        if offset + captured > size:
+            break
+        add_frame(offset, captured, length)
+        offset += captured
+
+
+def read_pcapng_blocks(data: mmap | bytes, frames: EthernetFrames) -> None:
+    """
+    Reads the frames of the enhanced and simple packet blocks of a pcapng
+    file, interfaces that are not Ethernet are skipped
+    """
+    add_frame = frames.create_reader(data)
+    offset = 0
+    size = len(data)
+    structs = PCAPNG_STRUCTS["<"]
+    linktypes: list[int] = []
+    while offset + 12 <= size:
+        if data[offset : offset + 4] == PCAPNG_SECTION_HEADER:
+            # Each section sets its own byte order and interfaces
+            endian = PCAPNG_BYTE_ORDER.get(data[offset + 8 : offset + 12])
+            if endian is None:
+                raise ValueError("Invalid pcapng byte-order magic")
+            structs = PCAPNG_STRUCTS[endian]
+            linktypes = []
+        block_header, interface_header, enhanced_header, simple_header = structs
+        block_type, block_length = block_header.unpack_from(data, offset)
+        if block_length < 12 or offset + block_length > size:
+            break
+
+        if block_type == PCAPNG_INTERFACE:
+            linktypes.append(interface_header.unpack_from(data, offset + 8)[0])
+        elif block_type == PCAPNG_ENHANCED_PACKET:
+            interface, _, _, captured, length = enhanced_header.unpack_from(
+                data, offset + 8
+            )
+            if interface < len(linktypes) and linktypes[interface] == LINKTYPE_ETHERNET:
+                add_frame(offset + 28, captured, length)
+        elif block_type == PCAPNG_SIMPLE_PACKET:
+            (length,) = simple_header.unpack_from(data, offset + 8)
+            if linktypes and linktypes[0] == LINKTYPE_ETHERNET:
+                captured = min(length, block_length - 16)
+                add_frame(offset + 12, captured, length)
+        offset += block_length
+
+
+def read_frames(file_path: str) -> EthernetFrames:
+    """
+    Returns the Ethernet header columns of every frame in a pcap or pcapng
+    file, the file is memory-mapped rather than read
+    """
+    frames = EthernetFrames()
+    if path.getsize(file_path) < 4:
+        raise ValueError(f"{file_path} is not a pcap or pcapng file")
+
+    with (
+        open(file_path, "rb") as file,
+        mmap(file.fileno(), 0, access=ACCESS_READ) as data,
+    ):
+        if data[:4] == PCAPNG_SECTION_HEADER:
+            read_pcapng_blocks(data, frames)
+        elif int.from_bytes(data[:4], "little") in PCAP_MAGIC:
+            if len(data) < PCAP_HEADER_LENGTH:
+                raise ValueError(f"{file_path} has a truncated pcap header")
+            read_pcap_records(data, frames)
+        else:
+            raise ValueError(f"{file_path} is not a pcap or pcapng file")
+    return frames
+
+
+def count_traffic(
+    frames: EthernetFrames, cache: OUICache | None = None, address_field: str = "both"
+) -> TrafficReport:
+    """
+    Counts the frames and bytes of each address and vendor. `address_field` picks
+    the `source`, `destination` or `both` addresses, with `both` a frame counts
+    once for each distinct address it carries.
+    """
+    if address_field not in FIELDS:
+        raise ValueError(f"Address field must be one of {FIELDS}")
+    cache = get_oui_cache() if cache is None else cache
+
+    columns: list[tuple[Iterable[int], Iterable[int]]] = []
+    if address_field != "destination":
+        columns.append((frames.sources, frames.lengths))
+    if address_field == "destination":
+        columns.append((frames.destinations, frames.lengths))
+    elif address_field == "both":
+        # Frames sent to their own source count once
+        distinct = list(map(ne, frames.destinations, frames.sources))
+        columns.append(
+            (
+                list(compress(frames.destinations, distinct)),
+                list(compress(frames.lengths, distinct)),
+            )
+        )
+
+    # Frames are counted in C by `Counter`, only the byte totals need a loop
+    report = TrafficReport()
+    byte_totals: defaultdict[int, int] = defaultdict(int)
+    for macs, lengths in columns:
+        report.frame_counts.update(macs)
+        for mac, length in zip(macs, lengths):
+            byte_totals[mac] += length
+    report.byte_counts.update(byte_totals)
+
+    # Each distinct address is resolved once, locally
+    for mac, count in report.frame_counts.items():
+        record = cache.get_record(f"{mac:012X}", remote=False) or {}
+        vendor = record.get("vendor") or UNKNOWN_VENDOR
+        report.vendors[mac] = vendor
+        report.vendor_frames[vendor] += count
+        report.vendor_bytes[vendor] += byte_totals[mac]
+    return report
+
+
+def summarize_capture(
+    file_path: str, cache: OUICache | None = None, address_field: str = "both"
+) -> TrafficReport:
+    """
+    Reads a pcap or pcapng file and returns its `TrafficReport`
+    """
+    return count_traffic(read_frames(file_path), cache, address_field)
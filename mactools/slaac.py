@@ -0,0 +1,131 @@
+# MacTools IPv6 SLAAC Addressing
+
+# Python Modules
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+from ipaddress import IPv6Address, IPv6Network
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mactools.oui_cache.oui_classes import OUICache
+
+LINK_LOCAL_PREFIX = 0xFE80 << 112
+
+# The U/L bit as it sits in an interface identifier, and the FF:FE filler an
+# EUI-48 gets between its OUI and its device half
+UNIVERSAL_LOCAL_BIT = 0x02 << 56
+EUI48_FILLER = 0xFFFE << 24
+EUI48_FILLER_MASK = 0xFFFF << 24
+
+
+def interface_id(mac: int, eui: int = 48) -> int:
+    """
+    Returns the modified EUI-64 interface identifier (RFC 4291) of a MAC as an
+    integer, an EUI-64 is taken as the identifier unchanged
+    """
+    if eui == 64:
+        return mac
+    return ((mac >> 24) << 40 | EUI48_FILLER | mac & 0xFFFFFF) ^ UNIVERSAL_LOCAL_BIT
+
+
+@lru_cache(maxsize=64)
+def prefix_value(prefix: str | IPv6Network) -> int:
+    """
+    Returns the network bits of a /64 or shorter prefix. Strings are a network
+    (`2001:db8::/64`) or the leading groups of one (`2001:db8:0:1`).
+    """
+    if isinstance(prefix, str) and "/" not in prefix:
+        groups = prefix.rstrip(":")
+        if "::" not in groups and groups.count(":") > 3:
+            raise ValueError(f"IPv6 prefix {prefix} has more than four groups")
+        prefix = groups + "::/64" if "::" not in groups else f"{prefix}/64"
+    try:
+        network = IPv6Network(prefix, strict=False)
+    except ValueError:
+        raise ValueError(f"Invalid IPv6 prefix: {prefix}") from None
+    if network.prefixlen > 64:
+        raise ValueError(f"IPv6 prefix {prefix} is longer than /64")
+    return int(network.network_address)
+
+
+def interface_ids(macs: Iterable[int], eui: int = 48) -> array:
+    """
+    Returns the interface identifiers of integer MACs as an integer array
+    """
+    if eui == 64:
+        return array("Q", macs)
+    flip = UNIVERSAL_LOCAL_BIT | EUI48_FILLER
+    return array("Q", [((i >> 24) << 40 | i & 0xFFFFFF) ^ flip for i in macs])
+
+
+def link_local_addresses(macs: Iterable[int], eui: int = 48) -> list[IPv6Address]:
+    """
+    Returns the SLAAC link-local address of each integer MAC
+    """
+    return global_addresses(macs, LINK_LOCAL_PREFIX, eui)
+
+
+def global_addresses(
+    macs: Iterable[int], prefix: str | IPv6Network | int, eui: int = 48
+) -> list[IPv6Address]:
+    """
+    Returns the SLAAC address of each integer MAC within `prefix`, a network,
+    its leading groups or its integer value
+    """
+    network = prefix if isinstance(prefix, int) else prefix_value(prefix)
+    return [IPv6Address(network | i) for i in interface_ids(macs, eui)]
+
+
+def mac_from_interface_id(identifier: int) -> int | None:
+    """
+    Returns the EUI-48 a modified EUI-64 interface identifier was derived from,
+    or `None` when it lacks the FF:FE filler (privacy or manual addresses)
+    """
+    if identifier & EUI48_FILLER_MASK != EUI48_FILLER:
+        return None
+    identifier ^= UNIVERSAL_LOCAL_BIT
+    return (identifier >> 40) << 24 | identifier & 0xFFFFFF
+
+
+def mac_from_address(address: IPv6Address | str | int) -> int | None:
+    """
+    Returns the EUI-48 behind a SLAAC address, or `None` if it has none
+    """
+    return mac_from_interface_id(int(IPv6Address(address)) & ((1 << 64) - 1))
+
+
+def macs_from_addresses(
+    addresses: Iterable[IPv6Address | str | int],
+) -> list[int | None]:
+    """
+    Returns the EUI-48 behind each SLAAC address in order, `None` for addresses
+    whose interface identifier was not derived from a MAC
+    """
+    low_mask = (1 << 64) - 1
+    return [
+        mac_from_interface_id(int(IPv6Address(address)) & low_mask)
+        for address in addresses
+    ]
+
+
+def address_records(
+    addresses: Iterable[IPv6Address | str | int],
+    cache: OUICache | None = None,
+    remote: bool = False,
+) -> list[dict[str, str]]:
+    """
+    Returns the OUI record of the MAC behind each SLAAC address in order, empty
+    for addresses without one, resolving each distinct OUI once
+    """
+    if cache is None:
+        from mactools.oui_cache.oui_core import get_oui_cache
+
+        cache = get_oui_cache()
+
+    macs = macs_from_addresses(addresses)
+    found = [f"{mac:012X}" for mac in macs if mac is not None]
+    records = iter(cache.get_records(found, remote))
+    return [{} if mac is None else next(records) or {} for mac in macs]
@@ -0,0 +1,140 @@
+# MacTools MAC and ARP Table Parser
+
+# Python Modules
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from re import MULTILINE, Pattern
+from re import compile as re_compile
+
+# Local Modules
+from mactools.tools_common import DELIMITER_TABLE, EUI48_PATTERN
+
+MAC_GROUP = f"(?P<mac>{EUI48_PATTERN})"
+IPV4_GROUP = r"(?P<ip>\d{1,3}(?:\.\d{1,3}){3})"
+GAP = r"[ \t]+"
+
+# Each layout is matched over the whole text at once, `[ \t]` keeps every match
+# on a single line. Layouts whose lines also fit a later, looser layout come first
+# as detection keeps the first of equally good layouts.
+TABLE_LAYOUTS: dict[str, Pattern[str]] = {
+    # Cisco NX-OS `show mac address-table`: Vlan, MAC, Type, Age, Secure, NTFY, Ports
+    "nxos_mac_table": re_compile(
+        rf"^[*+GCOR ]?[ \t]*(?P<vlan>\d+|-){GAP}{MAC_GROUP}{GAP}[a-z]+{GAP}"
+        rf"\S+{GAP}[TF]{GAP}[TF]{GAP}(?P<port>\S+)",
+        MULTILINE,
+    ),
+    # Cisco IOS and Arista EOS `show mac address-table`: Vlan, MAC, Type, Ports
+    "mac_table": re_compile(
+        rf"^[ \t]*(?P<vlan>\d+|All){GAP}{MAC_GROUP}{GAP}[A-Za-z_]+{GAP}(?P<port>\S+)",
+        MULTILINE,
+    ),
+    # Junos `show ethernet-switching table`: VLAN name, MAC, Flags, Age, Interface
+    "junos_mac_table": re_compile(
+        rf"^[ \t]*(?P<vlan>\S+){GAP}{MAC_GROUP}{GAP}[A-Za-z,]+{GAP}\S+{GAP}(?P<port>\S+)",
+        MULTILINE,
+    ),
+    # Cisco IOS `show ip arp`: Protocol, Address, Age, MAC, Type, Interface
+    "ios_arp": re_compile(
+        rf"^Internet{GAP}{IPV4_GROUP}{GAP}\S+{GAP}{MAC_GROUP}{GAP}\S+(?:{GAP}(?P<port>\S+))?",
+        MULTILINE,
+    ),
+    # Linux `arp -n`: Address, HWtype, MAC, Flags, Iface
+    "linux_arp_table": re_compile(
+        rf"^{IPV4_GROUP}{GAP}ether{GAP}{MAC_GROUP}{GAP}\S+{GAP}(?P<port>\S+)",
+        MULTILINE,
+    ),
+    # Cisco NX-OS and Arista EOS `show ip arp`: Address, Age, MAC, Interface(s),
+    # only the first (routed) interface is kept
+    "arp": re_compile(
+        rf"^{IPV4_GROUP}{GAP}\S+{GAP}{MAC_GROUP}{GAP}(?P<port>[^\s,]+)",
+        MULTILINE,
+    ),
+    # Junos `show arp`: MAC, Address, optional Name, Interface, Flags
+    "junos_arp": re_compile(
+        rf"^{MAC_GROUP}{GAP}{IPV4_GROUP}{GAP}(?:\S+{GAP})?(?P<port>\S+){GAP}\S+[ \t]*$",
+        MULTILINE,
+    ),
+    # Linux `ip neigh`: Address dev Interface lladdr MAC State
+    "ip_neigh": re_compile(
+        rf"^(?P<ip>[0-9A-Fa-f.:]+){GAP}dev{GAP}(?P<port>\S+){GAP}lladdr{GAP}{MAC_GROUP}",
+        MULTILINE,
+    ),
+    # Linux `arp -an`: ? (Address) at MAC [ether] on Interface
+    "linux_arp": re_compile(
+        rf"\((?P<ip>[^)\s]+)\){GAP}at{GAP}{MAC_GROUP}{GAP}\[\w+\]{GAP}on{GAP}(?P<port>\S+)"
+    ),
+}
+
+# Amount of text sampled when detecting the layout
+DETECT_SAMPLE_SIZE = 1 << 14
+
+
+@dataclass
+class MacTable:
+    """
+    Columnar result of a parsed table, columns missing from a layout hold `None`
+    """
+
+    layout: str
+    macs: array = field(default_factory=lambda: array("Q"))
+    vlans: list[str | None] = field(default_factory=list)
+    ports: list[str | None] = field(default_factory=list)
+    ips: list[str | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.macs)
+
+    def rows(self) -> Iterator[tuple[int, str | None, str | None, str | None]]:
+        """
+        Yields `(mac, vlan, port, ip)` for each entry
+        """
+        return zip(self.macs, self.vlans, self.ports, self.ips)
+
+
+def detect_layout(text: str) -> str | None:
+    """
+    Returns the layout matching the most entries at the start of `text`
+    """
+    sample = text[:DETECT_SAMPLE_SIZE]
+    counts = {name: len(regex.findall(sample)) for name, regex in TABLE_LAYOUTS.items()}
+    layout = max(counts, key=counts.__getitem__)
+    return layout if counts[layout] else None
+
+
+def parse_table(text: str | bytes, layout: str | None = None) -> MacTable:
+    """
+    Parses the output of a MAC address, ARP or neighbor table into columns,
+    detecting the layout when one is not given
+    """
+    if isinstance(text, bytes):
+        text = text.decode(errors="replace")
+
+    layout = layout or detect_layout(text)
+    if layout is None:
+        return MacTable("unknown")
+    if layout not in TABLE_LAYOUTS:
+        raise ValueError(f"Unknown table layout: {layout}")
+
+    regex = TABLE_LAYOUTS[layout]
+    columns = [i for i in ["mac", "vlan", "port", "ip"] if i in regex.groupindex]
+    indices = [regex.groupindex[i] for i in columns]
+
+    # One pass over the text, each match yields all of its columns at once
+    found_rows = [found.group(*indices) for found in regex.finditer(text)]
+    found_columns = dict(zip(columns, zip(*found_rows))) if found_rows else {}
+    empty = [None] * len(found_rows)
+
+    return MacTable(
+        layout,
+        array(
+            "Q",
+            [
+                int(i.translate(DELIMITER_TABLE), 16)
+                for i in found_columns.get("mac", [])
+            ],
+        ),
+        list(found_columns.get("vlan", empty)),
+        list(found_columns.get("port", empty)),
+        list(found_columns.get("ip", empty)),
+    )
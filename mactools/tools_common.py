@@ -5,7 +5,9 @@ from re import search
 
 HEX_PATTERN = r"[a-fA-F0-9]"
 HEX_PAIR = f"{HEX_PATTERN}{{2}}"
-MAC_PORTION = rf"{HEX_PAIR}[:\-\. ]?"
+MAC_DELIMITER = r"[:\-\. ]"
+MAC_PORTION = rf"{HEX_PAIR}{MAC_DELIMITER}?"
+DELIMITER_TABLE = str.maketrans("", "", ":-. ")
 HEX_REGEX = re_compile(HEX_PATTERN)
 
 EUI48_PATTERN = f"(?:{MAC_PORTION}){{5}}{HEX_PAIR}"
@@ -16,6 +18,71 @@ EUI48_REGEX = re_compile(EUI48_PATTERN)
 EUI64_REGEX = re_compile(EUI64_PATTERN)
 MAC_REGEX = re_compile(MAC_PATTERN)
 
+# Scanning free text rejects hex runs that continue on either side of the address
+# and prefers the EUI-64 form over its EUI-48 prefix. Leading with a hex character
+# (checked against the one before it) lets `re` skip ahead to candidate positions.
+SCAN_PATTERN = (
+    rf"{HEX_PATTERN}(?<!{HEX_PATTERN}{{2}}){HEX_PATTERN}{MAC_DELIMITER}?"
+    rf"(?:{MAC_PORTION}){{4}}{HEX_PAIR}(?:(?:{MAC_DELIMITER}?{HEX_PAIR}){{2}})?"
+    rf"(?!{HEX_PATTERN})"
+)
+SCAN_REGEX = re_compile(SCAN_PATTERN)
+SCAN_BYTES_REGEX = re_compile(SCAN_PATTERN.encode())
+
+# Strict patterns take a single delimiter per address and reject addresses that
+# touch a word character or continue into another delimited hex group.
+STRICT_BOUNDARY = r"[:\-\.]"
+EUI_PERIOD_PATTERN = (
+    rf"{HEX_PATTERN}{{4}}(?:\.{HEX_PATTERN}{{4}}){{2}}(?:\.{HEX_PATTERN}{{4}})?"
+)
+EUI_CLEAN_PATTERN = rf"{HEX_PATTERN}{{12}}(?:{HEX_PATTERN}{{4}})?"
+
+
+def create_pair_pattern(delimiter: str) -> str:
+    """
+    Returns the EUI-48 or EUI-64 pattern of hex pairs split by `delimiter`
+    """
+    return (
+        rf"{HEX_PAIR}(?:{delimiter}{HEX_PAIR}){{5}}(?:(?:{delimiter}{HEX_PAIR}){{2}})?"
+    )
+
+
+def create_strict_pattern(body: str, boundary: str = STRICT_BOUNDARY) -> str:
+    """
+    Wraps an address pattern in the strict boundary checks
+    """
+    return (
+        rf"(?<!\w)(?<!{HEX_PATTERN}{boundary}){body}"
+        rf"(?!\w)(?!{boundary}{HEX_PATTERN})"
+    )
+
+
+# Keyed by `MacNotation.value`, `basemac` imports this module
+STRICT_PATTERNS: dict[str, str] = {
+    ":": create_strict_pattern(create_pair_pattern(":")),
+    "-": create_strict_pattern(create_pair_pattern(r"\-")),
+    ".": create_strict_pattern(EUI_PERIOD_PATTERN),
+    " ": create_strict_pattern(create_pair_pattern(" "), r"[:\-\. ]"),
+    "": create_strict_pattern(EUI_CLEAN_PATTERN),
+}
+STRICT_REGEXES = {key: re_compile(value) for key, value in STRICT_PATTERNS.items()}
+
+# Colon, hyphen, period and bare notations in a single pass, equivalent to their
+# strict patterns combined. The first hex character and two fixed-width
+# look-behinds act as the prefilter: `re` skips ahead to hex characters and
+# drops positions inside hex runs or delimited groups before any alternative
+# is tried, which keeps hashes and UUIDs cheap.
+STRICT_SCAN_PATTERN = (
+    rf"{HEX_PATTERN}(?<!\w{HEX_PATTERN})(?<!{HEX_PATTERN}{STRICT_BOUNDARY}{HEX_PATTERN})"
+    rf"(?:{HEX_PATTERN}(?::{HEX_PAIR}){{5}}(?:(?::{HEX_PAIR}){{2}})?"
+    rf"|{HEX_PATTERN}(?:-{HEX_PAIR}){{5}}(?:(?:-{HEX_PAIR}){{2}})?"
+    rf"|{HEX_PATTERN}{{3}}(?:\.{HEX_PATTERN}{{4}}){{2}}(?:\.{HEX_PATTERN}{{4}})?"
+    rf"|{HEX_PATTERN}{{11}}(?:{HEX_PATTERN}{{4}})?)"
+    rf"(?!\w)(?!{STRICT_BOUNDARY}{HEX_PATTERN})"
+)
+STRICT_SCAN_REGEX = re_compile(STRICT_SCAN_PATTERN)
+STRICT_SCAN_BYTES_REGEX = re_compile(STRICT_SCAN_PATTERN.encode())
+
 OUI_PATTERN = f"(?:{MAC_PORTION}){{2}}{HEX_PAIR}"
 OUI28_PATTERN = f"(?:{MAC_PORTION}){{3}}{HEX_PATTERN}"
 OUI36_PATTERN = f"(?:{MAC_PORTION}){{4}}{HEX_PATTERN}"
@@ -0,0 +1,118 @@
+# MacTools Slow-Path Tracing
+
+# Python Modules
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging import DEBUG, getLogger
+from threading import Lock
+from time import perf_counter, time
+from typing import Any
+
+# Events emitted by the library
+TRACE_EVENTS = ["download", "csv_parse", "remote_lookup", "cache_swap"]
+
+logger = getLogger("mactools")
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    """
+    Start or end of a slow operation. End events carry the duration in seconds,
+    the bytes transferred or read when known and the error for failures.
+    """
+
+    name: str
+    phase: str
+    timestamp: float
+    duration: float | None = None
+    bytes: int | None = None
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class TraceSpan:
+    """
+    Handed to the traced block, which fills in its byte count and attributes
+    """
+
+    bytes: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+# Hooks are replaced rather than changed so emitting never needs the lock
+_hooks: tuple[Callable[[TraceEvent], None], ...] = ()
+_hooks_lock = Lock()
+
+
+def add_trace_hook(
+    hook: Callable[[TraceEvent], None],
+) -> Callable[[TraceEvent], None]:
+    """
+    Registers a callback receiving every `TraceEvent`, returns it so it can be
+    used as a decorator
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+    return hook
+
+
+def remove_trace_hook(hook: Callable[[TraceEvent], None]) -> None:
+    """
+    Unregisters a callback added by `add_trace_hook`
+    """
+    global _hooks
+    with _hooks_lock:
+        # Compared by equality so bound methods match their re-fetched copies
+        _hooks = tuple(i for i in _hooks if i != hook)
+
+
+def emit(event: TraceEvent) -> None:
+    """
+    Passes an event to the hooks and to the `mactools` logger at DEBUG level,
+    a failing hook is logged and does not affect the traced operation
+    """
+    for hook in _hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("MacTools trace hook failed")
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("%s %s", event.name, event.phase, extra={"mactools_event": event})
+
+
+@contextmanager
+def trace(name: str, **attributes: Any) -> Iterator[TraceSpan]:
+    """
+    Emits start and end events around a block, the end event is emitted with
+    the error if the block raises
+    """
+    span = TraceSpan(attributes=attributes)
+    if not _hooks and not logger.isEnabledFor(DEBUG):
+        yield span
+        return
+
+    emit(TraceEvent(name, "start", time(), attributes=dict(attributes)))
+    start = perf_counter()
+    error = None
+    try:
+        yield span
+    except BaseException as exception:
+        error = repr(exception)
+        raise
+    finally:
+        emit(
+            TraceEvent(
+                name,
+                "end",
+                time(),
+                perf_counter() - start,
+                span.bytes,
+                error,
+                span.attributes,
+            )
+        )
@@ -7,6 +7,7 @@ from os import makedirs, path
 from urllib.request import Request, urlopen
 
 # Local Modules
+from mactools.tracing import trace
 from mactools.version import __version__
 
 
@@ -25,10 +26,16 @@ async def get_csv_file(endpoint: str, dest_path: str, overwrite: bool) -> bool:
     }
 
     try:
-        with urlopen(Request(url, headers=headers)) as response:  # nosec B310
+        with (
+            trace("download", url=url, file=filename) as span,
+            urlopen(Request(url, headers=headers)) as response,  # nosec B310
+        ):
+            span.attributes["status"] = response.status
             if response.status == 200:
+                data = response.read()
+                span.bytes = len(data)
                 with open(filename, "wb") as file:
-                    file.write(response.read())
+                    file.write(data)
                 return True
     except Exception:  # nosec B110
         pass
@@ -36,9 +43,10 @@ async def get_csv_file(endpoint: str, dest_path: str, overwrite: bool) -> bool:
     return False
 
 
-def update_ieee_files(overwrite: bool = True) -> bool:
+def update_ieee_files(overwrite: bool = True, history: str | None = None) -> bool:
     """
-    Procedure for updating the IEEE CSV files within the project
+    Procedure for updating the IEEE CSV files within the project, `history` is
+    an `OUIHistory` directory keeping each downloaded version
     """
     print("MacTools: Fetching IEEE files...", end="\r")
     dest_path = files("mactools").joinpath("resources/ieee")
@@ -58,6 +66,12 @@ def update_ieee_files(overwrite: bool = True) -> bool:
         return False
     else:
         print("MacTools: IEEE Downloads completed...")
+        if history is not None:
+            from mactools.oui_cache.oui_history import OUIHistory
+
+            OUIHistory(history).add_files(
+                [path.join(dest_path, f"{i}.csv") for i in ["oui36", "mam", "oui"]]
+            )
         return True
 
 
@@ -0,0 +1,99 @@
+# MacTools Command Line Tests
+
+# Python Modules
+from csv import DictReader
+from io import StringIO
+from json import loads
+from unittest import TestCase, main
+from unittest.mock import Mock, patch
+
+# Local Modules
+from mactools.basemac import MacNotation
+from mactools.cli import LookupOptions, process_batch, run
+from mactools.cli import main as cli_main
+from mactools.oui_cache.oui_classes import OUIType
+from tests.test_common import SAMPLE_EUI48, SAMPLE_EUI64, TEST_VENDOR
+
+TEST_INPUT = [
+    f"{SAMPLE_EUI48.mac}\n",
+    "not a mac\n",
+    "79b7.4da0.0001\n",
+    f"{SAMPLE_EUI64.mac.replace(':', '-')}\n",
+]
+
+
+class TestCli(TestCase):
+    def test_process_batch_jsonl(self):
+        rows = [
+            loads(i) for i in process_batch(TEST_INPUT, LookupOptions()).splitlines()
+        ]
+        self.assertEqual(
+            rows[0],
+            {
+                "input": SAMPLE_EUI48.mac,
+                "mac": SAMPLE_EUI48.mac,
+                "eui": 48,
+                "vendor": TEST_VENDOR[OUIType.OUI],
+            },
+        )
+        self.assertEqual(
+            rows[1], {"input": "not a mac", "error": "Not a valid MAC address"}
+        )
+        self.assertEqual(rows[2]["mac"], "79:B7:4D:A0:00:01")
+        self.assertEqual(rows[2]["vendor"], TEST_VENDOR[OUIType.OUI28])
+        self.assertEqual(rows[3]["eui"], 64)
+
+    def test_process_batch_full_csv(self):
+        options = LookupOptions(
+            notation=MacNotation.PERIOD, lower=True, full=True, output_format="csv"
+        )
+        output = StringIO()
+        run(iter(TEST_INPUT), output, options, batch_size=1)
+        rows = list(DictReader(StringIO(output.getvalue())))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]["mac"], "246d.5ebb.99cc")
+        self.assertEqual(rows[0]["address"], "ADDRESS INFO")
+        self.assertEqual(rows[0]["oui"], "246D5E")
+        self.assertEqual(rows[1]["error"], "Not a valid MAC address")
+
+    def test_workers_match_single_process(self):
+        """
+        Parallel batches are written in input order
+        """
+        lines = TEST_INPUT * 50
+        single, parallel = StringIO(), StringIO()
+        run(iter(lines), single, LookupOptions(), batch_size=7)
+        run(iter(lines), parallel, LookupOptions(), batch_size=7, workers=2)
+        self.assertEqual(parallel.getvalue(), single.getvalue())
+
+    def test_main_stdin(self):
+        with (
+            patch("mactools.cli.stdin", StringIO("".join(TEST_INPUT))),
+            patch("mactools.cli.stdout", new_callable=StringIO) as mocked_stdout,
+        ):
+            self.assertEqual(cli_main(["--no-lookup", "-n", "clean"]), 0)
+        rows = [loads(i) for i in mocked_stdout.getvalue().splitlines()]
+        self.assertEqual(rows[0]["mac"], SAMPLE_EUI48.mac.replace(":", ""))
+        self.assertNotIn("vendor", rows[0])
+
+    def test_main_broken_pipe(self):
+        """
+        A closed output pipe exits cleanly with standard output on the null device
+        """
+        with (
+            patch("mactools.cli.stdin", StringIO("".join(TEST_INPUT))),
+            patch("mactools.cli.stdout", Mock(fileno=Mock(return_value=1))),
+            patch("mactools.cli.run", side_effect=BrokenPipeError),
+            patch("mactools.cli.dup2") as mocked_dup2,
+        ):
+            self.assertEqual(cli_main(["--no-lookup"]), 0)
+        self.assertEqual(mocked_dup2.call_args.args[1], 1)
+
+    def test_main_serve(self):
+        with patch("mactools.cli.run_server") as run_server:
+            self.assertEqual(cli_main(["--serve", "0.0.0.0:9000"]), 0)
+        self.assertEqual(run_server.call_args.args[1:], ("0.0.0.0", 9000))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,32 @@
 # Tests for `mac_common.py`
 
 # Python Modules
+from struct import pack
 from unittest import TestCase, main
 
-from mactools import (create_random_hex_bit, create_random_hex_string,
-                      create_random_mac, fill_hex, hex_range, prepare_oui)
+from mactools import (
+    MacNotation,
+    create_random_hex_bit,
+    create_random_hex_string,
+    create_random_mac,
+    create_random_macs,
+    fill_hex,
+    format_hex_mac,
+    format_mac_values,
+    hex_range,
+    prepare_oui,
+    unpack_macs,
+)
+
 # Local Modules
 from mactools.tools_common import MAC_PATTERN
-from tests.test_common import (MAC48, MAC64, SAMPLE_EUI48, SAMPLE_EUI64,
-                               test_regex_comparison)
+from tests.test_common import (
+    MAC48,
+    MAC64,
+    SAMPLE_EUI48,
+    SAMPLE_EUI64,
+    test_regex_comparison,
+)
 
 
 class TestMACCommon(TestCase):
@@ -21,6 +39,24 @@ class TestMACCommon(TestCase):
         for test_input, result in test_case_dict.items():
             self.assertEqual(fill_hex(test_input, 4), result)
 
+    def test_format_hex_mac(self):
+        """
+        Tests formatting a clean hex MAC in each notation and case
+        """
+        expected = {
+            MacNotation.CLEAN: "246D5EBB99CC",
+            MacNotation.COLON: "24:6D:5E:BB:99:CC",
+            MacNotation.PERIOD: "246D.5EBB.99CC",
+            MacNotation.HYPHEN: "24-6D-5E-BB-99-CC",
+            MacNotation.SPACE: "24 6D 5E BB 99 CC",
+        }
+        for notation, result in expected.items():
+            self.assertEqual(format_hex_mac("246d5ebb99cc", notation), result)
+        self.assertEqual(
+            format_hex_mac("246D5E0000BB99DD", MacNotation.PERIOD, lower=True),
+            "246d.5e00.00bb.99dd",
+        )
+
     def test_hex_range(self):
         """
         Tests for the various cases of `hex_range`
@@ -36,6 +72,32 @@ class TestMACCommon(TestCase):
         for i, test_mac in enumerate(hex_range(2)):
             self.assertEqual(expected_result_list[i], test_mac)
 
+    def test_unpack_macs(self):
+        """
+        Tests decoding strided addresses for every supported stride
+        """
+        macs = [SAMPLE_EUI48.decimal + i for i in range(50)]
+        for stride in [6, 7, 8, 16, 66]:
+            headers = b"\xee\xee" + b"".join(
+                i.to_bytes(6, "big") + b"\xff" * (stride - 6) for i in macs
+            )
+            self.assertEqual(unpack_macs(headers, stride, 2).tolist(), macs)
+            # A final record cut short right after its address
+            cut_short = memoryview(headers)[: len(headers) + 6 - stride]
+            self.assertEqual(unpack_macs(cut_short, stride, 2).tolist(), macs)
+            self.assertEqual(unpack_macs(headers, stride, 2, 3).tolist(), macs[:3])
+
+        eui64 = pack(">QHQH", SAMPLE_EUI64.decimal, 1, SAMPLE_EUI64.decimal + 1, 2)
+        self.assertEqual(
+            unpack_macs(eui64, 10, eui=64).tolist(),
+            [SAMPLE_EUI64.decimal, SAMPLE_EUI64.decimal + 1],
+        )
+        self.assertEqual(len(unpack_macs(b"\x00" * 5)), 0)
+
+        for kwargs in [{"eui": 32}, {"stride": 4}, {"count": 2}]:
+            with self.assertRaises(ValueError):
+                unpack_macs(b"\x00" * 6, **kwargs)
+
     def test_prepare_oui(self):
         """
         Tests for the various cases of `prepare_oui`
@@ -87,6 +149,61 @@ class TestMACCommon(TestCase):
         with self.assertRaises(ValueError):
             create_random_mac(eui=999)
 
+    def test_create_random_macs(self):
+        """
+        Test for bulk MAC creation with structural constraints
+        """
+        macs = create_random_macs(1000, seed=1)
+        self.assertEqual(macs, create_random_macs(1000, seed=1))
+        self.assertNotEqual(macs, create_random_macs(1000, seed=2))
+        self.assertTrue(all(0 <= i < 1 << 48 for i in macs))
+
+        macs = create_random_macs(1000, prefix="24:6D:5E", local=False, seed=1)
+        self.assertTrue(all(i >> 24 == 0x246D5E for i in macs))
+        macs = create_random_macs(1000, eui=64, local=True, multicast=False)
+        self.assertTrue(all(i >> 56 & 0x03 == 0x02 for i in macs))
+        macs = create_random_macs(1000, prefix="79B74DA", eui=64)
+        self.assertTrue(all(i >> 36 == 0x79B74DA for i in macs))
+
+        # Every address of a small block, then a sparse unique draw
+        macs = create_random_macs(256, prefix="246D5EBB99", unique=True, seed=1)
+        self.assertEqual(sorted(macs), list(range(0x246D5EBB9900, 0x246D5EBB9A00)))
+        macs = create_random_macs(
+            64, prefix="0", local=False, multicast=False, unique=True
+        )
+        self.assertEqual(len(set(macs)), 64)
+        self.assertTrue(all(i >> 40 < 0x10 and not i >> 40 & 0x03 for i in macs))
+        self.assertEqual(len(set(create_random_macs(5000, unique=True))), 5000)
+
+        for kwargs in [
+            {"prefix": "24", "multicast": True},
+            {"prefix": "246D5EBB99CCDD"},
+            {"prefix": "246D5EBB99CC", "unique": True},
+            {"eui": 32},
+        ]:
+            with self.assertRaises(ValueError):
+                create_random_macs(2, **kwargs)
+
+    def test_format_mac_values(self):
+        """
+        Tests bulk formatting agrees with `format_hex_mac` in every notation
+        """
+        for eui in [48, 64]:
+            macs = create_random_macs(50, eui=eui, seed=eui)
+            for notation in MacNotation:
+                for lower in [False, True]:
+                    expected = [
+                        format_hex_mac(f"{i:0{eui // 4}X}", notation, lower)
+                        for i in macs
+                    ]
+                    self.assertEqual(
+                        format_mac_values(macs, eui, notation, lower), expected
+                    )
+        self.assertEqual(
+            create_random_macs(2, notation=MacNotation.PERIOD, seed=1),
+            format_mac_values(create_random_macs(2, seed=1), 48, MacNotation.PERIOD),
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,138 @@
+# MacTools MAC Normalizer Tests
+
+# Python Modules
+from io import BytesIO
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools import MacAddress, MacNotation, create_random_mac
+from mactools.mac_normalizer import normalize_file, normalize_stream, normalize_text
+from mactools.tools_common import SCAN_BYTES_REGEX, SCAN_REGEX
+from tests.test_mac_scanner import SAMPLE_LOG
+
+
+def create_macs_log(
+    lines: int, seed: int = 0, notations: list[MacNotation] | None = None
+) -> tuple[list[str], str]:
+    """
+    Returns random MACs of the given notations (default: those the strict
+    pattern takes, every one but space) and a log with one per line
+    """
+    rng = Random(seed)  # nosec B311
+    notations = notations or [i for i in MacNotation if i != MacNotation.SPACE]
+    macs = [
+        create_random_mac(rng.choice([48, 64]), rng.choice(notations))  # nosec B311
+        for _ in range(lines)
+    ]
+    return macs, "".join(f"line {i} -> {mac} ok\n" for i, mac in enumerate(macs))
+
+
+class TestMacNormalizer(TestCase):
+    def test_normalize_notations(self):
+        """
+        Every notation rewrites all addresses and leaves other text alone
+        """
+        expected = {
+            MacNotation.COLON: (b"24:6D:5E:BB:99:CC", b"24:6D:5E:00:00:BB:99:DD"),
+            MacNotation.HYPHEN: (b"24-6D-5E-BB-99-CC", b"24-6D-5E-00-00-BB-99-DD"),
+            MacNotation.PERIOD: (b"246D.5EBB.99CC", b"246D.5E00.00BB.99DD"),
+            MacNotation.SPACE: (b"24 6D 5E BB 99 CC", b"24 6D 5E 00 00 BB 99 DD"),
+            MacNotation.CLEAN: (b"246D5EBB99CC", b"246D5E0000BB99DD"),
+        }
+        for notation, (eui48, eui64) in expected.items():
+            with self.subTest(notation=notation):
+                output = normalize_text(SAMPLE_LOG, notation)
+                self.assertEqual(output.count(eui48), 3)
+                self.assertEqual(output.count(eui64), 1)
+                self.assertIn(b"0123456789abcdef0123456789abcdef01234567", output)
+                self.assertTrue(output.startswith(b"Jan 1 00:00:01 dhcpd: DHCPACK"))
+
+    def test_normalize_text_str(self):
+        text = SAMPLE_LOG.decode()
+        output = normalize_text(text, MacNotation.PERIOD, lower=True)
+        self.assertEqual(
+            output, normalize_text(SAMPLE_LOG, MacNotation.PERIOD, True).decode()
+        )
+        self.assertIn("(246d.5ebb.99cc)", output)
+
+    def test_matches_mac_address(self):
+        """
+        Output agrees with formatting each address through `MacAddress`
+        """
+        macs, text = create_macs_log(200)
+        for notation in MacNotation:
+            expected = "".join(
+                f"line {i} -> {MacAddress.format_mac_address(mac, notation)} ok\n"
+                for i, mac in enumerate(macs)
+            )
+            self.assertEqual(normalize_text(text, notation), expected)
+
+    def test_loose_pattern(self):
+        """
+        The loose pattern is an opt-in that also takes space-delimited addresses
+        """
+        macs, text = create_macs_log(50, notations=[MacNotation.SPACE])
+        self.assertEqual(normalize_text(text), text)
+        expected = "".join(
+            f"line {i} -> {MacAddress.format_mac_address(mac, MacNotation.COLON)} ok\n"
+            for i, mac in enumerate(macs)
+        )
+        self.assertEqual(normalize_text(text, regex=SCAN_REGEX), expected)
+
+    def test_unrelated_tokens(self):
+        """
+        UUIDs, hashes and long integers pass through unchanged by default
+        """
+        text = (
+            "id=123e4567-e89b-12d3-a456-426614174000 "
+            "md5=9e107d9d372bb6826bd81d3542a419d6 "
+            "sha=0123456789abcdef0123456789abcdef01234567 "
+            "ns=1729000000123 count=12345678901234567890 hex=0x246d5ebb99cc "
+            "ipv6=fe80::246d:5eff:febb:99cc mac=24:6d:5e:bb:99:cc\n"
+        )
+        expected = text.replace("24:6d:5e:bb:99:cc", "24-6D-5E-BB-99-CC")
+        self.assertEqual(normalize_text(text, MacNotation.HYPHEN), expected)
+
+        output = BytesIO()
+        count = normalize_stream(BytesIO(text.encode()), output, MacNotation.HYPHEN)
+        self.assertEqual((output.getvalue(), count), (expected.encode(), 1))
+
+        # The loose pattern takes the hex literal as a bare address
+        self.assertIn(
+            b"0x24:6D:5E:BB:99:CC",
+            normalize_text(text.encode(), regex=SCAN_BYTES_REGEX),
+        )
+
+    def test_normalize_stream(self):
+        """
+        Chunked rewriting matches the one-shot result for any chunk size
+        """
+        text = create_macs_log(500)[1].encode()
+        expected = normalize_text(text, MacNotation.HYPHEN, lower=True)
+        for chunk_size in [1, 7, 23, 24, 100, 1 << 20]:
+            with self.subTest(chunk_size=chunk_size):
+                output = BytesIO()
+                count = normalize_stream(
+                    BytesIO(text), output, MacNotation.HYPHEN, True, chunk_size
+                )
+                self.assertEqual(output.getvalue(), expected)
+                self.assertEqual(count, 500)
+
+    def test_normalize_file(self):
+        with TemporaryDirectory() as temp_dir:
+            source = path.join(temp_dir, "in.log")
+            target = path.join(temp_dir, "out.log")
+            with open(source, "wb") as file:
+                file.write(SAMPLE_LOG)
+            self.assertEqual(normalize_file(source, target, MacNotation.CLEAN), 4)
+            with open(target, "rb") as file:
+                self.assertEqual(
+                    file.read(), normalize_text(SAMPLE_LOG, MacNotation.CLEAN)
+                )
+
+
+if __name__ == "__main__":
+    main()
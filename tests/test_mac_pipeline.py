@@ -0,0 +1,108 @@
+# MacTools MAC Aggregation Pipeline Tests
+
+# Python Modules
+from collections import Counter
+from itertools import pairwise
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.mac_pipeline import (
+    UNKNOWN_VENDOR,
+    ScanRange,
+    aggregate_files,
+    count_range,
+    split_file,
+)
+from mactools.oui_cache.oui_classes import OUIType
+from tests.test_common import TEST_CACHE, TEST_OUI_STRING, TEST_VENDOR
+
+# MACs within each of the test registrations plus a locally administered one
+TEST_LINES = [
+    b"dhcp ack 24:6D:5E:00:00:01 on eth0\n",
+    b"switch learned 246d.5e00.0001 port 1\n",
+    b"arp 79-B7-4D-A0-00-02 vlan 10\n",
+    b"neighbor 24B7BD603ABC seen\n",
+    b"random 4E:00:00:00:00:01 and 24:6D:5E:00:00:01\n",
+    b"no address on this line\n",
+]
+
+
+class TestMacPipeline(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+        cls.file_paths = []
+        for i in range(2):
+            file_path = path.join(cls.temp_dir.name, f"{i}.log")
+            with open(file_path, "wb") as file:
+                file.write(b"".join(TEST_LINES) * 50)
+            cls.file_paths.append(file_path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def check_report(self, report, copies: int):
+        self.assertEqual(report.total, 6 * 50 * copies)
+        self.assertEqual(report.mac_counts[0x246D5E000001], 3 * 50 * copies)
+        self.assertEqual(
+            report.vendor_counts,
+            Counter(
+                {
+                    TEST_VENDOR[OUIType.OUI]: 3 * 50 * copies,
+                    TEST_VENDOR[OUIType.OUI28]: 50 * copies,
+                    TEST_VENDOR[OUIType.OUI36]: 50 * copies,
+                    "Locally administered": 50 * copies,
+                }
+            ),
+        )
+        self.assertNotIn(UNKNOWN_VENDOR, report.vendor_counts)
+
+    def test_split_file(self):
+        """
+        Ranges cover the file exactly and end on line boundaries
+        """
+        file_path = self.file_paths[0]
+        ranges = split_file(file_path, 100)
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0].start, 0)
+        self.assertEqual(ranges[-1].stop, path.getsize(file_path))
+        with open(file_path, "rb") as file:
+            data = file.read()
+        for previous, current in pairwise(ranges):
+            self.assertEqual(previous.stop, current.start)
+            self.assertEqual(data[current.start - 1 : current.start], b"\n")
+
+        self.assertEqual(split_file(file_path), [ScanRange(file_path)])
+
+    def test_ranges_match_whole_file(self):
+        file_path = self.file_paths[0]
+        whole = count_range(ScanRange(file_path))
+        split = Counter()
+        for scan_range in split_file(file_path, 64):
+            split.update(count_range(scan_range))
+        self.assertEqual(split, whole)
+        self.assertEqual(whole["246D5E000001"], 150)
+
+    def test_aggregate_in_process(self):
+        report = aggregate_files(self.file_paths, workers=1, cache=TEST_CACHE)
+        self.check_report(report, 2)
+        self.assertEqual(
+            report.vendors[int(f"{TEST_OUI_STRING[OUIType.OUI36]}ABC", 16)],
+            TEST_VENDOR[OUIType.OUI36],
+        )
+
+    def test_aggregate_process_pool(self):
+        """
+        Workers attach to the shared registry and their partial reports merge
+        """
+        report = aggregate_files(
+            self.file_paths, workers=2, split_size=500, cache=TEST_CACHE
+        )
+        self.check_report(report, 2)
+
+
+if __name__ == "__main__":
+    main()
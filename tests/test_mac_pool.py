@@ -0,0 +1,164 @@
+# MacTools MAC Address Pool Tests
+
+# Python Modules
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.mac_pool import BLOCK_WINDOW, MacPool, find_free_run
+from tests.test_common import SAMPLE_EUI48
+
+BASE = 0x246D5E000000
+
+
+class TestMacPool(TestCase):
+    def test_range(self):
+        """
+        Pools over a range or a prefix, of either EUI
+        """
+        pool = MacPool("24:6D:5E:00:00:00", "24:6D:5E:00:00:09")
+        self.assertEqual((pool.first, pool.size, len(pool)), (BASE, 10, 0))
+
+        oui = MacPool.from_prefix("24:6D:5E")
+        self.assertEqual((oui.first, oui.size), (BASE, 1 << 24))
+        block = MacPool.from_prefix("24:6D:5E:BB:99:CC:0", eui=64)
+        self.assertEqual((block.first, block.size), (0x246D5EBB99CC0 << 12, 4096))
+
+        for first, last, eui in [(10, 9, 48), (0, 1 << 48, 48), (0, 1, 32)]:
+            with self.assertRaises(ValueError):
+                MacPool(first, last, eui)
+
+    def test_allocate(self):
+        """
+        Next-fit allocation, reserved addresses are skipped and freed ones reused
+        only after wrapping around
+        """
+        pool = MacPool(BASE, BASE + 9)
+        pool.reserve(BASE + 1)
+        pool.reserve("24-6D-5E-00-00-03")
+        self.assertEqual(
+            [pool.allocate() for _ in range(3)], [BASE, BASE + 2, BASE + 4]
+        )
+
+        pool.free(BASE + 1)
+        self.assertEqual(
+            [pool.allocate() for _ in range(6)],
+            [BASE + 5, BASE + 6, BASE + 7, BASE + 8, BASE + 9, BASE + 1],
+        )
+        self.assertEqual((len(pool), pool.available), (10, 0))
+        self.assertIn("24:6D:5E:00:00:09", pool)
+        self.assertNotIn(BASE + 10, pool)
+        with self.assertRaises(ValueError):
+            pool.allocate()
+
+        with self.assertRaises(ValueError):
+            pool.reserve(BASE)
+        pool.free(BASE)
+        with self.assertRaises(ValueError):
+            pool.free(BASE)
+        with self.assertRaises(ValueError):
+            pool.reserve(BASE + 10)
+
+    def test_allocate_many(self):
+        """
+        Bulk allocation of scattered and contiguous addresses
+        """
+        pool = MacPool(BASE, BASE + 99)
+        for i in [3, 20, 21, 50]:
+            pool.reserve(BASE + i)
+        macs = pool.allocate_many(30)
+        expected = [BASE + i for i in range(33) if i not in [3, 20, 21]]
+        self.assertEqual(macs.tolist(), expected)
+
+        # The lowest run long enough, skipping the gap before the reserved address
+        self.assertEqual(pool.allocate_block(40), range(BASE + 51, BASE + 91))
+        with self.assertRaises(ValueError):
+            pool.allocate_block(18)
+        self.assertEqual(pool.allocate_block(17), range(BASE + 33, BASE + 50))
+
+        # The rest wraps past the end of the pool
+        self.assertEqual(
+            pool.allocate_many(9).tolist(), list(range(BASE + 91, BASE + 100))
+        )
+        self.assertEqual(pool.available, 0)
+        with self.assertRaises(ValueError):
+            pool.allocate_many(1)
+        with self.assertRaises(ValueError):
+            pool.allocate_many(-1)
+
+    def test_allocate_block(self):
+        """
+        Blocks are found across the bitmap windows and in freed space
+        """
+        size = BLOCK_WINDOW * 8 * 3
+        pool = MacPool(BASE, BASE + size - 1)
+        pool.allocate_many(size)
+
+        # A run too short for the block, then one crossing the first window
+        boundary = (BLOCK_WINDOW - 14) * 8
+        for i in [*range(100, 150), *range(boundary - 40, boundary + 60)]:
+            pool.free(BASE + i)
+        self.assertEqual(
+            pool.allocate_block(100), range(BASE + boundary - 40, BASE + boundary + 60)
+        )
+        self.assertEqual(pool.allocate_block(50), range(BASE + 100, BASE + 150))
+        with self.assertRaises(ValueError):
+            pool.allocate_block(1)
+
+        pool.free(BASE + size - 1)
+        self.assertEqual(pool.allocate_block(1), range(BASE + size - 1, BASE + size))
+
+    def test_find_free_run(self):
+        for free, length, result in [
+            (0b0111_0110, 3, 4),
+            (0b0111_0110, 4, -1),
+            (0b1, 1, 0),
+            (0, 1, -1),
+            (((1 << 1000) - 1) << 5, 1000, 5),
+        ]:
+            self.assertEqual(find_free_run(free, length), result)
+
+    def test_persistence(self):
+        """
+        Pools survive a save and load, damaged files are rejected
+        """
+        pool = MacPool(BASE, BASE + 20)
+        pool.allocate_many(7)
+        pool.reserve(BASE + 15)
+        with TemporaryDirectory() as temp_dir:
+            file_path = path.join(temp_dir, "pool.bin")
+            pool.save(file_path)
+            self.assertFalse(path.exists(f"{file_path}.tmp"))
+
+            loaded = MacPool.load(file_path)
+            self.assertEqual((loaded.first, loaded.size, len(loaded)), (BASE, 21, 8))
+            self.assertEqual(loaded.allocate(), BASE + 7)
+            self.assertIn(BASE + 15, loaded)
+
+            with open(file_path, "rb") as file:
+                data = file.read()
+            for damaged in [data[:-1], data[:-1] + b"\xff", b"MTPOOL00" + data[8:]]:
+                with open(file_path, "wb") as file:
+                    file.write(damaged)
+                with self.assertRaises(ValueError):
+                    MacPool.load(file_path)
+
+    def test_full_oui(self):
+        """
+        A whole 24-bit block can be filled and stored as a 2 MiB bitmap
+        """
+        pool = MacPool.from_prefix("24:6D:5E")
+        self.assertEqual(pool.allocate_block(1 << 24), range(BASE, BASE + (1 << 24)))
+        self.assertEqual(pool.available, 0)
+
+        pool.free("24:6D:5E:BB:99:CC")
+        self.assertEqual(pool.allocate(), SAMPLE_EUI48.decimal)
+        with TemporaryDirectory() as temp_dir:
+            file_path = path.join(temp_dir, "pool.bin")
+            pool.save(file_path)
+            self.assertEqual(len(MacPool.load(file_path)), 1 << 24)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# MacTools MAC Scanner Tests
+
+# Python Modules
+from io import BytesIO
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools import MacNotation, create_random_mac
+from mactools.mac_scanner import MacMatch, scan_bytes, scan_file, scan_stream
+from mactools.tools_common import (
+    STRICT_REGEXES,
+    STRICT_SCAN_BYTES_REGEX,
+    STRICT_SCAN_REGEX,
+)
+from tests.test_common import SAMPLE_EUI48, SAMPLE_EUI64
+
+SAMPLE_LOG = (
+    b"Jan 1 00:00:01 dhcpd: DHCPACK to 10.0.0.5 (24:6D:5E:BB:99:CC) via eth0\n"
+    b"Jan 1 00:00:02 switch: learned 246d.5ebb.99cc on Gi1/0/1\n"
+    b"Jan 1 00:00:03 host: address 24-6D-5E-00-00-BB-99-DD seen\n"
+    b"sha1=0123456789abcdef0123456789abcdef01234567 bare 246D5EBB99CC\n"
+)
+
+
+def create_random_log(lines: int, seed: int = 0) -> bytes:
+    """
+    Returns log-like text with MACs of every notation between filler words
+    """
+    rng = Random(seed)  # nosec B311
+    notations = list(MacNotation)
+    output = []
+    for i in range(lines):
+        mac = create_random_mac(rng.choice([48, 64]), rng.choice(notations))  # nosec B311
+        output.append(f"line {i} token={rng.getrandbits(32):08x} mac {mac} end")
+    return "\n".join(output).encode()
+
+
+class TestMacScanner(TestCase):
+    def test_scan_notations(self):
+        """
+        Each notation is reported with its value, offset and EUI size
+        """
+        results = list(scan_bytes(SAMPLE_LOG))
+        self.assertEqual(
+            results,
+            [
+                MacMatch(
+                    SAMPLE_EUI48.decimal,
+                    SAMPLE_LOG.index(b"24:6D"),
+                    MacNotation.COLON,
+                    48,
+                ),
+                MacMatch(
+                    SAMPLE_EUI48.decimal,
+                    SAMPLE_LOG.index(b"246d."),
+                    MacNotation.PERIOD,
+                    48,
+                ),
+                MacMatch(
+                    SAMPLE_EUI64.decimal,
+                    SAMPLE_LOG.index(b"24-6D"),
+                    MacNotation.HYPHEN,
+                    64,
+                ),
+                MacMatch(
+                    SAMPLE_EUI48.decimal,
+                    SAMPLE_LOG.index(b"246D5E"),
+                    MacNotation.CLEAN,
+                    48,
+                ),
+            ],
+        )
+
+    def test_hex_runs_rejected(self):
+        self.assertEqual(list(scan_bytes(b"deadbeef" * 8)), [])
+        self.assertEqual(list(scan_bytes(b"x0011223344556677889")), [])
+
+    def test_chunk_boundaries(self):
+        """
+        Streaming with any chunk size matches scanning the whole buffer
+        """
+        data = create_random_log(200)
+        expected = list(scan_bytes(data))
+        self.assertGreaterEqual(len(expected), 200)
+        for chunk_size in [1, 2, 7, 23, 24, 25, 64, 1000, 1 << 20]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(scan_stream(BytesIO(data), chunk_size)), expected)
+
+    def test_scan_file(self):
+        data = create_random_log(100, seed=1)
+        expected = list(scan_bytes(data))
+        with TemporaryDirectory() as temp_dir:
+            file_path = path.join(temp_dir, "test.log")
+            with open(file_path, "wb") as file:
+                file.write(data)
+            self.assertEqual(list(scan_file(file_path)), expected)
+            self.assertEqual(list(scan_file(file_path, chunk_size=100)), expected)
+
+            # Abandoning the scan part way must release the mapping cleanly
+            for _ in scan_file(file_path):
+                break
+
+            empty_path = path.join(temp_dir, "empty.log")
+            open(empty_path, "wb").close()
+            self.assertEqual(list(scan_file(empty_path)), [])
+
+    def test_strict_notations(self):
+        """
+        Strict patterns match a single delimiter style with clean boundaries
+        """
+        accepted = {
+            ":": [
+                "24:6D:5E:BB:99:CC",
+                "(24:6d:5e:bb:99:cc)",
+                "24:6D:5E:00:00:BB:99:DD",
+            ],
+            "-": ["24-6D-5E-BB-99-CC", "mac=24-6D-5E-BB-99-CC,"],
+            ".": ["246D.5EBB.99CC", "246D.5EBB.99CC.", "246D.5E00.00BB.99DD"],
+            " ": ["24 6D 5E BB 99 CC", "[24 6D 5E BB 99 CC]"],
+            "": ["246D5EBB99CC", "id 246D5E0000BB99DD"],
+        }
+        rejected = {
+            ":": [
+                "24:6D:5E-BB:99:CC",
+                "2001:db8:24:6d:5e:bb:99:cc",
+                "x24:6D:5E:BB:99:CC",
+            ],
+            "-": ["2001-24-6D-5E-BB-99-CC", "24-6D-5E-BB-99-CC-1"],
+            ".": ["246D.5EBB.99CC.12", "0.246D.5EBB.99CC"],
+            " ": ["mac C0 D0 90 6E 51 39", "24 6D 5E BB 99 CC 00"],
+            "": ["246D5EBB99CC00", "0x246D5EBB99CC", "ab-246D5EBB99CC"],
+        }
+        for key, samples in accepted.items():
+            for sample in samples:
+                with self.subTest(sample=sample):
+                    self.assertIsNotNone(STRICT_REGEXES[key].search(sample))
+        for key, samples in rejected.items():
+            for sample in samples:
+                with self.subTest(sample=sample):
+                    self.assertIsNone(STRICT_REGEXES[key].search(sample))
+
+    def test_strict_scan(self):
+        """
+        The single-pass strict pattern finds what the separate patterns find
+        """
+        text = (
+            "24:6D:5E:BB:99:CC 24-6D-5E-BB-99-CC 246d.5ebb.99cc 246D5EBB99CC "
+            "24:6D:5E-BB:99:CC sha1=0123456789abcdef0123456789abcdef01234567 "
+            "uuid=123e4567-e89b-12d3-a456-426614174000 2001:db8::24:6d5e:bb99\n"
+        ) * 3
+        expected = sorted(
+            (found.start(), found.group())
+            for key in [":", "-", ".", ""]
+            for found in STRICT_REGEXES[key].finditer(text)
+        )
+        self.assertEqual(len(expected), 12)
+        self.assertEqual(
+            [(i.start(), i.group()) for i in STRICT_SCAN_REGEX.finditer(text)], expected
+        )
+
+        values = {
+            i.value for i in scan_bytes(text.encode(), regex=STRICT_SCAN_BYTES_REGEX)
+        }
+        self.assertEqual(values, {SAMPLE_EUI48.decimal})
+
+    def test_strict_chunk_boundaries(self):
+        data = create_random_log(200, seed=2)
+        expected = list(scan_bytes(data, regex=STRICT_SCAN_BYTES_REGEX))
+        self.assertGreater(len(expected), 100)
+        for chunk_size in [1, 2, 23, 24, 25, 1000]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(
+                        scan_stream(BytesIO(data), chunk_size, STRICT_SCAN_BYTES_REGEX)
+                    ),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    main()
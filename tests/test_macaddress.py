@@ -1,6 +1,7 @@
 # MAC Address Tests
 
 # Python Modules
+from ipaddress import IPv6Address, IPv6Network
 from re import Pattern, match
 from unittest import TestCase, main
 from unittest.mock import MagicMock, Mock, patch
@@ -11,6 +12,7 @@ from mactools import (
     create_random_hex_string,
     create_random_mac,
 )
+from mactools.basemac import BaseMac
 from mactools.tools_common import EUI48_REGEX, EUI64_REGEX, HEX_PATTERN, MAC_PORTION
 
 # Local Modules
@@ -158,6 +160,37 @@ class TestFunctions(TestCase):
     def test_get_link_local(self):
         self.assertEqual(self.mac48.link_local_address, "fe80::266d:5eff:febb:99cc")
 
+    def test_interface_id(self):
+        """
+        The U/L bit is inverted whichever way it was set
+        """
+        self.assertEqual(self.mac48.interface_id, 0x266D5EFFFEBB99CC)
+        self.assertEqual(self.mac64.interface_id, SAMPLE_EUI64.decimal)
+        local_mac = BaseMac("26:6D:5E:BB:99:CC")
+        self.assertEqual(local_mac.eui64_suffix, "246d:5eff:febb:99cc")
+        self.assertEqual(
+            BaseMac("00:11:22:AA:BB:CC").eui64_suffix,
+            "0211:22ff:feaa:bbcc",
+        )
+
+    def test_get_global_address(self):
+        expected = IPv6Address("2001:db8:0:1:266d:5eff:febb:99cc")
+        for prefix in [
+            "2001:db8:0:1",
+            "2001:db8:0:1:",
+            "2001:db8:0:1::",
+            "2001:db8:0:1::/64",
+            IPv6Network("2001:db8:0:1::/64"),
+        ]:
+            self.assertEqual(self.mac48.get_global_address(prefix), expected)
+        self.assertEqual(
+            self.mac48.get_global_address("2001:db8::/48"),
+            IPv6Address("2001:db8::266d:5eff:febb:99cc"),
+        )
+        for invalid in ["2001:db8::/96", "2001:db8:zz", "not a prefix"]:
+            with self.assertRaises(ValueError):
+                self.mac48.get_global_address(invalid)
+
     """
     Test Magic Methods
     """
@@ -176,16 +209,76 @@ class TestFunctions(TestCase):
             self.assertFalse("this should be false" == mac)
 
     def test_magic_add(self):
-        self.assertEqual(self.mac48 + 1, "24:6D:5E:BB:99:CD")
-        self.assertEqual(self.mac64 + 1, "24:6D:5E:00:00:BB:99:DE")
+        self.assertEqual(str(self.mac48 + 1), "24:6D:5E:BB:99:CD")
+        self.assertEqual(str(self.mac64 + 1), "24:6D:5E:00:00:BB:99:DE")
+        self.assertEqual(str(1 + self.mac48), "24:6D:5E:BB:99:CD")
 
     def test_magic_subtract(self):
         # Testing MAC-and-MAC subtraction
         for mac in self.mac_lookup:
             self.assertEqual(mac - mac, 0)
         # Testing MAC-and-number subtraction
-        self.assertEqual(self.mac48 - 1, "24:6D:5E:BB:99:CB")
-        self.assertEqual(self.mac64 - 1, "24:6D:5E:00:00:BB:99:DC")
+        self.assertEqual(str(self.mac48 - 1), "24:6D:5E:BB:99:CB")
+        self.assertEqual(str(self.mac64 - 1), "24:6D:5E:00:00:BB:99:DC")
+
+    def test_arithmetic_type(self):
+        """
+        Arithmetic keeps the class, format and cache of the original MAC
+        """
+        mac = MacAddress(SAMPLE_EUI48.mac, MacNotation.PERIOD, cache=TEST_CACHE)
+        shifted = mac + 0x10
+        self.assertIsInstance(shifted, MacAddress)
+        self.assertEqual(str(shifted), "246D.5EBB.99DC")
+        self.assertEqual(shifted.decimal, SAMPLE_EUI48.decimal + 0x10)
+        self.assertEqual(shifted.vendor, mac.vendor)
+        self.assertEqual(shifted - mac, 0x10)
+        self.assertEqual((mac - 0xBB99CC).clean, "246D5E000000")
+
+        # A different OUI is looked up in the same cache when first needed
+        cache = Mock()
+        cache.get_record.side_effect = lambda oui: {"vendor": oui}
+        other = MacAddress("24:6D:5E:FF:FF:FF", cache=cache).successor()
+        self.assertEqual(other.clean, "246D5F000000")
+        self.assertEqual(cache.get_record.call_count, 1)
+        self.assertEqual(other.vendor, "246D5F")
+
+        self.assertEqual(BaseMac("00:00:00:00:00:00").successor().clean, "000000000001")
+        for overflow in [
+            lambda: BaseMac("00:00:00:00:00:00").predecessor(),
+            lambda: BaseMac("FF:FF:FF:FF:FF:FF") + 1,
+        ]:
+            with self.assertRaises(ValueError):
+                overflow()
+
+    def test_range(self):
+        stop = "24:6D:5E:BB:99:D0"
+        self.assertEqual(
+            list(self.mac48.range_to(stop)),
+            list(range(SAMPLE_EUI48.decimal, SAMPLE_EUI48.decimal + 4)),
+        )
+        macs = list(self.mac48.iter_range(self.mac48 + 8, 2))
+        self.assertEqual([i.clean[-2:] for i in macs], ["CC", "CE", "D0", "D2"])
+        self.assertTrue(all(isinstance(i, MacAddress) for i in macs))
+        self.assertEqual(list(self.mac48.range_to(self.mac48)), [])
+
+    def test_bytes(self):
+        """
+        Raw bytes round-trip through any buffer-protocol object
+        """
+        for mac, test_mac in self.mac_lookup.items():
+            raw = test_mac.decimal.to_bytes(len(test_mac.mac) // 3 + 1, "big")
+            self.assertEqual(mac.to_bytes(), raw)
+            self.assertEqual(bytes(mac), raw)
+            for source in [raw, bytearray(raw), memoryview(raw)]:
+                self.assertEqual(MacAddress(source), mac)
+                from_bytes = MacAddress.from_bytes(source, MacNotation.CLEAN)
+                self.assertEqual(from_bytes.decimal, test_mac.decimal)
+
+        header = memoryview(bytes(self.mac48) + b"\x00" * 6 + b"\x08\x00")
+        self.assertEqual(MacAddress(header[:6]).period, "246D.5EBB.99CC")
+        for invalid in [b"", b"\x00" * 5, b"\x00" * 7, bytearray(9)]:
+            with self.assertRaises(ValueError):
+                MacAddress(invalid)
 
     def test_fuzz_mac(self):
         for i in range(100000):
@@ -0,0 +1,72 @@
+# MacTools Memory Diagnostics Tests
+
+# Python Modules
+from sys import getsizeof
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.basemac import BaseMac
+from mactools.memory import (
+    cache_footprint,
+    cached_names,
+    mac_footprint,
+    memory_report,
+    tier_footprint,
+    traced_size,
+)
+from mactools.oui_cache.oui_classes import OUIType
+from tests.test_common import (
+    SAMPLE_EUI48,
+    TEST_CACHE,
+    TEST_OUI_DICT,
+    TEST_OUI_STRING,
+    TEST_VENDOR,
+)
+
+
+class TestMemory(TestCase):
+    def test_tier_footprint(self):
+        """
+        Strings shared between the key and the record are counted once
+        """
+        tier = TEST_OUI_DICT[OUIType.OUI]
+        footprint = tier_footprint(tier)
+        self.assertEqual(footprint["entries"], 1)
+        self.assertEqual(footprint["keys"], getsizeof(TEST_OUI_STRING[OUIType.OUI]))
+        self.assertEqual(footprint["vendors"], getsizeof(TEST_VENDOR[OUIType.OUI]))
+        self.assertEqual(footprint["other"], getsizeof("oui"))
+        self.assertEqual(
+            footprint["total"],
+            sum(v for k, v in footprint.items() if k not in ("entries", "total")),
+        )
+
+    def test_cache_footprint(self):
+        footprint = cache_footprint(TEST_CACHE)
+        self.assertEqual(set(footprint["tiers"]), {i.value for i in OUIType})
+        self.assertEqual(
+            footprint["total"],
+            footprint["container"]
+            + sum(i["total"] for i in footprint["tiers"].values()),
+        )
+
+    def test_mac_footprint(self):
+        mac = BaseMac(SAMPLE_EUI48.mac)
+        footprint = mac_footprint(mac)
+        self.assertEqual(footprint["cached"], [])
+        self.assertGreater(footprint["populated"], footprint["initial"])
+        self.assertTrue(all(i in vars(mac) for i in cached_names(BaseMac)))
+        self.assertIn("link_local_address", cached_names(BaseMac))
+
+    def test_traced_size(self):
+        self.assertGreaterEqual(traced_size(lambda: bytearray(1000), 100), 1000)
+
+    def test_memory_report(self):
+        report = memory_report(TEST_CACHE)
+        self.assertEqual(list(report), ["oui_cache", "BaseMac", "MacAddress"])
+        self.assertEqual(report["MacAddress"]["cached"], ["clean_oui"])
+        self.assertGreater(report["BaseMac"]["traced_populated"], 0)
+        self.assertNotIn("traced_initial", memory_report(TEST_CACHE, False)["BaseMac"])
+
+
+if __name__ == "__main__":
+    main()
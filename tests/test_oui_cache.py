@@ -1,6 +1,9 @@
 # MacTools OUI tests
 
 # Python Modules
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Thread
 from typing import TYPE_CHECKING
 from unittest import TestCase, main
 from unittest.mock import DEFAULT, Mock, patch
@@ -9,8 +12,11 @@ if TYPE_CHECKING:
     from unittest.mock import _patch_default_new
 
 # Local modules
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_common import create_oui_dict
 from mactools.oui_cache.oui_core import get_oui_cache, get_oui_record, get_oui_vendor
 from tests.test_common import (
+    OUI_CLASSES_PATH,
     OUI_COMMON_PATH,
     TEST_OUI_DICT,
     TEST_OUI_STRING,
@@ -105,6 +111,15 @@ class TestOUICache(TestCase):
         test_result = get_oui_vendor("33:33:0A")
         self.assertEqual(test_result, "IPv6 Multicast")
 
+    def test_local_only_record(self):
+        """
+        Disabling the remote fallback answers from the cache alone
+        """
+        with patch("mactools.oui_cache.oui_classes.urlopen") as mocked_urlopen:
+            result = get_oui_cache().get_record("0C0C0C", remote=False)
+            mocked_urlopen.assert_not_called()
+        self.assertEqual(result["vendor"], "Unregistered")
+
     def test_invalid_get_oui_item(self):
         """
         Tests for the inner functionality of cache getting
@@ -128,6 +143,176 @@ class TestOUICache(TestCase):
             expected = {"input": test_case, "error": True, "note": result_note}
             self.assertEqual(result, expected)
 
+    def test_snapshot_is_read_only(self):
+        """
+        Readers receive an immutable snapshot and copies of the records
+        """
+        local_cache = get_oui_cache()
+        with self.assertRaises(TypeError):
+            local_cache.oui_dict[OUIType.OUI]["AAAAAA"] = {}  # pyright: ignore
+
+        record = local_cache.get_record(TEST_OUI_STRING[OUIType.OUI])
+        record["vendor"] = "Changed"
+        self.assertEqual(
+            local_cache.get_vendor(TEST_OUI_STRING[OUIType.OUI]),
+            TEST_VENDOR[OUIType.OUI],
+        )
+
+    def test_copy_on_write(self):
+        """
+        Writes swap in a new snapshot while held snapshots stay unchanged
+        """
+        local_cache = get_oui_cache()
+        original = local_cache.oui_dict
+        test_record = {"vendor": "COW Test", "oui": "0C0C0C", "address": ""}
+        timestamp = local_cache.timestamp
+        try:
+            local_cache.add_record(OUIType.OUI, "0C0C0C", test_record)
+            self.assertGreater(local_cache.timestamp, timestamp)
+            self.assertNotIn("0C0C0C", original[OUIType.OUI])
+            self.assertEqual(local_cache.get_vendor("0C0C0C"), "COW Test")
+        finally:
+            local_cache.swap_oui_dict(original)
+
+    def test_concurrent_reads_and_writes(self):
+        """
+        Threads reading during copy-on-write updates never observe a partial state
+        """
+        local_cache = get_oui_cache()
+        original = local_cache.oui_dict
+        failures: list[str] = []
+
+        def reader():
+            for _ in range(2000):
+                for oui_type, oui in TEST_OUI_STRING.items():
+                    if local_cache.get_vendor(oui) != TEST_VENDOR[oui_type]:
+                        failures.append(oui)
+
+        def writer():
+            for i in range(200):
+                oui = f"0D{i:04X}"
+                local_cache.add_record(OUIType.OUI, oui, {"vendor": "", "oui": oui})
+
+        try:
+            threads = [Thread(target=reader) for _ in range(4)] + [
+                Thread(target=writer)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(failures, [])
+            self.assertEqual(len(local_cache.oui_dict[OUIType.OUI]), 201)
+        finally:
+            local_cache.swap_oui_dict(original)
+
+    def test_create_from_file_paths(self):
+        """
+        Registry files given by path are read without checking for updates
+        """
+        with TemporaryDirectory() as temp_dir:
+            file_paths = []
+            for name, oui_type in [
+                ("oui36", OUIType.OUI36),
+                ("mam", OUIType.OUI28),
+                ("oui", OUIType.OUI),
+            ]:
+                file_paths.append(path.join(temp_dir, f"{name}.csv"))
+                with open(file_paths[-1], "w", encoding="utf-8") as file:
+                    file.write("Registry,Assignment,Organization Name,Address\n")
+                    file.write(f"{oui_type.value},{TEST_OUI_STRING[oui_type]},")
+                    file.write(f'"{TEST_VENDOR[oui_type]}",Street\n')
+
+            oui_dict = create_oui_dict(file_paths=file_paths)
+            self.assertEqual(
+                oui_dict[OUIType.OUI]["246D5E"]["vendor"], TEST_VENDOR[OUIType.OUI]
+            )
+            self.assertEqual(len(oui_dict[OUIType.OUI36]), 1)
+
+            with self.assertRaises(FileNotFoundError):
+                create_oui_dict(file_paths=[path.join(temp_dir, "missing.csv")])
+
+    def test_stats(self):
+        """
+        Look-ups are counted by resolution path only while enabled
+        """
+        local_cache = get_oui_cache()
+        self.assertEqual(local_cache.stats(), {})
+        local_cache.get_record(TEST_OUI_STRING[OUIType.OUI])
+        local_cache.enable_stats()
+        self.addCleanup(local_cache.disable_stats)
+        self.assertEqual(local_cache.stats()["lookups"], 0)
+
+        paths = {
+            "FFFFFFFFFFFF": "specific_mac",
+            "0180C2000001": "fixed_oui",
+            "333300000001": "range",
+            "0A0000000001": "locally_administered",
+            TEST_OUI_STRING[OUIType.OUI36]: "MA-S",
+            TEST_OUI_STRING[OUIType.OUI28]: "MA-M",
+            TEST_OUI_STRING[OUIType.OUI]: "MA-L",
+            "00000A000001": "unregistered",
+            "not hex": "invalid_hex",
+            "AAAA": "too_short",
+        }
+        local_cache.get_records(paths, remote=False)
+        local_cache.get_record(TEST_OUI_STRING[OUIType.OUI])
+
+        stats = local_cache.stats()
+        expected = dict.fromkeys(paths.values(), 1) | {"MA-L": 2}
+        self.assertEqual(stats["paths"], expected)
+        self.assertEqual((stats["lookups"], stats["errors"]), (11, 2))
+        latency = stats["latency"]["MA-L"]
+        self.assertEqual(latency["count"], 2)
+        self.assertEqual(sum(latency["buckets"].values()), 2)
+        self.assertLessEqual(latency["p50_ns"], latency["max_ns"])
+
+        # Remote calls and the registry rebuild they trigger are timed
+        response = Mock(code=200)
+        response.read.return_value = b'{"success": true, "found": false}'
+        with (
+            patch(f"{OUI_CLASSES_PATH}.urlopen") as mocked_urlopen,
+            patch(
+                f"{OUI_CLASSES_PATH}.create_oui_dict", return_value=TEST_OUI_DICT
+            ) as mocked_create,
+        ):
+            mocked_urlopen.return_value.__enter__.return_value = response
+            local_cache.get_record("00000A000001")
+            mocked_create.assert_called_once_with(update=True)
+
+        stats = local_cache.stats()
+        self.assertEqual(stats["paths"]["remote_unregistered"], 1)
+        self.assertEqual(stats["remote_calls"]["count"], 1)
+        self.assertEqual(stats["rebuilds"]["count"], 1)
+
+        # A failing remote call is counted before the error is raised
+        with (
+            patch(f"{OUI_CLASSES_PATH}.urlopen", side_effect=OSError("offline")),
+            self.assertRaises(OSError),
+        ):
+            local_cache.get_record("00000A000001")
+        self.assertEqual(local_cache.stats()["paths"]["remote_error"], 1)
+
+        # Look-ups made on other threads are merged in
+        threads = [
+            Thread(
+                target=local_cache.get_records,
+                args=(
+                    [f"{TEST_OUI_STRING[OUIType.OUI]}{i:06X}" for i in range(100)],
+                    False,
+                ),
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(local_cache.stats()["paths"]["MA-L"], 402)
+
+        local_cache.reset_stats()
+        self.assertEqual(local_cache.stats()["lookups"], 0)
+
     def test_fuzz_oui_cache(self):
         with patch("mactools.oui_cache.oui_classes.create_oui_dict") as patched_update:
             patched_update.return_value = TEST_OUI_DICT
@@ -0,0 +1,144 @@
+# MacTools Registry History Tests
+
+# Python Modules
+from datetime import UTC, date, datetime, timedelta
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from unittest.mock import patch
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUICache, OUIType
+from mactools.oui_cache.oui_history import ArchivedOUICache, OUIHistory
+from mactools.update_ieee import update_ieee_files
+from tests.test_common import TEST_CACHE, TEST_OUI_DICT, TEST_OUI_STRING, TEST_VENDOR
+
+OUI = TEST_OUI_STRING[OUIType.OUI]
+ADDED_OUI = "0C0000"
+
+
+def registry_version(vendor: str, added: bool = False) -> dict:
+    """
+    Returns the test registry with the MA-L vendor renamed and optionally an
+    extra assignment
+    """
+    tier = {OUI: {**TEST_OUI_DICT[OUIType.OUI][OUI], "vendor": vendor}}
+    if added:
+        tier[ADDED_OUI] = {"vendor": "Added", "oui": ADDED_OUI, "address": "Street"}
+    return {**TEST_OUI_DICT, OUIType.OUI: tier}
+
+
+class TestOUIHistory(TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.history = OUIHistory(self.temp_dir.name, keyframe_interval=2)
+        self.history.add_snapshot(TEST_OUI_DICT, datetime(2024, 1, 1))
+        self.history.add_snapshot(
+            registry_version("Second", True), datetime(2024, 2, 1)
+        )
+        self.history.add_snapshot(registry_version("Third"), datetime(2024, 3, 1))
+        self.history.add_snapshot(registry_version("Fourth"), datetime(2024, 4, 1))
+
+    def test_as_of(self):
+        self.assertEqual(
+            self.history.get_vendor(OUI, date(2024, 1, 15)), TEST_VENDOR[OUIType.OUI]
+        )
+        self.assertEqual(self.history.get_vendor(OUI, date(2024, 2, 1)), "Second")
+        self.assertEqual(self.history.get_vendor(OUI, datetime(2024, 3, 2)), "Third")
+        self.assertEqual(self.history.get_vendor(OUI, date(2030, 1, 1)), "Fourth")
+        self.assertEqual(self.history.get_vendor(ADDED_OUI, date(2024, 2, 15)), "Added")
+
+        # Removed assignments fall through to the unregistered record
+        record = self.history.get_record(ADDED_OUI, date(2024, 3, 15))
+        self.assertEqual(record["vendor"], "Unregistered")
+
+        with self.assertRaises(ValueError):
+            self.history.get_record(OUI, date(2023, 12, 31))
+
+    def test_aware_datetimes(self):
+        """
+        Aware datetimes are compared and stored as naive local times
+        """
+        as_of = datetime(2024, 2, 15, tzinfo=UTC)
+        self.assertEqual(self.history.get_vendor(OUI, as_of), "Second")
+
+        fetched = datetime(2024, 5, 1, tzinfo=UTC)
+        self.assertTrue(self.history.add_snapshot(registry_version("Fifth"), fetched))
+        self.assertIsNone(self.history.versions[-1].tzinfo)
+        self.assertEqual(
+            OUIHistory(self.temp_dir.name).versions[-1],
+            fetched.astimezone().replace(tzinfo=None),
+        )
+
+    def test_reads_from_keyframe(self):
+        """
+        A version is rebuilt from its keyframe without reading older versions
+        """
+        with patch.object(
+            OUIHistory,
+            "_read_version",
+            autospec=True,
+            side_effect=OUIHistory._read_version,
+        ) as read_version:
+            self.history.get_cache(date(2024, 4, 1))
+        self.assertEqual([i.args[1] for i in read_version.call_args_list], [2, 3])
+
+    def test_reopen(self):
+        history = OUIHistory(self.temp_dir.name)
+        self.assertEqual(len(history.versions), 4)
+        self.assertEqual(history.get_vendor(OUI, date(2024, 2, 1)), "Second")
+
+        cache = history.get_cache(date(2024, 2, 1))
+        self.assertIsInstance(cache, ArchivedOUICache)
+        self.assertIsNot(cache, OUICache._instance)
+        self.assertIs(history.get_cache(date(2024, 2, 2)), cache)
+        self.assertEqual(cache.timestamp, datetime(2024, 2, 1))
+
+        # The global cache is untouched by archived versions
+        self.assertEqual(TEST_CACHE.get_vendor(OUI), TEST_VENDOR[OUIType.OUI])
+
+    def test_add_snapshot(self):
+        self.assertFalse(
+            self.history.add_snapshot(registry_version("Fourth"), datetime(2024, 5, 1))
+        )
+        self.assertEqual(len(self.history.versions), 4)
+        with self.assertRaises(ValueError):
+            self.history.add_snapshot(TEST_OUI_DICT, datetime(2024, 1, 2))
+        # An unchanged re-fetch is skipped whatever its time
+        self.assertFalse(
+            self.history.add_snapshot(registry_version("Fourth"), datetime(2024, 4, 1))
+        )
+
+        # A fetch at the same clock reading as the last version lands just after it
+        last = datetime(2100, 1, 1)
+        self.history.add_snapshot(registry_version("Fifth"), last)
+        with patch("mactools.oui_cache.oui_history.datetime") as mocked_datetime:
+            mocked_datetime.now.return_value = last
+            self.assertTrue(self.history.add_snapshot(registry_version("Sixth")))
+        self.assertEqual(self.history.versions[-1], last + timedelta(microseconds=1))
+
+        delta = path.getsize(path.join(self.temp_dir.name, "000003.json.gz"))
+        keyframe = path.getsize(path.join(self.temp_dir.name, "000002.json.gz"))
+        self.assertLess(delta, keyframe)
+
+    @patch("builtins.print", return_value=None)
+    def test_update_ieee_files(self, _print):
+        """
+        Successful downloads are archived when a history directory is given
+        """
+
+        def downloads(coroutine):
+            coroutine.close()
+            return [True] * 3
+
+        with (
+            patch("mactools.update_ieee.run", side_effect=downloads),
+            patch.object(OUIHistory, "add_files") as add_files,
+        ):
+            self.assertTrue(update_ieee_files(history=self.temp_dir.name))
+        self.assertEqual(len(add_files.call_args.args[0]), 3)
+
+
+if __name__ == "__main__":
+    main()
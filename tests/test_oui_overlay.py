@@ -0,0 +1,152 @@
+# MacTools OUI Cache Overlay Tests
+
+# Python Modules
+from importlib.util import find_spec
+from unittest import TestCase, main, skipUnless
+from unittest.mock import patch
+
+# Local Modules
+from mactools.mac_common import prepare_oui
+from mactools.macaddress import MacAddress
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_overlay import OUIOverlay, clean_prefix
+from tests.test_common import (
+    SAMPLE_EUI48,
+    TEST_CACHE,
+    TEST_OUI_DICT,
+    TEST_OUI_STRING,
+    TEST_VENDOR,
+)
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from mactools.oui_cache.oui_vector import lookup_vendors
+
+SITE_MAC = "0C:00:00:12:34:56"
+
+
+class TestOUIOverlay(TestCase):
+    def setUp(self) -> None:
+        TEST_CACHE.swap_oui_dict(TEST_OUI_DICT)
+        self.overlay = OUIOverlay(
+            TEST_CACHE,
+            {
+                "0C-00-00": "Site Switches",
+                "0C000012": {"vendor": "Site Cameras", "address": "Rack 4"},
+                "02:00": "Lab VMs",
+            },
+        )
+
+    def test_precedence(self):
+        """
+        Longer prefixes win within a layer and overlay records win over the
+        base, including locally administered prefixes
+        """
+        record = self.overlay.get_record(SITE_MAC)
+        self.assertEqual(record["vendor"], "Site Cameras")
+        self.assertEqual(record["oui"], "0C000012")
+        self.assertFalse(record["error"])
+        self.assertEqual(self.overlay.get_vendor("0C0000FFFFFF"), "Site Switches")
+        self.assertEqual(self.overlay.get_vendor("02:00:5E:00:00:01"), "Lab VMs")
+
+        # Everything else resolves from the base
+        oui = TEST_OUI_STRING[OUIType.OUI]
+        self.assertEqual(self.overlay.get_vendor(oui), TEST_VENDOR[OUIType.OUI])
+        self.assertEqual(
+            self.overlay.get_vendor("06:00:00:00:00:01"), "Locally administered"
+        )
+        self.assertEqual(
+            self.overlay.get_record("ZZ", False),
+            TEST_CACHE.get_record("ZZ", False),
+        )
+
+    def test_probes(self):
+        """
+        A MAC outside the overlay costs one probe per layer, others try only
+        the prefix lengths under their first octet, longest first
+        """
+
+        class Counting(dict):
+            probes = 0
+
+            def get(self, key, default=None):
+                Counting.probes += 1
+                return super().get(key, default)
+
+        self.overlay.update({f"0D{i:04X}": f"Site {i}" for i in range(100)})
+        records, index = self.overlay._layer
+        self.assertEqual(dict(index), {"0C": (8, 6), "0D": (6,), "02": (4,)})
+        self.overlay._layer = (Counting(records), Counting(index))
+        top = OUIOverlay(self.overlay, {"0E0000": "Top Switches"})
+        top._layer = (Counting(top.records), Counting(top._layer[1]))
+
+        for mac, vendor, probes in [
+            (SAMPLE_EUI48.mac, TEST_VENDOR[OUIType.OUI], 2),
+            (SITE_MAC, "Site Cameras", 3),
+            ("0C:00:00:FF:FF:FF", "Site Switches", 4),
+            ("0D:00:63:00:00:01", "Site 99", 3),
+            ("0E:00:00:00:00:01", "Top Switches", 2),
+        ]:
+            Counting.probes = 0
+            with patch(
+                "mactools.oui_cache.oui_overlay.prepare_oui", wraps=prepare_oui
+            ) as mocked_prepare:
+                self.assertEqual(top.get_vendor(mac), vendor)
+            self.assertEqual((Counting.probes, mocked_prepare.call_count), (probes, 1))
+
+    def test_stacking(self):
+        """
+        A higher layer wins over any prefix length beneath it
+        """
+        top = OUIOverlay(self.overlay, {"0C0000": "Top Switches"})
+        self.assertEqual(top.get_vendor(SITE_MAC), "Top Switches")
+        self.assertEqual(top.get_vendor("02:00:5E:00:00:01"), "Lab VMs")
+        self.assertEqual(top.layers(), ([top, self.overlay], TEST_CACHE))
+
+    def test_update_and_remove(self):
+        self.overlay.add_record("0c0000123456", "Site Printer")
+        self.assertEqual(self.overlay.get_vendor(SITE_MAC), "Site Printer")
+        self.overlay.remove_record("0C0000123456")
+        self.overlay.remove_record("0C000012")
+        self.assertEqual(self.overlay.get_vendor(SITE_MAC), "Site Switches")
+
+        for invalid in ["0", "0C00ZZ", "0C" * 9]:
+            with self.assertRaises(ValueError):
+                clean_prefix(invalid)
+
+    def test_base_untouched(self):
+        """
+        The base snapshot is shared rather than copied and never written
+        """
+        snapshot = TEST_CACHE.oui_dict
+        self.overlay.add_record("246D5E", "Renamed")
+        self.assertIs(TEST_CACHE.oui_dict, snapshot)
+        self.assertEqual(
+            TEST_CACHE.get_vendor(TEST_OUI_STRING[OUIType.OUI]),
+            TEST_VENDOR[OUIType.OUI],
+        )
+        self.assertEqual(
+            MacAddress(SITE_MAC, cache=self.overlay).vendor, "Site Switches"
+        )
+
+    @skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized(self):
+        top = OUIOverlay(self.overlay, {"0C0000": "Top Switches"})
+        macs = [
+            SITE_MAC,
+            "0C0000FFFFFF",
+            "020000000001",
+            "246D5E000001",
+            "0C1000000001",
+        ]
+        names = lookup_vendors(
+            np.array([int(i.replace(":", ""), 16) for i in macs], np.uint64), top
+        )
+        self.assertEqual(names.tolist(), [top.get_vendor(i, False) for i in macs])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# MacTools OUI Look-up Server Tests
+
+# Python Modules
+from asyncio import gather, get_running_loop, open_connection, sleep
+from json import loads
+from unittest import IsolatedAsyncioTestCase, main
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_overlay import OUIOverlay
+from mactools.oui_server import OUIClient, OUIServer
+from tests.test_common import (
+    SAMPLE_EUI48,
+    TEST_CACHE,
+    TEST_OUI_DICT,
+    TEST_OUI_STRING,
+    TEST_VENDOR,
+)
+
+MACS = [
+    SAMPLE_EUI48.mac,
+    "0C:00:00:00:00:01",
+    "02-00-00-00-00-01",
+    TEST_OUI_STRING[OUIType.OUI28],
+    "ZZ",
+]
+
+
+class TestOUIServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        TEST_CACHE.swap_oui_dict(TEST_OUI_DICT)
+        self.server = OUIServer(TEST_CACHE, port=0)
+        await self.server.start()
+        self.client = OUIClient(port=self.server.port, pool_size=2)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.close()
+
+    async def test_lookups(self):
+        vendors = await self.client.get_vendors(MACS)
+        self.assertEqual(vendors[0], TEST_VENDOR[OUIType.OUI])
+        self.assertEqual(vendors[3], TEST_VENDOR[OUIType.OUI28])
+        self.assertIsNone(vendors[4])
+        self.assertEqual(
+            vendors[:4], [TEST_CACHE.get_vendor(i, False) for i in MACS[:4]]
+        )
+
+        records = await self.client.get_records(MACS)
+        self.assertEqual(records, TEST_CACHE.get_records(MACS, False))
+        self.assertEqual(await self.client.get_vendors([]), [])
+
+    async def test_pipelined_batches(self):
+        """
+        Concurrent requests share kept-alive connections and are resolved in
+        a few coalesced batches, each answered in order
+        """
+        requests = [[MACS[i % 4]] * (i % 3 + 1) for i in range(100)]
+        results = await gather(*(self.client.get_vendors(i) for i in requests))
+        for request, result in zip(requests, results):
+            self.assertEqual(result, [TEST_CACHE.get_vendor(i, False) for i in request])
+        self.assertLess(self.server.batcher.batches, 10)
+
+        connections = list(self.client._connections)
+        await self.client.get_vendor(MACS[0])
+        await self.client.get_vendor(MACS[0])
+        self.assertEqual(self.client._connections, connections)
+
+    async def test_protocol_errors(self):
+        """
+        A bad request is answered with an error and the connection stays open
+        """
+        reader, writer = await open_connection("127.0.0.1", self.server.port)
+        writer.write(b"X 246D5E\nV 246D5E\n")
+        await writer.drain()
+        self.assertIn("error", loads(await reader.readline()))
+        self.assertEqual(loads(await reader.readline()), [TEST_VENDOR[OUIType.OUI]])
+        writer.close()
+        await writer.wait_closed()
+
+        with self.assertRaises(ValueError):
+            await self.client.get_vendors(["24,6D"])
+
+    async def test_overlay(self):
+        overlay = OUIOverlay(TEST_CACHE, {"0C0000": "Site Switches"})
+        async with (
+            OUIServer(overlay, port=0) as server,
+            OUIClient(port=server.port) as client,
+        ):
+            self.assertEqual(await client.get_vendor(MACS[1]), "Site Switches")
+
+    async def test_cancelled_request(self):
+        """
+        Cancelling a pipelined request leaves the connection usable
+        """
+        connection = await self.client._connection()
+        cancelled = get_running_loop().create_task(
+            connection.request(f"V {MACS[0]}\n".encode())
+        )
+        while not connection.waiting:
+            await sleep(0)
+        cancelled.cancel()
+
+        line = await connection.request(f"V {MACS[3]}\n".encode())
+        self.assertEqual(loads(line), [TEST_VENDOR[OUIType.OUI28]])
+        self.assertFalse(connection.closed)
+        self.assertTrue(cancelled.cancelled())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# MacTools Shared OUI Table Tests
+
+# Python Modules
+from multiprocessing import get_context
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_shared import (
+    SharedOUIRegistry,
+    SharedOUITier,
+    attach_oui_cache,
+    pack_oui_dict,
+)
+from tests.test_common import TEST_CACHE, TEST_OUI_DICT, TEST_OUI_STRING, TEST_VENDOR
+
+
+def init_worker(name: str) -> None:
+    """
+    Pool initializer, importing this module first keeps `TEST_CACHE` from
+    replacing the attached registry when the first task is unpickled
+    """
+    attach_oui_cache(name)
+
+
+def lookup_in_worker(oui: str) -> str | None:
+    """
+    Pool task resolving against whichever cache the initializer attached
+    """
+    from mactools.oui_cache.oui_core import get_oui_cache
+
+    cache = get_oui_cache()
+    if not isinstance(cache.oui_dict[OUIType.OUI], SharedOUITier):
+        return None
+    return cache.get_vendor(oui)
+
+
+class TestSharedOUI(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.registry = SharedOUIRegistry.create(TEST_OUI_DICT)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.registry.unlink()
+
+    def test_round_trip(self):
+        """
+        Every record packed is returned unchanged by the shared tiers
+        """
+        for oui_type, tier in TEST_OUI_DICT.items():
+            shared_tier = self.registry.tiers[oui_type]
+            self.assertEqual(len(shared_tier), len(tier))
+            self.assertEqual(list(shared_tier), list(tier))
+            for oui, record in tier.items():
+                self.assertIn(oui, shared_tier)
+                self.assertEqual(shared_tier[oui], record)
+
+    def test_missing_keys(self):
+        shared_tier = self.registry.tiers[OUIType.OUI]
+        for missing in ["000000", "FFFFFF", "ZZZZZZ", "246D5E00"]:
+            self.assertIsNone(shared_tier.get(missing))
+            with self.assertRaises(KeyError):
+                shared_tier[missing]
+
+    def test_invalid_key_length(self):
+        with self.assertRaises(ValueError):
+            pack_oui_dict({OUIType.OUI: {"1234567": {"vendor": "", "address": ""}}})
+
+    def test_cache_over_shared_tiers(self):
+        """
+        The cache resolves through shared tiers without copying them
+        """
+        original = TEST_CACHE.oui_dict
+        try:
+            TEST_CACHE.swap_oui_dict(self.registry.tiers)
+            self.assertIs(
+                TEST_CACHE.oui_dict[OUIType.OUI], self.registry.tiers[OUIType.OUI]
+            )
+            for oui_type, oui in TEST_OUI_STRING.items():
+                self.assertEqual(TEST_CACHE.get_vendor(oui), TEST_VENDOR[oui_type])
+        finally:
+            TEST_CACHE.swap_oui_dict(original)
+
+    def test_mapped_file(self):
+        with TemporaryDirectory() as temp_dir:
+            file_path = path.join(temp_dir, "oui.bin")
+            SharedOUIRegistry.write_file(TEST_OUI_DICT, file_path)
+            registry = SharedOUIRegistry.open_file(file_path)
+            oui = TEST_OUI_STRING[OUIType.OUI28]
+            self.assertEqual(
+                registry.tiers[OUIType.OUI28][oui]["vendor"], TEST_VENDOR[OUIType.OUI28]
+            )
+            self.assertEqual(registry.size, len(pack_oui_dict(TEST_OUI_DICT)))
+
+    def test_worker_pool_attach(self):
+        """
+        Spawned workers attach to the parent's block instead of rebuilding
+        """
+        ouis = list(TEST_OUI_STRING.values())
+        with get_context("spawn").Pool(
+            2, initializer=init_worker, initargs=(self.registry.name,)
+        ) as pool:
+            vendors = pool.map(lookup_in_worker, ouis)
+        self.assertEqual(vendors, [TEST_VENDOR[i] for i in TEST_OUI_STRING])
+
+
+if __name__ == "__main__":
+    main()
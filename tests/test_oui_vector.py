@@ -0,0 +1,95 @@
+# MacTools Vectorized OUI Look-up Tests
+
+# Python Modules
+from importlib.util import find_spec
+from random import Random
+from unittest import TestCase, main, skipUnless
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_common import fixed_ouis, specific_macs
+from tests.test_common import TEST_CACHE, TEST_OUI_DICT, TEST_OUI_STRING, TEST_VENDOR
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from mactools.oui_cache.oui_vector import (
+        OUIVectorTable,
+        get_vector_table,
+        lookup_vendor_ids,
+        lookup_vendors,
+    )
+
+
+def prefixed_mac(oui: str, suffix: int = 0xABC) -> int:
+    """
+    Returns an integer MAC under a registry prefix of any length
+    """
+    return int(oui, 16) << (48 - len(oui) * 4) | suffix
+
+
+@skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestOUIVector(TestCase):
+    def setUp(self) -> None:
+        TEST_CACHE.swap_oui_dict(TEST_OUI_DICT)
+
+    def test_tiers(self):
+        macs = [prefixed_mac(TEST_OUI_STRING[i]) for i in OUIType]
+        names = lookup_vendors(np.array(macs, np.uint64), TEST_CACHE)
+        self.assertEqual(names.tolist(), [TEST_VENDOR[i] for i in OUIType])
+
+        ids, vendors = lookup_vendor_ids(np.array(macs + [0x0C0000000001]), TEST_CACHE)
+        self.assertEqual(vendors[ids[0]], TEST_VENDOR[OUIType.OUI36])
+        self.assertEqual(ids[-1], 0)
+        self.assertEqual(vendors[0], "Unregistered")
+
+    def test_matches_get_record(self):
+        """
+        Every rule agrees with the scalar look-up, including ranges matched
+        away from the start of the address and EUI-64 input
+        """
+        rng = Random(0)
+        macs = [rng.getrandbits(48) for _ in range(500)]
+        macs += [int(i, 16) for i in specific_macs]
+        macs += [int(i, 16) << 24 | 0x123456 for i in fixed_ouis]
+        macs += [0x333300000001, 0x00005E000101, 0xAB00000C07AC, 0x123333AB0000]
+        macs += [prefixed_mac(TEST_OUI_STRING[i]) for i in OUIType]
+        names = lookup_vendors(np.array(macs, np.uint64), TEST_CACHE)
+        for mac, name in zip(macs, names):
+            self.assertEqual(
+                name, TEST_CACHE.get_record(f"{mac:012X}", False)["vendor"]
+            )
+
+        macs = [rng.getrandbits(64) for _ in range(200)]
+        macs.append(prefixed_mac(TEST_OUI_STRING[OUIType.OUI28]) << 16)
+        names = lookup_vendors(np.array(macs, np.uint64), TEST_CACHE, 64)
+        self.assertEqual(names[-1], TEST_VENDOR[OUIType.OUI28])
+        for mac, name in zip(macs, names):
+            self.assertEqual(
+                name, TEST_CACHE.get_record(f"{mac:016X}", False)["vendor"]
+            )
+
+    def test_snapshot_rebuild(self):
+        """
+        The table is built once per snapshot and follows swaps
+        """
+        table = get_vector_table(TEST_CACHE)
+        self.assertIsInstance(table, OUIVectorTable)
+        self.assertIs(get_vector_table(TEST_CACHE), table)
+
+        TEST_CACHE.add_record(
+            OUIType.OUI, "0C0000", {"vendor": "Added", "oui": "0C0000", "address": ""}
+        )
+        self.addCleanup(TEST_CACHE.swap_oui_dict, TEST_OUI_DICT)
+        self.assertIsNot(get_vector_table(TEST_CACHE), table)
+        names = lookup_vendors(np.array([0x0C0000000001], np.uint64), TEST_CACHE)
+        self.assertEqual(names[0], "Added")
+
+    def test_empty(self):
+        self.assertEqual(len(lookup_vendors(np.array([], np.uint64), TEST_CACHE)), 0)
+
+
+if __name__ == "__main__":
+    main()
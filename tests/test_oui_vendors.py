@@ -0,0 +1,149 @@
+# MacTools Vendor ID Tests
+
+# Python Modules
+from importlib.util import find_spec
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main, skipUnless
+
+# Local Modules
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.oui_cache.oui_common import process_ieee_csv
+from mactools.oui_cache.oui_shared import SharedOUIRegistry
+from mactools.oui_cache.oui_vendors import (
+    load_vendor_aliases,
+    normalize_aliases,
+    record_vendor_id,
+    vendor_id,
+    vendor_key,
+    vendor_names,
+)
+from tests.test_common import TEST_CACHE, TEST_OUI_DICT, TEST_OUI_STRING, TEST_VENDOR
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from mactools.oui_cache.oui_vector import lookup_stable_vendor_ids
+
+REGISTRY_ROWS = [
+    ("000001", "Cisco Systems, Inc"),
+    ("000002", "CISCO SYSTEMS INC."),
+    ("000003", "Cisco"),
+    ("000004", "Huawei Technologies Co.,Ltd"),
+]
+
+
+def write_registry(directory: str) -> str:
+    """
+    Writes a small MA-L CSV with several spellings of the same vendor
+    """
+    file_path = path.join(directory, "oui.csv")
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write("Registry,Assignment,Organization Name,Address\n")
+        file.writelines(
+            f'MA-L,{oui},"{vendor}",Street\n' for oui, vendor in REGISTRY_ROWS
+        )
+    return file_path
+
+
+class TestVendorIDs(TestCase):
+    def setUp(self) -> None:
+        TEST_CACHE.swap_oui_dict(TEST_OUI_DICT)
+        self.addCleanup(TEST_CACHE.set_vendor_aliases, {})
+
+    def test_vendor_key(self):
+        self.assertEqual(vendor_key("Cisco Systems, Inc"), "cisco systems")
+        self.assertEqual(vendor_key("CISCO SYSTEMS INC."), "cisco systems")
+        self.assertEqual(
+            vendor_key("Huawei Technologies Co.,Ltd"), "huawei technologies"
+        )
+        self.assertEqual(vendor_key("Inc."), "inc")
+
+        self.assertEqual(vendor_id("Cisco Systems, Inc"), vendor_id("cisco systems"))
+        self.assertNotEqual(vendor_id("Cisco Systems"), vendor_id("Cisco"))
+        self.assertTrue(0 <= vendor_id("Cisco") < 1 << 63)
+
+    def test_aliases(self):
+        """
+        IDs are derived from the records' vendors, with the cache's aliases
+        merging other spellings
+        """
+        with TemporaryDirectory() as temp_dir:
+            oui_dict = process_ieee_csv(write_registry(temp_dir))
+            tier = oui_dict[OUIType.OUI]
+            self.assertEqual(set(tier["000001"]), {"vendor", "oui", "address"})
+            ids = [record_vendor_id(tier[oui]) for oui, _ in REGISTRY_ROWS]
+            self.assertEqual(ids[0], ids[1])
+            self.assertNotEqual(ids[0], ids[2])
+
+            aliases_path = path.join(temp_dir, "aliases.csv")
+            with open(aliases_path, "w", encoding="utf-8") as file:
+                file.write("Cisco,Cisco Systems Inc\n")
+            aliases = load_vendor_aliases(aliases_path)
+            self.assertEqual(normalize_aliases(aliases), {"cisco": "cisco systems"})
+
+            self.addCleanup(TEST_CACHE.swap_oui_dict, TEST_OUI_DICT)
+            TEST_CACHE.swap_oui_dict(oui_dict)
+            TEST_CACHE.set_vendor_aliases(aliases)
+            ouis = [oui for oui, _ in REGISTRY_ROWS]
+            ids = TEST_CACHE.get_vendor_ids(ouis, False)
+            self.assertEqual(len(set(ids)), 2)
+            self.assertEqual(ids[2], ids[0])
+            self.assertEqual(
+                vendor_names(oui_dict, TEST_CACHE.vendor_aliases)[ids[2]],
+                "Cisco Systems, Inc",
+            )
+
+            if HAS_NUMPY:
+                macs = np.array([int(i, 16) << 24 for i in ouis], np.uint64)
+                self.assertEqual(
+                    lookup_stable_vendor_ids(macs, TEST_CACHE).tolist(), ids
+                )
+
+    def test_cache_lookups(self):
+        oui = TEST_OUI_STRING[OUIType.OUI]
+        self.assertEqual(
+            TEST_CACHE.get_vendor_id(oui), vendor_id(TEST_VENDOR[OUIType.OUI])
+        )
+        self.assertEqual(
+            TEST_CACHE.get_vendor_id("01:80:C2:00:00:0E"),
+            vendor_id("Link Layer Discovery Protocol (LLDP)"),
+        )
+        self.assertEqual(
+            TEST_CACHE.get_vendor_ids([oui, "ZZ", oui], False),
+            [
+                vendor_id(TEST_VENDOR[OUIType.OUI]),
+                None,
+                vendor_id(TEST_VENDOR[OUIType.OUI]),
+            ],
+        )
+
+    def test_shared_round_trip(self):
+        with TemporaryDirectory() as temp_dir:
+            oui_dict = process_ieee_csv(write_registry(temp_dir))
+            file_path = path.join(temp_dir, "oui.bin")
+            SharedOUIRegistry.write_file(oui_dict, file_path)
+            registry = SharedOUIRegistry.open_file(file_path)
+            self.assertEqual(
+                registry.tiers[OUIType.OUI]["000004"], oui_dict[OUIType.OUI]["000004"]
+            )
+
+    @skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_vectorized(self):
+        macs = [
+            int(TEST_OUI_STRING[i], 16) << (48 - len(TEST_OUI_STRING[i]) * 4)
+            for i in OUIType
+        ]
+        macs += [0x0180C200000E, 0x020000000001, 0x0C0000000001]
+        ids = lookup_stable_vendor_ids(np.array(macs, np.uint64), TEST_CACHE)
+        self.assertEqual(ids.dtype, np.int64)
+        self.assertEqual(
+            ids.tolist(),
+            TEST_CACHE.get_vendor_ids([f"{i:012X}" for i in macs], False),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# MacTools Pandas and Arrow Integration Tests
+
+# Python Modules
+from importlib.util import find_spec
+from unittest import TestCase, main, skipUnless
+from unittest.mock import Mock
+
+# Local Modules
+from mactools.basemac import BaseMac, MacNotation
+from tests.test_common import (
+    SAMPLE_EUI48,
+    SAMPLE_EUI64,
+    TEST_CACHE,
+    TEST_OUI_STRING,
+    TEST_VENDOR,
+)
+
+HAS_PANDAS = find_spec("pandas") is not None
+HAS_ARROW = HAS_PANDAS and find_spec("pyarrow") is not None
+
+if HAS_PANDAS:
+    import pandas as pd
+
+    from mactools.oui_cache.oui_classes import OUIType
+    from mactools.pandas_ext import MacArray, MacDtype, parse_macs
+
+if HAS_ARROW:
+    import pyarrow as pa
+
+# Three rows under the test OUI, a missing value and a locally administered MAC
+SAMPLE_COLUMN = [
+    SAMPLE_EUI48.mac,
+    "246d.5ebb.99cd",
+    None,
+    "02-00-00-00-00-01",
+    "24 6D 5E BB 99 CC",
+]
+
+
+@skipUnless(HAS_PANDAS, "pandas is not installed")
+class TestPandasExtension(TestCase):
+    def setUp(self) -> None:
+        self.series = pd.Series(SAMPLE_COLUMN, dtype="mac")
+
+    def test_parse(self):
+        data, mask = parse_macs(
+            [SAMPLE_EUI48.mac, SAMPLE_EUI48.decimal, BaseMac(SAMPLE_EUI48.mac), None]
+        )
+        self.assertEqual(data[:3].tolist(), [SAMPLE_EUI48.decimal] * 3)
+        self.assertEqual(mask.tolist(), [False, False, False, True])
+
+        data, _ = parse_macs([SAMPLE_EUI64.mac], 64)
+        self.assertEqual(data[0], BaseMac(SAMPLE_EUI64.mac).decimal)
+
+        for invalid in ["24:6D:5E:BB:99", "24:6D:5E:BB:99:CG", SAMPLE_EUI64.mac, 1.5]:
+            with self.assertRaises(ValueError):
+                parse_macs([SAMPLE_EUI48.mac, invalid])
+
+    def test_dtype(self):
+        self.assertIsInstance(self.series.array, MacArray)
+        self.assertEqual(self.series.dtype, MacDtype(48))
+        self.assertEqual(pd.api.types.pandas_dtype("mac64"), MacDtype(64))
+        self.assertEqual(self.series[0], SAMPLE_EUI48.decimal)
+        self.assertIs(self.series[2], pd.NA)
+        self.assertEqual(
+            self.series.isna().tolist(), [False] * 2 + [True] + [False] * 2
+        )
+        self.assertEqual(str(self.series.astype("string")[0]), SAMPLE_EUI48.mac)
+
+    def test_operations(self):
+        equal = self.series == SAMPLE_EUI48.mac.lower()
+        self.assertEqual(equal.tolist(), [True, False, pd.NA, False, True])
+        self.assertEqual(self.series.value_counts()[SAMPLE_EUI48.decimal], 2)
+        self.assertEqual(len(self.series.unique()), 4)
+        self.assertEqual(self.series.sort_values().iloc[0], 0x020000000001)
+        self.assertEqual(len(pd.concat([self.series, self.series])), 10)
+        self.assertEqual(self.series.fillna(SAMPLE_EUI48.mac)[2], SAMPLE_EUI48.decimal)
+
+        frame = pd.DataFrame({"mac": self.series, "count": 1})
+        self.assertEqual(frame.groupby("mac")["count"].sum().max(), 2)
+
+    def test_accessor(self):
+        self.assertEqual(
+            self.series.mac.format(MacNotation.PERIOD, lower=True)[1], "246d.5ebb.99cd"
+        )
+        self.assertEqual(self.series.mac.oui[0], TEST_OUI_STRING[OUIType.OUI])
+        self.assertEqual(
+            self.series.mac.is_local.tolist(), [False, False, pd.NA, True, False]
+        )
+
+        # Plain string columns are parsed on access
+        self.assertEqual(
+            pd.Series(SAMPLE_COLUMN).mac.format(MacNotation.CLEAN)[4], "246D5EBB99CC"
+        )
+
+    def test_vendor(self):
+        vendors = self.series.mac.vendor(cache=TEST_CACHE)
+        self.assertEqual(vendors[0], TEST_VENDOR[OUIType.OUI])
+        self.assertEqual(vendors[3], "Locally administered")
+        self.assertIs(vendors[2], pd.NA)
+
+        ids = self.series.mac.vendor_id(cache=TEST_CACHE)
+        self.assertEqual(str(ids.dtype), "Int64")
+        self.assertEqual(ids[0], TEST_CACHE.get_vendor_id(SAMPLE_EUI48.mac))
+        self.assertIs(ids[2], pd.NA)
+
+    def test_remote_vendor(self):
+        """
+        Remote look-ups go through the cache once per distinct block
+        """
+        cache = Mock(wraps=TEST_CACHE)
+        vendors = self.series.mac.vendor(cache=cache, remote=True)
+        self.assertEqual(vendors[4], TEST_VENDOR[OUIType.OUI])
+        requested, remote = cache.get_records.call_args.args
+        self.assertEqual(len(list(requested)), 2)
+        self.assertTrue(remote)
+
+
+@skipUnless(HAS_ARROW, "pyarrow is not installed")
+class TestArrowExtension(TestCase):
+    def test_round_trip(self):
+        series = pd.Series(SAMPLE_COLUMN, dtype="mac")
+        table = pa.table({"mac": series})
+        self.assertEqual(table.schema.field("mac").type.extension_name, "mactools.mac")
+        self.assertEqual(table.column("mac").null_count, 1)
+        self.assertTrue(table.to_pandas()["mac"].equals(series))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# MacTools Packet Capture Reader Tests
+
+# Python Modules
+from os import path
+from struct import pack
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.mac_pipeline import UNKNOWN_VENDOR
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.pcap import (
+    NO_VLAN,
+    count_traffic,
+    read_frames,
+    summarize_capture,
+)
+from tests.test_common import SAMPLE_EUI48, TEST_CACHE, TEST_VENDOR
+
+BROADCAST = 0xFFFFFFFFFFFF
+HOST_A = SAMPLE_EUI48.decimal
+HOST_B = 0x79B74DA00002
+
+
+def create_frame(
+    destination: int,
+    source: int,
+    ethertype: int,
+    vlans: tuple[int, ...] = (),
+    pad: int = 46,
+) -> bytes:
+    tags = b"".join(pack(">HH", 0x8100, vlan) for vlan in vlans)
+    return (
+        destination.to_bytes(6, "big")
+        + source.to_bytes(6, "big")
+        + tags
+        + pack(">H", ethertype)
+        + bytes(pad)
+    )
+
+
+FRAMES = [
+    create_frame(BROADCAST, HOST_A, 0x0806),
+    create_frame(HOST_A, HOST_B, 0x0800, (10,)),
+    create_frame(HOST_B, HOST_A, 0x86DD, (20, 30), pad=100),
+    create_frame(HOST_A, HOST_A, 0x0800),
+]
+
+
+def create_pcap(frames: list[bytes], endian: str = "<", nano: bool = False) -> bytes:
+    magic = 0xA1B23C4D if nano else 0xA1B2C3D4
+    output = [pack(f"{endian}IHHiIII", magic, 2, 4, 0, 0, 65535, 1)]
+    for i, frame in enumerate(frames):
+        output.append(pack(f"{endian}IIII", i, 0, len(frame), len(frame)))
+        output.append(frame)
+    return b"".join(output)
+
+
+def create_block(endian: str, block_type: int, body: bytes) -> bytes:
+    body += bytes(-len(body) % 4)
+    length = len(body) + 12
+    return pack(f"{endian}II", block_type, length) + body + pack(f"{endian}I", length)
+
+
+def create_pcapng(frames: list[bytes], endian: str = "<") -> bytes:
+    output = [
+        create_block(endian, 0x0A0D0D0A, pack(f"{endian}IHHq", 0x1A2B3C4D, 1, 0, -1)),
+        create_block(endian, 1, pack(f"{endian}HHI", 1, 0, 65535)),
+        # A second, non-Ethernet (raw IP) interface whose packets are skipped
+        create_block(endian, 1, pack(f"{endian}HHI", 101, 0, 65535)),
+    ]
+    for i, frame in enumerate(frames):
+        header = pack(f"{endian}IIIII", 0, 0, i, len(frame), len(frame))
+        output.append(create_block(endian, 6, header + frame))
+        output.append(
+            create_block(
+                endian, 6, pack(f"{endian}IIIII", 1, 0, i, 4, 4) + b"\x45\x00\x00\x04"
+            )
+        )
+    output.append(
+        create_block(endian, 3, pack(f"{endian}I", len(FRAMES[0])) + FRAMES[0])
+    )
+    return b"".join(output)
+
+
+class TestPcap(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+
+    def write_capture(self, name: str, data: bytes) -> str:
+        file_path = path.join(self.temp_dir.name, name)
+        with open(file_path, "wb") as file:
+            file.write(data)
+        return file_path
+
+    def check_frames(self, frames, count: int = 4):
+        self.assertEqual(len(frames), count)
+        self.assertEqual(
+            frames.destinations.tolist()[:4], [BROADCAST, HOST_A, HOST_B, HOST_A]
+        )
+        self.assertEqual(frames.sources.tolist()[:4], [HOST_A, HOST_B, HOST_A, HOST_A])
+        self.assertEqual(
+            frames.ethertypes.tolist()[:4], [0x0806, 0x0800, 0x86DD, 0x0800]
+        )
+        self.assertEqual(frames.vlans.tolist()[:4], [NO_VLAN, 10, 20, NO_VLAN])
+        self.assertEqual(frames.lengths.tolist()[:4], [60, 64, 122, 60])
+
+    def test_pcap(self):
+        """
+        Classic pcap in either byte order and timestamp resolution
+        """
+        for endian in "<>":
+            for nano in [False, True]:
+                with self.subTest(endian=endian, nano=nano):
+                    file_path = self.write_capture(
+                        "test.pcap", create_pcap(FRAMES, endian, nano)
+                    )
+                    self.check_frames(read_frames(file_path))
+
+    def test_pcapng(self):
+        """
+        Enhanced and simple packet blocks of Ethernet interfaces are read
+        """
+        for endian in "<>":
+            with self.subTest(endian=endian):
+                file_path = self.write_capture(
+                    "test.pcapng", create_pcapng(FRAMES, endian)
+                )
+                frames = read_frames(file_path)
+                self.check_frames(frames, 5)
+                self.assertEqual(frames.sources[4], HOST_A)
+
+    def test_truncated(self):
+        data = create_pcap(FRAMES)
+        file_path = self.write_capture("cut.pcap", data[:-10])
+        self.assertEqual(len(read_frames(file_path)), 3)
+
+        # Frames captured shorter than an Ethernet header are skipped
+        file_path = self.write_capture(
+            "short.pcap", create_pcap([b"\x00" * 10, FRAMES[0]])
+        )
+        self.assertEqual(read_frames(file_path).sources.tolist(), [HOST_A])
+
+        bad_pcapng = b"\x0a\x0d\x0d\x0a" + b"\x1c\x00\x00\x00" + b"\x00" * 20
+        for data in [b"", b"not a capture file", bad_pcapng]:
+            file_path = self.write_capture("bad.pcap", data)
+            with self.assertRaises(ValueError):
+                read_frames(file_path)
+
+    def test_count_traffic(self):
+        """
+        Frames and bytes per address and vendor for each address field
+        """
+        file_path = self.write_capture("test.pcap", create_pcap(FRAMES))
+        report = summarize_capture(file_path, TEST_CACHE)
+        self.assertEqual(report.frame_counts, {HOST_A: 4, HOST_B: 2, BROADCAST: 1})
+        self.assertEqual(report.byte_counts, {HOST_A: 306, HOST_B: 186, BROADCAST: 60})
+        self.assertEqual(report.vendors[HOST_A], TEST_VENDOR[OUIType.OUI])
+        self.assertEqual(report.vendor_frames[TEST_VENDOR[OUIType.OUI28]], 2)
+        self.assertEqual(report.vendor_bytes[TEST_VENDOR[OUIType.OUI]], 306)
+        self.assertNotIn(UNKNOWN_VENDOR, report.vendor_frames)
+
+        frames = read_frames(file_path)
+        sources = count_traffic(frames, TEST_CACHE, "source")
+        self.assertEqual(sources.frame_counts, {HOST_A: 3, HOST_B: 1})
+        destinations = count_traffic(frames, TEST_CACHE, "destination")
+        self.assertEqual(
+            destinations.frame_counts, {HOST_A: 2, HOST_B: 1, BROADCAST: 1}
+        )
+        self.assertEqual(
+            sources.merge(destinations).frame_counts,
+            {HOST_A: 5, HOST_B: 2, BROADCAST: 1},
+        )
+        with self.assertRaises(ValueError):
+            count_traffic(frames, TEST_CACHE, "vlan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# MacTools IPv6 SLAAC Addressing Tests
+
+# Python Modules
+from ipaddress import IPv6Address, IPv6Network
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.basemac import BaseMac
+from mactools.mac_common import create_random_macs
+from mactools.oui_cache.oui_classes import OUIType
+from mactools.slaac import (
+    address_records,
+    global_addresses,
+    interface_id,
+    interface_ids,
+    link_local_addresses,
+    mac_from_address,
+    mac_from_interface_id,
+    macs_from_addresses,
+)
+from tests.test_common import SAMPLE_EUI48, SAMPLE_EUI64, TEST_CACHE, TEST_VENDOR
+
+
+class TestSlaac(TestCase):
+    def test_interface_id(self):
+        self.assertEqual(interface_id(SAMPLE_EUI48.decimal), 0x266D5EFFFEBB99CC)
+        self.assertEqual(interface_id(0x020000000001), 0x000000FFFE000001)
+        self.assertEqual(interface_id(SAMPLE_EUI64.decimal, 64), SAMPLE_EUI64.decimal)
+
+    def test_bulk(self):
+        """
+        Bulk results match the per-MAC properties
+        """
+        macs = create_random_macs(1000, prefix="24:6D:5E", seed=0)
+        self.assertEqual(interface_ids(macs).tolist(), list(map(interface_id, macs)))
+
+        prefix = IPv6Network("2001:db8:0:1::/64")
+        addresses = global_addresses(macs, prefix)
+        for mac, local, address in zip(
+            macs[:50], link_local_addresses(macs[:50]), addresses
+        ):
+            mac_address = BaseMac(mac)
+            self.assertEqual(local, IPv6Address(mac_address.link_local_address))
+            self.assertEqual(address, mac_address.get_global_address(prefix))
+        self.assertEqual(
+            global_addresses([SAMPLE_EUI64.decimal], "2001:db8::", 64),
+            [IPv6Address("2001:db8::246d:5e00:bb:99dd")],
+        )
+        self.assertEqual(global_addresses(macs[:1], "2001:db8:0:1"), addresses[:1])
+        for prefix in ["2001:db8:1:2:3", "2001:db8::/80", "not a prefix"]:
+            with self.assertRaises(ValueError):
+                global_addresses(macs[:1], prefix)
+
+    def test_reverse(self):
+        """
+        MACs are recovered from EUI-64 based addresses only
+        """
+        for mac in [SAMPLE_EUI48.decimal, 0x020000000001, 0xFFFFFFFFFFFF]:
+            self.assertEqual(mac_from_interface_id(interface_id(mac)), mac)
+        self.assertEqual(
+            mac_from_address("fe80::266d:5eff:febb:99cc%eth0"), SAMPLE_EUI48.decimal
+        )
+        self.assertIsNone(mac_from_address("2001:db8::1"))
+        self.assertEqual(
+            BaseMac.from_ipv6_address(IPv6Address("2001:db8::266d:5eff:febb:99cc")),
+            BaseMac(SAMPLE_EUI48.mac),
+        )
+        self.assertEqual(
+            BaseMac.from_ipv6_address("fe80::211:22ff:feaa:bbcc"),
+            BaseMac("00:11:22:AA:BB:CC"),
+        )
+        with self.assertRaises(ValueError):
+            BaseMac.from_ipv6_address("2001:db8::1")
+
+        macs = create_random_macs(1000, prefix="24:6D:5E", seed=1)
+        addresses = global_addresses(macs, "2001:db8::/64") + ["2001:db8::abcd"]
+        self.assertEqual(macs_from_addresses(addresses), macs.tolist() + [None])
+        self.assertEqual(
+            macs_from_addresses(map(str, addresses[:3])), macs[:3].tolist()
+        )
+
+    def test_address_records(self):
+        records = address_records(
+            [
+                "fe80::266d:5eff:febb:99cc",
+                "2001:db8::1",
+                "fe80::7bb7:4dff:fea0:2",
+            ],
+            TEST_CACHE,
+        )
+        self.assertEqual(records[0]["vendor"], TEST_VENDOR[OUIType.OUI])
+        self.assertEqual(records[1], {})
+        self.assertEqual(records[2]["vendor"], TEST_VENDOR[OUIType.OUI28])
+
+
+if __name__ == "__main__":
+    main()
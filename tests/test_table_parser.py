@@ -0,0 +1,140 @@
+# MacTools Table Parser Tests
+
+# Python Modules
+from unittest import TestCase, main
+
+# Local Modules
+from mactools.table_parser import detect_layout, parse_table
+
+MAC_A = 0x001122334455
+MAC_B = 0x001C73000001
+
+SAMPLES = {
+    "mac_table": (
+        (
+            "          Mac Address Table\n"
+            "-------------------------------------------\n"
+            "Vlan    Mac Address       Type        Ports\n"
+            "----    -----------       --------    -----\n"
+            "  10    0011.2233.4455    DYNAMIC     Gi1/0/1\n"
+            " All    001c.7300.0001    STATIC      CPU\n"
+            "Total Mac Addresses for this criterion: 2\n"
+        ),
+        [(MAC_A, "10", "Gi1/0/1", None), (MAC_B, "All", "CPU", None)],
+    ),
+    "nxos_mac_table": (
+        (
+            "   VLAN     MAC Address      Type      age     Secure NTFY Ports\n"
+            "---------+-----------------+--------+---------+------+----+------------\n"
+            "*   10     0011.2233.4455   dynamic  0         F      F    Eth1/1\n"
+            "G    -     001c.7300.0001   static   -         F      F    sup-eth1(R)\n"
+        ),
+        [(MAC_A, "10", "Eth1/1", None), (MAC_B, "-", "sup-eth1(R)", None)],
+    ),
+    "junos_mac_table": (
+        (
+            "Ethernet switching table : 2 entries, 2 learned\n"
+            "   Vlan                MAC                 MAC         Age    Logical\n"
+            "   name                address             flags              interface\n"
+            "   vlan-10             00:11:22:33:44:55   D             -   ge-0/0/1.0\n"
+            "   default             00:1c:73:00:00:01   D,SE          -   ae0.0\n"
+        ),
+        [(MAC_A, "vlan-10", "ge-0/0/1.0", None), (MAC_B, "default", "ae0.0", None)],
+    ),
+    "ios_arp": (
+        (
+            "Protocol  Address          Age (min)  Hardware Addr   Type   Interface\n"
+            "Internet  10.0.0.1                -   0011.2233.4455  ARPA   Vlan10\n"
+            "Internet  10.0.0.2               12   001c.7300.0001  ARPA   Vlan10\n"
+            "Internet  10.0.0.3                0   Incomplete      ARPA\n"
+        ),
+        [(MAC_A, None, "Vlan10", "10.0.0.1"), (MAC_B, None, "Vlan10", "10.0.0.2")],
+    ),
+    "arp": (
+        (
+            "Address         Age (sec)  Hardware Addr   Interface\n"
+            "10.0.0.1          0:00:10  0011.2233.4455  Vlan10, Ethernet1\n"
+            "10.0.0.2          0:01:10  001c.7300.0001  Vlan20, not learned\n"
+        ),
+        [
+            (MAC_A, None, "Vlan10", "10.0.0.1"),
+            (MAC_B, None, "Vlan20", "10.0.0.2"),
+        ],
+    ),
+    "junos_arp": (
+        (
+            "MAC Address       Address         Name                      Interface     Flags\n"
+            "00:11:22:33:44:55 10.0.0.1        host-a.example.com        irb.10        none\n"
+            "00:1c:73:00:00:01 10.0.0.2        ge-0/0/2.0                none\n"
+        ),
+        [(MAC_A, None, "irb.10", "10.0.0.1"), (MAC_B, None, "ge-0/0/2.0", "10.0.0.2")],
+    ),
+    "ip_neigh": (
+        (
+            "10.0.0.1 dev eth0 lladdr 00:11:22:33:44:55 REACHABLE\n"
+            "10.0.0.9 dev eth0  FAILED\n"
+            "fe80::21c:73ff:fe00:1 dev eth1 lladdr 00:1c:73:00:00:01 router STALE\n"
+        ),
+        [
+            (MAC_A, None, "eth0", "10.0.0.1"),
+            (MAC_B, None, "eth1", "fe80::21c:73ff:fe00:1"),
+        ],
+    ),
+    "linux_arp": (
+        (
+            "? (10.0.0.1) at 00:11:22:33:44:55 [ether] on eth0\n"
+            "? (10.0.0.9) at <incomplete> on eth0\n"
+            "gw (10.0.0.2) at 00:1c:73:00:00:01 [ether] on eth1\n"
+        ),
+        [(MAC_A, None, "eth0", "10.0.0.1"), (MAC_B, None, "eth1", "10.0.0.2")],
+    ),
+    "linux_arp_table": (
+        (
+            "Address                  HWtype  HWaddress           Flags Mask            Iface\n"
+            "10.0.0.1                 ether   00:11:22:33:44:55   C                     eth0\n"
+            "10.0.0.2                 ether   00:1c:73:00:00:01   C                     eth1\n"
+        ),
+        [(MAC_A, None, "eth0", "10.0.0.1"), (MAC_B, None, "eth1", "10.0.0.2")],
+    ),
+}
+
+
+class TestTableParser(TestCase):
+    def test_layouts(self):
+        """
+        Each sample is detected as its own layout and parsed into columns
+        """
+        for layout, (text, expected) in SAMPLES.items():
+            with self.subTest(layout=layout):
+                self.assertEqual(detect_layout(text), layout)
+                table = parse_table(text)
+                self.assertEqual(table.layout, layout)
+                self.assertEqual(list(table.rows()), expected)
+
+    def test_bytes_and_explicit_layout(self):
+        text, expected = SAMPLES["ip_neigh"]
+        table = parse_table(text.encode(), layout="ip_neigh")
+        self.assertEqual(list(table.macs), [i[0] for i in expected])
+
+    def test_unknown(self):
+        self.assertEqual(len(parse_table("nothing to see here\n")), 0)
+        with self.assertRaises(ValueError):
+            parse_table(SAMPLES["arp"][0], layout="not_a_layout")
+
+    def test_large_table(self):
+        """
+        A 100k line table keeps every row, see `benchmarks.table_parser` for its
+        throughput
+        """
+        lines = [
+            f"  {i % 4094 + 1:<6}{(i * 7919).to_bytes(6, 'big').hex('.', 2)}    DYNAMIC     Gi1/0/{i % 48 + 1}\n"
+            for i in range(100000)
+        ]
+        text = "".join(lines)
+        table = parse_table(text)
+        self.assertEqual(len(table), 100000)
+        self.assertEqual(table.macs[1], 7919)
+
+
+if __name__ == "__main__":
+    main()
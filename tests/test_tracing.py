@@ -0,0 +1,106 @@
+# MacTools Slow-Path Tracing Tests
+
+# Python Modules
+from asyncio import run
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from unittest.mock import MagicMock, patch
+
+# Local Modules
+from mactools.oui_cache.oui_common import process_ieee_csv
+from mactools.tracing import TraceEvent, add_trace_hook, remove_trace_hook, trace
+from mactools.update_ieee import get_csv_file
+from tests.test_common import OUI_CLASSES_PATH, TEST_CACHE, TEST_OUI_DICT
+
+
+class TestTracing(TestCase):
+    def setUp(self) -> None:
+        self.events: list[TraceEvent] = []
+        add_trace_hook(self.events.append)
+        self.addCleanup(remove_trace_hook, self.events.append)
+
+    def ended(self, name: str) -> TraceEvent:
+        phases = [i.phase for i in self.events if i.name == name]
+        self.assertEqual(phases, ["start", "end"])
+        return self.events[-1]
+
+    def test_trace(self):
+        """
+        Start and end events, with the error of a failed block
+        """
+        with trace("custom", key="value") as span:
+            span.bytes = 10
+        end = self.ended("custom")
+        self.assertEqual(
+            (end.bytes, end.attributes, end.error), (10, {"key": "value"}, None)
+        )
+        self.assertGreaterEqual(end.duration, 0)
+
+        self.events.clear()
+        with self.assertRaises(KeyError), trace("failing"):
+            raise KeyError("missing")
+        self.assertIn("KeyError", self.ended("failing").error)
+
+        remove_trace_hook(self.events.append)
+        self.events.clear()
+        with trace("unobserved"):
+            pass
+        self.assertEqual(self.events, [])
+
+    def test_failing_hook(self):
+        """
+        A failing hook is logged without breaking the traced operation
+        """
+
+        def broken(event: TraceEvent) -> None:
+            raise RuntimeError("hook failure")
+
+        add_trace_hook(broken)
+        self.addCleanup(remove_trace_hook, broken)
+        with self.assertLogs("mactools", "ERROR"), trace("custom"):
+            pass
+        self.ended("custom")
+
+    def test_logging(self):
+        remove_trace_hook(self.events.append)
+        with self.assertLogs("mactools", "DEBUG") as logs, trace("custom"):
+            pass
+        self.assertEqual(
+            logs.output, ["DEBUG:mactools:custom start", "DEBUG:mactools:custom end"]
+        )
+        self.assertEqual(logs.records[1].mactools_event.phase, "end")
+
+    def test_library_events(self):
+        """
+        Downloads, CSV parses, remote look-ups and cache swaps are traced
+        """
+        csv_data = b"Registry,Assignment,Organization Name,Organization Address\nMA-L,246D5E,TEST,Street\n"
+        response = MagicMock(status=200, code=200)
+        response.read.return_value = csv_data
+        with TemporaryDirectory() as temp_dir:
+            with patch("mactools.update_ieee.urlopen") as mocked_urlopen:
+                mocked_urlopen.return_value.__enter__.return_value = response
+                self.assertTrue(run(get_csv_file("oui/oui", temp_dir, True)))
+            download = self.ended("download")
+            self.assertEqual(download.bytes, len(csv_data))
+            self.assertEqual(download.attributes["status"], 200)
+
+            parsed = process_ieee_csv(path.join(temp_dir, "oui.csv"))
+            self.assertEqual(len(next(iter(parsed.values()))), 1)
+            self.assertEqual(self.ended("csv_parse").attributes["records"], 1)
+
+        self.events.clear()
+        response.read.return_value = b'{"success": false}'
+        with patch(f"{OUI_CLASSES_PATH}.urlopen") as mocked_urlopen:
+            mocked_urlopen.return_value.__enter__.return_value = response
+            TEST_CACHE.get_record("00000A000001")
+        self.assertEqual(self.ended("remote_lookup").bytes, 18)
+
+        self.events.clear()
+        TEST_CACHE.swap_oui_dict(TEST_OUI_DICT)
+        self.assertEqual(self.ended("cache_swap").attributes["records"], 3)
+
+
+if __name__ == "__main__":
+    main()